@@ -42,11 +42,11 @@ extras_require = {
         "sphinx-tabs>=1.1,<1.2"
     ],
     "metrics": [
-        "snips_nlu_metrics>=0.14,<0.15",
+        "snips_nlu_metrics>=0.14.1,<0.15",
     ],
     "test": [
         "mock>=2.0,<3.0",
-        "snips_nlu_metrics>=0.14,<0.15",
+        "snips_nlu_metrics>=0.14.1,<0.15",
         "pylint>=1.8,<2.0",
         "coverage>=4.4.2,<5.0"
     ]
@@ -1,46 +1,59 @@
 from __future__ import print_function, unicode_literals
 
+# Module and function of each command, which are imported only when the
+# command is run in order to keep the CLI startup fast
+COMMANDS = {
+    "train": ("snips_nlu.cli.training", "train"),
+    "parse": ("snips_nlu.cli.inference", "parse"),
+    "parse-file": ("snips_nlu.cli.inference", "parse_file"),
+    "download": ("snips_nlu.cli.download", "download"),
+    "download-all-languages": ("snips_nlu.cli.download",
+                               "download_all_languages"),
+    "download-entity": ("snips_nlu.cli.download_entity",
+                        "download_builtin_entity"),
+    "download-language-entities": ("snips_nlu.cli.download_entity",
+                                   "download_language_builtin_entities"),
+    "version": ("snips_nlu.__about__", "__version__"),
+    "model-version": ("snips_nlu.__about__", "__model_version__"),
+    "link": ("snips_nlu.cli.link", "link"),
+    "generate-dataset": ("snips_nlu.cli.generate_dataset",
+                         "generate_dataset"),
+    "generate-synthetic-dataset": ("snips_nlu.cli.generate_dataset",
+                                   "generate_synthetic_data"),
+    "cross-val-metrics": ("snips_nlu.cli.metrics", "cross_val_metrics"),
+    "train-test-metrics": ("snips_nlu.cli.metrics", "train_test_metrics"),
+    "bench": ("snips_nlu.cli.bench", "bench"),
+    "bench-import": ("snips_nlu.cli.bench", "bench_import"),
+    "bench-training": ("snips_nlu.cli.bench_training", "bench_training"),
+    "serve": ("snips_nlu.cli.serve", "serve"),
+}
+
 
 def main():
+    import importlib
     import sys
 
-    import plac
+    if len(sys.argv) == 1 or sys.argv[1] not in COMMANDS:
+        from snips_nlu.cli.utils import PrettyPrintLevel, pretty_print
 
-    from snips_nlu.__about__ import __version__, __model_version__
-    from snips_nlu.cli import (
-        cross_val_metrics, download, download_all_languages, generate_dataset,
-        link, train_test_metrics)
-    from snips_nlu.cli.download_entity import (
-        download_builtin_entity, download_language_builtin_entities)
-    from snips_nlu.cli.inference import parse
-    from snips_nlu.cli.training import train
-    from snips_nlu.cli.utils import PrettyPrintLevel, pretty_print
-
-    commands = {
-        "train": train,
-        "parse": parse,
-        "download": download,
-        "download-all-languages": download_all_languages,
-        "download-entity": download_builtin_entity,
-        "download-language-entities": download_language_builtin_entities,
-        "version": lambda: print(__version__),
-        "model-version": lambda: print(__model_version__),
-        "link": link,
-        "generate-dataset": generate_dataset,
-        "cross-val-metrics": cross_val_metrics,
-        "train-test-metrics": train_test_metrics,
-    }
-    if len(sys.argv) == 1:
-        pretty_print(', '.join(commands), title="Available commands", exits=1,
+        if len(sys.argv) == 1:
+            pretty_print(', '.join(COMMANDS), title="Available commands",
+                         exits=1, level=PrettyPrintLevel.INFO)
+        pretty_print("Available: %s" % ', '.join(COMMANDS),
+                     title="Unknown command: %s" % sys.argv[1], exits=1,
                      level=PrettyPrintLevel.INFO)
+
     command = sys.argv.pop(1)
     sys.argv[0] = 'snips-nlu %s' % command
-    if command in commands:
-        plac.call(commands[command], sys.argv[1:])
-    else:
-        pretty_print("Available: %s" % ', '.join(commands),
-                     title="Unknown command: %s" % command, exits=1,
-                     level=PrettyPrintLevel.INFO)
+    module_name, attribute = COMMANDS[command]
+    target = getattr(importlib.import_module(module_name), attribute)
+    if not callable(target):  # version strings
+        print(target)
+        return
+
+    import plac
+
+    plac.call(target, sys.argv[1:])
 
 
 if __name__ == "__main__":
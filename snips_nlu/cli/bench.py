@@ -0,0 +1,364 @@
+from __future__ import division, print_function, unicode_literals
+
+import itertools
+import json
+import logging
+import platform
+import subprocess
+import sys
+from builtins import range
+from pathlib import Path
+from timeit import default_timer
+
+import numpy as np
+import plac
+from future.utils import iteritems, itervalues
+
+from snips_nlu import SnipsNLUEngine, load_resources
+from snips_nlu.__about__ import __model_version__, __version__
+from snips_nlu.cli.parallel import parse_in_parallel
+from snips_nlu.cli.utils import set_nlu_logger
+from snips_nlu.constants import (
+    DATA, ENTITY, INTENTS, LANGUAGE, SLOT_NAME, UTTERANCES)
+from snips_nlu.dataset import generate_synthetic_dataset, get_text_from_chunks
+from snips_nlu.instrumentation import HistogramRecorder, recording
+from snips_nlu.result import is_empty
+from snips_nlu.utils import json_string, temp_dir
+
+# Token which is never seen in training data, added to queries in order to
+# make them miss the deterministic intent parser
+UNKNOWN_TOKEN = "zxqvbn"
+
+_COLD_START_SCRIPT = """
+import json, sys, time
+start = time.time()
+from snips_nlu import SnipsNLUEngine
+imported = time.time()
+engine = SnipsNLUEngine.from_path(sys.argv[1])
+loaded = time.time()
+query = sys.argv[2]
+if isinstance(query, bytes):
+    query = query.decode("utf8")
+engine.parse(query)
+parsed = time.time()
+try:
+    import resource
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform != "darwin":
+        peak_rss *= 1024
+except ImportError:
+    peak_rss = None
+print(json.dumps({
+    "import_s": imported - start,
+    "loading_s": loaded - imported,
+    "first_parse_s": parsed - loaded,
+    "peak_rss_bytes": peak_rss
+}))
+"""
+
+_IMPORT_SCRIPT = """
+import json, sys, time
+start = time.time()
+__import__(sys.argv[1])
+imported = time.time()
+loaded_modules = set(name.split(".")[0] for name in sys.modules)
+print(json.dumps({
+    "import_s": imported - start,
+    "lazy_modules": sorted(loaded_modules.intersection(sys.argv[2:]))
+}))
+"""
+
+# Dependencies which are only needed for training, for loading datasets or
+# by some commands, and which are thus imported lazily
+LAZY_DEPENDENCIES = ["num2words", "pkg_resources", "requests", "scipy",
+                     "sklearn", "sklearn_crfsuite", "yaml"]
+
+
+@plac.annotations(
+    output_path=("Destination path for the json report", "option", "o", str),
+    config_path=("Path to a NLU engine config file", "option", "c", str),
+    training_path=("Path to a trained engine to benchmark instead of "
+                   "training one, which requires a single dataset",
+                   "option", "e", str),
+    synthetic_size=("Number of intents and entities of a synthetic dataset "
+                    "to add to the benchmarked datasets", "option", "s", int),
+    num_queries=("Maximum number of queries per query type", "option", "n",
+                 int),
+    num_runs=("Number of times each query is parsed", "option", "r", int),
+    jobs=("Number of processes used to measure the batch throughput",
+          "option", "j", int),
+    random_seed=("Seed used to generate the synthetic dataset and to sample "
+                 "queries", "option", "S", int),
+    verbose=("Print logs", "flag", "v"),
+    dataset_paths=("Paths to the datasets to benchmark", "positional", None,
+                   str),
+)
+def bench(output_path=None, config_path=None, training_path=None,
+          synthetic_size=0, num_queries=100, num_runs=5, jobs=1,
+          random_seed=42, verbose=False, *dataset_paths):
+    """Benchmark the training and parsing performances of NLU engines
+
+    For each dataset, an engine is trained and the following metrics are
+    reported: training time, cold start time and memory of a new process
+    loading the engine, parsing latency percentiles for several types of
+    queries, duration of each parsing stage and batch throughput.
+
+    Example:
+
+        snips-nlu bench -s 50 -o report.json sample_datasets/*.json
+    """
+    if verbose:
+        set_nlu_logger(logging.DEBUG)
+
+    config = None
+    if config_path is not None:
+        with Path(config_path).open("r", encoding="utf8") as f:
+            config = json.load(f)
+
+    datasets = []
+    for dataset_path in dataset_paths:
+        with Path(dataset_path).open("r", encoding="utf8") as f:
+            datasets.append((Path(dataset_path).stem, json.load(f)))
+    if synthetic_size:
+        dataset = generate_synthetic_dataset(
+            num_intents=synthetic_size, num_entities=synthetic_size,
+            random_seed=random_seed)
+        datasets.append(("synthetic_%s" % synthetic_size, dataset))
+    if not datasets:
+        raise ValueError("At least one dataset path or a synthetic dataset "
+                         "size must be provided")
+    if training_path is not None and len(datasets) != 1:
+        raise ValueError("A single dataset must be provided when "
+                         "benchmarking a trained engine")
+
+    report = {
+        "version": __version__,
+        "model_version": __model_version__,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "datasets": dict()
+    }
+    for name, dataset in datasets:
+        print("Benchmarking %s..." % name)
+        report["datasets"][name] = bench_dataset(
+            dataset, config, training_path, num_queries, num_runs, jobs,
+            random_seed)
+    report["peak_rss_bytes"] = get_peak_rss()
+
+    report_json = json_string(report)
+    if output_path is None:
+        print(report_json)
+    else:
+        with Path(output_path).open(mode="w", encoding="utf8") as f:
+            f.write(report_json)
+
+
+@plac.annotations(
+    output_path=("Destination path for the json report", "option", "o", str),
+    num_runs=("Number of new processes importing each module", "option", "r",
+              int),
+    modules=("Modules to import, which defaults to snips_nlu", "positional",
+             None, str),
+)
+def bench_import(output_path=None, num_runs=10, *modules):
+    """Benchmark the time needed to import snips_nlu modules
+
+    Each module is imported in *num_runs* new python processes, and the
+    minimum and median import times are reported along with the lazily
+    imported dependencies which have been imported nonetheless.
+
+    Example:
+
+        snips-nlu bench-import snips_nlu snips_nlu.cli
+    """
+    if not modules:
+        modules = ["snips_nlu"]
+    report = {
+        "version": __version__,
+        "python_version": platform.python_version(),
+        "modules": dict()
+    }
+    for module in modules:
+        import_times = []
+        lazy_modules = set()
+        for _ in range(num_runs):
+            output = subprocess.check_output(
+                [sys.executable, "-c", _IMPORT_SCRIPT, module]
+                + LAZY_DEPENDENCIES)
+            result = json.loads(output.decode("utf8").strip().splitlines()[-1])
+            import_times.append(result["import_s"])
+            lazy_modules.update(result["lazy_modules"])
+        report["modules"][module] = {
+            "min_s": min(import_times),
+            "median_s": float(np.median(import_times)),
+            "imported_lazy_dependencies": sorted(lazy_modules)
+        }
+
+    report_json = json_string(report)
+    if output_path is None:
+        print(report_json)
+    else:
+        with Path(output_path).open(mode="w", encoding="utf8") as f:
+            f.write(report_json)
+
+
+def bench_dataset(dataset, config=None, training_path=None, num_queries=100,
+                  num_runs=5, num_workers=1, random_seed=None):
+    """Benchmarks an engine on a single dataset and returns the results"""
+    load_resources(dataset[LANGUAGE])
+    results = dict()
+    if training_path is None:
+        start = default_timer()
+        engine = SnipsNLUEngine(config).fit(dataset)
+        results["training_time_s"] = default_timer() - start
+    else:
+        engine = SnipsNLUEngine.from_path(training_path)
+
+    queries = get_benchmark_queries(dataset, engine, num_queries, random_seed)
+    with temp_dir() as tmp_dir:
+        engine_path = tmp_dir / "engine"
+        engine.persist(engine_path)
+        # Queries of a type can all be missing, e.g. with an engine whose
+        # first intent parser is probabilistic
+        first_query = next(itertools.chain(
+            queries["deterministic"], queries["probabilistic"],
+            queries["slot_heavy"]), "")
+        results["cold_start"] = _measure_cold_start(engine_path, first_query)
+
+    recorder = HistogramRecorder()
+    latencies = dict()
+    with recording(recorder):
+        for query_type, texts in sorted(iteritems(queries)):
+            latencies[query_type] = _measure_latencies(engine, texts, num_runs)
+    results["latency"] = latencies
+    results["stages"] = recorder.summary()
+
+    all_texts = [text for texts in itervalues(queries) for text in texts]
+    _clear_caches(engine)
+    start = default_timer()
+    parse_in_parallel(engine, all_texts, num_workers)
+    duration = default_timer() - start
+    results["batch"] = {
+        "num_queries": len(all_texts),
+        "num_workers": num_workers,
+        "duration_s": duration,
+        "queries_per_s": len(all_texts) / duration if duration else None
+    }
+    return results
+
+
+def get_benchmark_queries(dataset, engine, num_queries=100,
+                          random_seed=None):
+    """Builds the queries used in the benchmark from the dataset utterances
+
+    Three types of queries are returned:
+
+    - 'deterministic': training utterances which are parsed by the first
+      intent parser of the engine, the deterministic intent parser with the
+      default configuration
+    - 'probabilistic': training utterances with an unknown token, which
+      makes them miss the first intent parser and go through the following
+      ones
+    - 'slot_heavy': the utterances having the most slots, with an unknown
+      token as well
+
+    Queries are checked against the first intent parser of *engine*, so that
+    each type of query actually goes through the expected parsers.
+    """
+    first_parser = engine.intent_parsers[0] if engine.intent_parsers else None
+
+    def is_parsed_by_first_parser(text):
+        return first_parser is not None \
+               and not is_empty(first_parser.parse(text))
+
+    utterances = [u for intent in itervalues(dataset[INTENTS])
+                  for u in intent[UTTERANCES]]
+    random_state = np.random.RandomState(random_seed)
+    texts = [get_text_from_chunks(utterances[i][DATA])
+             for i in random_state.permutation(len(utterances))]
+    slot_heavy_utterances = sorted(
+        utterances, key=lambda u: -sum(1 for chunk in u[DATA]
+                                       if ENTITY in chunk
+                                       and SLOT_NAME in chunk))
+    slot_heavy_texts = [get_text_from_chunks(u[DATA])
+                        for u in slot_heavy_utterances]
+    return {
+        "deterministic": _take(
+            (text for text in texts if is_parsed_by_first_parser(text)),
+            num_queries),
+        "probabilistic": _take(
+            (query for query in ("%s %s" % (UNKNOWN_TOKEN, text)
+                                 for text in texts)
+             if not is_parsed_by_first_parser(query)),
+            num_queries),
+        "slot_heavy": _take(
+            (query for query in ("%s %s" % (UNKNOWN_TOKEN, text)
+                                 for text in slot_heavy_texts)
+             if not is_parsed_by_first_parser(query)),
+            num_queries),
+    }
+
+
+def _take(iterable, size):
+    return list(itertools.islice(iterable, size))
+
+
+def get_peak_rss():
+    """Returns the peak resident set size of the current process in bytes,
+    or None when it cannot be measured on this platform"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is expressed in kilobytes on Linux and in bytes on macOS
+    if sys.platform == "darwin":
+        return peak_rss
+    return peak_rss * 1024
+
+
+def _measure_cold_start(engine_path, query):
+    start = default_timer()
+    output = subprocess.check_output(
+        [sys.executable, "-c", _COLD_START_SCRIPT, str(engine_path), query])
+    total_duration = default_timer() - start
+    results = json.loads(output.decode("utf8").strip().splitlines()[-1])
+    results["total_s"] = total_duration
+    return results
+
+
+def _measure_latencies(engine, texts, num_runs):
+    # The caches of the entity parsers are cleared before each query so that
+    # the latency of repeated queries is not underestimated
+    durations = []
+    for _ in range(num_runs):
+        for text in texts:
+            _clear_caches(engine)
+            start = default_timer()
+            engine.parse(text)
+            durations.append(default_timer() - start)
+    if not durations:
+        return {
+            "count": 0,
+            "mean_ms": None,
+            "p50_ms": None,
+            "p95_ms": None,
+            "p99_ms": None,
+            "max_ms": None,
+        }
+    durations_ms = np.array(durations) * 1000
+    p50, p95, p99 = np.percentile(durations_ms, [50, 95, 99])
+    return {
+        "count": len(durations),
+        "mean_ms": float(np.mean(durations_ms)),
+        "p50_ms": float(p50),
+        "p95_ms": float(p95),
+        "p99_ms": float(p99),
+        "max_ms": float(np.max(durations_ms)),
+    }
+
+
+def _clear_caches(engine):
+    for parser in (engine.builtin_entity_parser, engine.custom_entity_parser):
+        if parser is not None:
+            parser.clear_cache()
@@ -0,0 +1,247 @@
+from __future__ import division, print_function, unicode_literals
+
+import cProfile
+import itertools
+import json
+import logging
+from pathlib import Path
+from timeit import default_timer
+
+import plac
+from future.utils import iteritems
+
+from snips_nlu import SnipsNLUEngine, load_resources
+from snips_nlu.cli.bench import get_peak_rss
+from snips_nlu.cli.utils import set_nlu_logger
+from snips_nlu.constants import LANGUAGE
+from snips_nlu.dataset import generate_synthetic_dataset
+from snips_nlu.instrumentation import (
+    HistogramRecorder, TRAINING_STAGES, recording)
+from snips_nlu.utils import json_string, temp_dir
+
+try:
+    import tracemalloc
+except ImportError:  # python 2
+    tracemalloc = None
+
+
+@plac.annotations(
+    output_path=("Destination path for the json report", "option", "o", str),
+    config_path=("Path to a NLU engine config file", "option", "c", str),
+    num_intents=("Comma separated numbers of intents", "option", "i", str),
+    utterances_per_intent=("Comma separated numbers of utterances per intent",
+                           "option", "u", str),
+    num_entities=("Comma separated numbers of custom entities", "option", "E",
+                  str),
+    values_per_entity=("Comma separated numbers of values per entity",
+                       "option", "e", str),
+    slots_per_utterance=("Comma separated numbers of slots per utterance",
+                         "option", "s", str),
+    profile_dir=("Directory where the cProfile statistics of each training "
+                 "phase are dumped", "option", "p", str),
+    trace_memory=("Trace the memory allocations of each training phase",
+                  "flag", "m"),
+    random_seed=("Seed used to generate the synthetic datasets", "option",
+                 "S", int),
+    verbose=("Print logs", "flag", "v"),
+)
+def bench_training(output_path=None, config_path=None, num_intents="10",
+                   utterances_per_intent="50", num_entities="5",
+                   values_per_entity="100", slots_per_utterance="2",
+                   profile_dir=None, trace_memory=False, random_seed=42,
+                   verbose=False):
+    """Benchmark the training of NLU engines on synthetic datasets of
+    increasing sizes
+
+    An engine is trained and persisted for each combination of the provided
+    dataset sizes, and the duration of each training phase is reported. The
+    phases can also be profiled with cProfile and their memory allocations
+    traced with tracemalloc.
+
+    Example:
+
+        snips-nlu bench-training -i 10,50,100 -e 100,10000 -o report.json
+    """
+    if verbose:
+        set_nlu_logger(logging.DEBUG)
+    if trace_memory and tracemalloc is None:
+        raise ValueError("Memory tracing requires python 3")
+
+    config = None
+    if config_path is not None:
+        with Path(config_path).open("r", encoding="utf8") as f:
+            config = json.load(f)
+
+    sizes = [_parse_sizes(num_intents), _parse_sizes(utterances_per_intent),
+             _parse_sizes(num_entities), _parse_sizes(values_per_entity),
+             _parse_sizes(slots_per_utterance)]
+    report = {"runs": []}
+    for intents, utterances, entities, values, slots in itertools.product(
+            *sizes):
+        parameters = {
+            "num_intents": intents,
+            "utterances_per_intent": utterances,
+            "num_entities": entities,
+            "values_per_entity": values,
+            "slots_per_utterance": slots
+        }
+        run_name = "i%s_u%s_E%s_e%s_s%s" % (
+            intents, utterances, entities, values, slots)
+        print("Benchmarking training on %s..." % run_name)
+        dataset = generate_synthetic_dataset(
+            num_intents=intents, utterances_per_intent=utterances,
+            num_entities=entities, values_per_entity=values,
+            slots_per_utterance=slots, random_seed=random_seed)
+        run_profile_dir = None
+        if profile_dir is not None:
+            run_profile_dir = Path(profile_dir) / run_name
+        results = bench_training_dataset(
+            dataset, config, run_profile_dir, trace_memory)
+        results["name"] = run_name
+        results["parameters"] = parameters
+        report["runs"].append(results)
+    report["peak_rss_bytes"] = get_peak_rss()
+
+    report_json = json_string(report)
+    if output_path is None:
+        print(report_json)
+    else:
+        with Path(output_path).open(mode="w", encoding="utf8") as f:
+            f.write(report_json)
+
+
+def bench_training_dataset(dataset, config=None, profile_dir=None,
+                           trace_memory=False):
+    """Trains and persists an engine on *dataset* and returns the duration of
+    each training phase
+
+    Note that the builtin entity parsers and the string variations are cached
+    at the process level, and are thus only computed by the first benchmark
+    of a process.
+    """
+    load_resources(dataset[LANGUAGE])
+    profiler = TrainingProfiler(profile=profile_dir is not None,
+                                trace_memory=trace_memory)
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    try:
+        with recording(profiler):
+            start = default_timer()
+            engine = SnipsNLUEngine(config).fit(dataset)
+            training_time = default_timer() - start
+            with temp_dir() as tmp_dir:
+                start = default_timer()
+                engine.persist(tmp_dir / "engine")
+                persisting_time = default_timer() - start
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+
+    results = {
+        "training_time_s": training_time,
+        "persisting_time_s": persisting_time,
+        "stages": profiler.summary()
+    }
+    if trace_memory:
+        results["memory"] = profiler.memory
+    if profile_dir is not None:
+        results["profiles"] = profiler.dump_profiles(profile_dir)
+    return results
+
+
+class TrainingProfiler(HistogramRecorder):
+    """Recorder which, on top of timing the stages, profiles the training
+    phases with cProfile and traces their memory allocations
+
+    The profiling statistics and allocations of a phase are accumulated over
+    all its occurrences. A phase running within another phase is only
+    accounted as part of the outermost one, as a single profiler can be
+    active at a time.
+    """
+
+    def __init__(self, profile=False, trace_memory=False,
+                 profiled_stages=TRAINING_STAGES, num_allocations=10):
+        super(TrainingProfiler, self).__init__()
+        self.profile = profile
+        self.trace_memory = trace_memory
+        self.profiled_stages = set(profiled_stages)
+        self.num_allocations = num_allocations
+        self.profiles = dict()
+        self.memory = dict()
+        self._active_stages = []
+        self._memory_start = None
+
+    def enter_stage(self, stage):
+        if stage not in self.profiled_stages:
+            return
+        self._active_stages.append(stage)
+        if len(self._active_stages) > 1:
+            return
+        if self.profile:
+            if stage not in self.profiles:
+                self.profiles[stage] = cProfile.Profile()
+            self.profiles[stage].enable()
+        if self.trace_memory:
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+            self._memory_start = tracemalloc.get_traced_memory()[0]
+
+    def exit_stage(self, stage):
+        if stage not in self.profiled_stages:
+            return
+        self._active_stages.pop()
+        if self._active_stages:
+            return
+        if self.profile:
+            self.profiles[stage].disable()
+        if self.trace_memory:
+            self._record_memory(stage)
+
+    def dump_profiles(self, directory):
+        """Dumps the statistics of each profiled phase in a *<phase>.prof*
+        file, which can be loaded with :mod:`pstats`, and returns their
+        paths"""
+        directory = Path(directory)
+        if not directory.exists():
+            directory.mkdir(parents=True)
+        paths = dict()
+        for stage, profile in sorted(iteritems(self.profiles)):
+            path = directory / ("%s.prof" % stage)
+            profile.dump_stats(str(path))
+            paths[stage] = str(path)
+        return paths
+
+    def _record_memory(self, stage):
+        current, peak = tracemalloc.get_traced_memory()
+        stage_memory = self.memory.get(stage)
+        if stage_memory is None:
+            stage_memory = {"retained_bytes": 0, "peak_bytes": 0}
+            self.memory[stage] = stage_memory
+        stage_memory["retained_bytes"] += current - self._memory_start
+        if not hasattr(tracemalloc, "reset_peak"):
+            # The peak can not be attributed to the phase
+            return
+        peak_increase = peak - self._memory_start
+        if peak_increase > stage_memory["peak_bytes"]:
+            stage_memory["peak_bytes"] = peak_increase
+            stage_memory["top_allocations"] = self._get_top_allocations()
+
+    def _get_top_allocations(self):
+        # Largest memory blocks which are still allocated at the end of the
+        # phase
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)])
+        return [
+            {
+                "location": "%s:%s" % (stat.traceback[0].filename,
+                                       stat.traceback[0].lineno),
+                "size_bytes": stat.size,
+                "count": stat.count
+            }
+            for stat in snapshot.statistics("lineno")[:self.num_allocations]
+        ]
+
+
+def _parse_sizes(sizes):
+    return [int(size) for size in str(sizes).split(",") if size.strip()]
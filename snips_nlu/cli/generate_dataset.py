@@ -1,10 +1,12 @@
 from __future__ import print_function, unicode_literals
 
 import json
+from pathlib import Path
 
 import plac
 
-from snips_nlu.dataset import Dataset
+from snips_nlu.dataset import Dataset, SyntheticDatasetGenerator
+from snips_nlu.utils import json_string
 
 
 @plac.annotations(
@@ -18,3 +20,59 @@ def generate_dataset(language, *files):
     else:
         dataset = Dataset.from_files(language, list(files))
     print(json.dumps(dataset.json, indent=2, sort_keys=True))
+
+
+@plac.annotations(
+    output_path=("Destination path for the dataset, which is printed when "
+                 "omitted", "option", "o", str),
+    workload_path=("Destination path for a json lines file of labeled "
+                   "queries", "option", "w", str),
+    num_queries=("Number of queries of the workload", "option", "q", int),
+    num_intents=("Number of intents", "option", "i", int),
+    utterances_per_intent=("Number of utterances per intent", "option", "u",
+                           int),
+    num_entities=("Number of custom entities", "option", "E", int),
+    values_per_entity=("Number of values per entity", "option", "e", int),
+    synonyms_per_value=("Number of synonyms per entity value", "option", "y",
+                        int),
+    slots_per_utterance=("Number of custom slots per utterance", "option",
+                         "s", int),
+    builtin_slot_density=("Ratio of utterances having a builtin slot",
+                          "option", "b", float),
+    language=("Language of the assistant", "option", "l", str),
+    random_seed=("Seed making the generation reproducible", "option", "S",
+                 int),
+)
+def generate_synthetic_data(output_path=None, workload_path=None,
+                            num_queries=1000, num_intents=10,
+                            utterances_per_intent=50, num_entities=5,
+                            values_per_entity=100, synonyms_per_value=0,
+                            slots_per_utterance=2, builtin_slot_density=0.0,
+                            language="en", random_seed=None):
+    """Generate a synthetic Snips NLU dataset of arbitrary size, and
+    optionally a workload of labeled queries
+
+    Example:
+
+        snips-nlu generate-synthetic-dataset -i 500 -e 1000000 \
+            -o dataset.json -w queries.jsonl
+    """
+    generator = SyntheticDatasetGenerator(
+        num_intents=num_intents, utterances_per_intent=utterances_per_intent,
+        num_entities=num_entities, values_per_entity=values_per_entity,
+        synonyms_per_value=synonyms_per_value,
+        slots_per_utterance=slots_per_utterance,
+        builtin_slot_density=builtin_slot_density, language=language,
+        random_seed=random_seed)
+    dataset_json = json_string(generator.generate_dataset().json)
+    if output_path is None:
+        print(dataset_json)
+    else:
+        with Path(output_path).open(mode="w", encoding="utf8") as f:
+            f.write(dataset_json)
+
+    if workload_path is not None:
+        with Path(workload_path).open(mode="w", encoding="utf8") as f:
+            for query in generator.generate_queries(num_queries):
+                f.write(json_string(query, indent=None))
+                f.write("\n")
@@ -1,14 +1,21 @@
-from __future__ import unicode_literals, print_function
+from __future__ import division, print_function, unicode_literals
 
+import io
 import json
 import logging
-
-from builtins import input
+import sys
+from builtins import input, str
+from itertools import islice
+from timeit import default_timer
 
 import plac
 
 from snips_nlu import SnipsNLUEngine
+from snips_nlu.cli.parallel import iter_parse_in_parallel
 from snips_nlu.cli.utils import set_nlu_logger
+from snips_nlu.constants import RES_INPUT
+from snips_nlu.preloading import preload_for_fork
+from snips_nlu.utils import json_string
 
 
 @plac.annotations(
@@ -40,3 +47,100 @@ def print_parsing_result(engine, query):
         query = query.decode("utf8")
     json_dump = json.dumps(engine.parse(query), sort_keys=True, indent=2)
     print(json_dump)
+
+
+@plac.annotations(
+    training_path=("Path to a trained engine", "positional", None, str),
+    input_path=("Path to the file of queries to parse, or '-' to read them "
+                "from the standard input", "positional", None, str),
+    output_path=("Path to the json lines file of parsing results. Results "
+                 "are written to the standard output by default", "option",
+                 "o", str),
+    input_format=("Format of the queries file, either 'text', with one query "
+                  "per line, or 'jsonl'. Defaults to 'jsonl' for files with "
+                  "a .jsonl extension, and to 'text' otherwise", "option",
+                  "f", str),
+    num_workers=("Number of forked worker processes", "option", "w", int),
+    batch_size=("Number of queries sent at once to a worker", "option", "b",
+                int),
+    report_interval=("Minimum duration, in seconds, between two throughput "
+                     "reports printed on the standard error", "option", "r",
+                     float),
+    verbose=("Print logs", "flag", "v"),
+)
+def parse_file(training_path, input_path, output_path=None, input_format=None,
+               num_workers=1, batch_size=256, report_interval=10.0,
+               verbose=False):
+    """Parse a file of queries with a trained NLU engine, and stream the
+    parsing results as json lines in the same order as the queries
+
+    In the 'jsonl' format, each line is either a json string or a json object
+    with an "input" text and an optional "intents" list restricting the
+    parsing scope, such as the workloads of the generate-synthetic-dataset
+    command. Queries are read and parsed lazily, so that the memory usage
+    does not depend on the size of the file.
+    """
+    if verbose:
+        set_nlu_logger(logging.DEBUG)
+    if input_format is None:
+        input_format = "jsonl" if input_path.endswith(".jsonl") else "text"
+    if input_format not in ("text", "jsonl"):
+        raise ValueError("Unknown input format: '%s'" % input_format)
+
+    engine = SnipsNLUEngine.from_path(training_path)
+    if num_workers > 1:
+        preload_for_fork(engine)
+
+    input_file = _open_text_file(input_path, sys.stdin, "r")
+    output_file = _open_text_file(output_path, sys.stdout, "w")
+    queries = _read_queries(input_file, input_format)
+    batches = iter(lambda: list(islice(queries, batch_size)), [])
+    num_parsed = 0
+    start = last_report = default_timer()
+    try:
+        for results in iter_parse_in_parallel(engine, batches, num_workers):
+            for result in results:
+                output_file.write(json_string(result, indent=None))
+                output_file.write("\n")
+            num_parsed += len(results)
+            now = default_timer()
+            if now - last_report >= report_interval:
+                last_report = now
+                _report_throughput(num_parsed, now - start)
+    finally:
+        output_file.close()
+        input_file.close()
+    _report_throughput(num_parsed, default_timer() - start)
+
+
+def _open_text_file(path, std_stream, mode):
+    if path is None or path == "-":
+        return io.open(std_stream.fileno(), mode, encoding="utf8",
+                       closefd=False)
+    return io.open(path, mode, encoding="utf8")
+
+
+def _read_queries(lines, input_format):
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if input_format == "text":
+            yield line, None
+            continue
+        if not line.strip():
+            continue
+        query = json.loads(line)
+        if isinstance(query, str):
+            yield query, None
+            continue
+        intents = query.get("intents")
+        if isinstance(intents, str):
+            intents = [intents]
+        if intents is not None:
+            intents = tuple(intents)
+        yield query[RES_INPUT], intents
+
+
+def _report_throughput(num_parsed, elapsed_time):
+    throughput = num_parsed / elapsed_time if elapsed_time > 0 else 0.0
+    print("Parsed %s queries in %.1fs (%.1f queries/s)"
+          % (num_parsed, elapsed_time, throughput), file=sys.stderr)
@@ -2,32 +2,85 @@ from __future__ import print_function, unicode_literals
 
 import json
 import logging
-
+from functools import partial
 from pathlib import Path
+from timeit import default_timer
 
 import plac
+from future.utils import itervalues
 
 from snips_nlu import SnipsNLUEngine, load_resources
+from snips_nlu.cli.parallel import parse_in_parallel
 from snips_nlu.cli.utils import set_nlu_logger
+from snips_nlu.constants import DATA, INTENTS, TEXT, UTTERANCES
+from snips_nlu.training_cache import enable_training_cache
 from snips_nlu.utils import json_string
 
 
-def make_engine_cls(config):
-    from snips_nlu_metrics import Engine
+class ConfigEngine(object):
+    """Engine wrapper which trains a :class:`.SnipsNLUEngine` with a specific
+    config
+
+    It is defined at the module level so that it can be pickled and sent to
+    the worker processes of the metrics computation.
+    """
+
+    def __init__(self, config=None):
+        self.engine = None
+        self.config = config
+
+    def fit(self, dataset):
+        self.engine = SnipsNLUEngine(self.config).fit(dataset)
+        return self
+
+    def parse(self, text):
+        return self.engine.parse(text)
+
+
+class BatchEngine(ConfigEngine):
+    """Engine wrapper which parses all the provided texts in a batch right
+    after training
 
-    class ConfigEngine(Engine):
-        def __init__(self):
-            self.engine = None
-            self.config = config
+    The parsing results are then looked up when the metrics computation calls
+    :meth:`parse`. Training and inference durations are stored in *timings*.
+    """
 
-        def fit(self, dataset):
-            self.engine = SnipsNLUEngine(self.config).fit(dataset)
-            return self
+    def __init__(self, config=None, texts=None, timings=None, num_workers=1):
+        super(BatchEngine, self).__init__(config)
+        self.texts = texts if texts is not None else []
+        self.timings = timings if timings is not None else dict()
+        self.num_workers = num_workers
+        self.results = dict()
 
-        def parse(self, text):
-            return self.engine.parse(text)
+    def fit(self, dataset):
+        start = default_timer()
+        super(BatchEngine, self).fit(dataset)
+        self.timings["training"] = default_timer() - start
 
-    return ConfigEngine
+        start = default_timer()
+        texts = sorted(set(self.texts))
+        results = parse_in_parallel(self.engine, texts, self.num_workers)
+        self.results = dict(zip(texts, results))
+        self.timings["inference"] = default_timer() - start
+        return self
+
+    def parse(self, text):
+        result = self.results.get(text)
+        if result is None:
+            result = self.engine.parse(text)
+        return result
+
+
+def make_engine_cls(config):
+    return partial(ConfigEngine, config)
+
+
+def _get_utterances_texts(dataset):
+    return [
+        "".join(chunk[TEXT] for chunk in utterance[DATA])
+        for intent in itervalues(dataset[INTENTS])
+        for utterance in intent[UTTERANCES]
+    ]
 
 
 @plac.annotations(
@@ -42,13 +95,22 @@ def make_engine_cls(config):
     exclude_slot_metrics=("Exclude slot metrics and slot errors in the output",
                           "flag", "s", bool),
     include_errors=("Include parsing errors in the output", "flag", "i", bool),
+    cache_dir=("Directory in which intermediate training artifacts are "
+               "cached", "option", "C", str),
+    jobs=("Number of folds to train and evaluate in parallel, in separate "
+          "processes", "option", "j", int),
+    random_seed=("Seed used to split the dataset in folds", "option", "S",
+                 int),
     verbose=("Print logs", "flag", "v"),
 )
 def cross_val_metrics(dataset_path, output_path, config_path=None, nb_folds=5,
                       train_size_ratio=1.0, exclude_slot_metrics=False,
-                      include_errors=False, verbose=False):
+                      include_errors=False, cache_dir=None, jobs=1,
+                      random_seed=None, verbose=False):
     if verbose:
         set_nlu_logger(logging.DEBUG)
+    if cache_dir is not None:
+        enable_training_cache(cache_dir)
 
     def progression_handler(progress):
         print("%d%%" % int(progress * 100))
@@ -67,8 +129,12 @@ def cross_val_metrics(dataset_path, output_path, config_path=None, nb_folds=5,
         nb_folds=nb_folds,
         train_size_ratio=train_size_ratio,
         include_slot_metrics=not exclude_slot_metrics,
+        num_workers=jobs,
+        seed=random_seed,
     )
 
+    # Resources are loaded before the worker processes are forked so that
+    # they are shared with them
     with Path(dataset_path).open("r", encoding="utf8") as f:
         load_resources(json.load(f)["language"])
 
@@ -93,17 +159,34 @@ def cross_val_metrics(dataset_path, output_path, config_path=None, nb_folds=5,
     exclude_slot_metrics=("Exclude slot metrics and slot errors in the output",
                           "flag", "s", bool),
     include_errors=("Include parsing errors in the output", "flag", "i", bool),
+    cache_dir=("Directory in which intermediate training artifacts are "
+               "cached", "option", "C", str),
+    batch=("Parse all the test utterances in a batch after training, and "
+           "output the duration of each stage", "flag", "b", bool),
+    jobs=("Number of processes used to parse the test utterances in batch "
+          "mode", "option", "j", int),
     verbose=("Print logs", "flag", "v"),
 )
 def train_test_metrics(train_dataset_path, test_dataset_path, output_path,
                        config_path=None, exclude_slot_metrics=False,
-                       include_errors=False, verbose=False):
+                       include_errors=False, cache_dir=None, batch=False,
+                       jobs=1, verbose=False):
     if verbose:
         set_nlu_logger(logging.DEBUG)
+    if cache_dir is not None:
+        enable_training_cache(cache_dir)
 
+    config = None
     if config_path is not None:
         with Path(config_path).open("r", encoding="utf-8") as f:
             config = json.load(f)
+
+    timings = dict()
+    if batch:
+        with Path(test_dataset_path).open("r", encoding="utf8") as f:
+            test_texts = _get_utterances_texts(json.load(f))
+        engine_cls = partial(BatchEngine, config, test_texts, timings, jobs)
+    elif config is not None:
         engine_cls = make_engine_cls(config)
     else:
         engine_cls = SnipsNLUEngine
@@ -120,7 +203,13 @@ def train_test_metrics(train_dataset_path, test_dataset_path, output_path,
 
     from snips_nlu_metrics import compute_train_test_metrics
 
+    start = default_timer()
     metrics = compute_train_test_metrics(**metrics_args)
+    if batch:
+        timings["total"] = default_timer() - start
+        timings["metrics"] = timings["total"] - timings["training"] \
+                             - timings["inference"]
+        metrics["timings"] = timings
     if not include_errors:
         metrics.pop("parsing_errors")
 
@@ -0,0 +1,104 @@
+from __future__ import unicode_literals
+
+import multiprocessing
+import os
+from builtins import range
+from collections import OrderedDict, deque
+
+from future.utils import iteritems
+
+# Engine used by the worker processes. It is set in the parent process right
+# before the workers are forked, so that it does not need to be pickled.
+_ENGINE = None
+
+
+def parse_in_parallel(engine, texts, num_workers=1, chunk_size=100):
+    """Parses *texts* with *engine*, using *num_workers* forked processes
+
+    Results are returned in the same order as *texts*. When a single worker is
+    requested, or when the platform does not support forking, texts are parsed
+    in the current process.
+    """
+    texts = list(texts)
+    if num_workers <= 1 or not hasattr(os, "fork") or len(texts) <= 1:
+        return engine.parse_batch(texts)
+
+    global _ENGINE  # pylint:disable=global-statement
+    _ENGINE = engine
+    try:
+        pool = _get_fork_context().Pool(num_workers)
+        try:
+            chunks = [texts[i:i + chunk_size]
+                      for i in range(0, len(texts), chunk_size)]
+            results = pool.map(_parse_chunk, chunks)
+        finally:
+            pool.close()
+            pool.join()
+    finally:
+        _ENGINE = None
+    return [result for chunk_results in results for result in chunk_results]
+
+
+def iter_parse_in_parallel(engine, batches, num_workers=1,
+                           max_pending_batches=None):
+    """Parses lazily each batch of *batches*, using *num_workers* forked
+    processes, and yields the results of each batch in the input order
+
+    Each batch is a list of ``(text, intents)`` queries, where *intents* is
+    either None or a tuple of intents restricting the parsing scope. At most
+    *max_pending_batches* batches, which defaults to twice the number of
+    workers, are read ahead of the batch being yielded, so that memory stays
+    bounded whatever the number of batches.
+    """
+    if num_workers <= 1 or not hasattr(os, "fork"):
+        for batch in batches:
+            yield _parse_queries(engine, batch)
+        return
+
+    if max_pending_batches is None:
+        max_pending_batches = 2 * num_workers
+    global _ENGINE  # pylint:disable=global-statement
+    _ENGINE = engine
+    try:
+        pool = _get_fork_context().Pool(num_workers)
+        try:
+            pending_batches = deque()
+            for batch in batches:
+                pending_batches.append(
+                    pool.apply_async(_parse_queries_chunk, (batch,)))
+                if len(pending_batches) >= max_pending_batches:
+                    yield pending_batches.popleft().get()
+            while pending_batches:
+                yield pending_batches.popleft().get()
+        finally:
+            pool.terminate()
+            pool.join()
+    finally:
+        _ENGINE = None
+
+
+def _parse_chunk(texts):
+    return _ENGINE.parse_batch(texts)
+
+
+def _parse_queries_chunk(queries):
+    return _parse_queries(_ENGINE, queries)
+
+
+def _parse_queries(engine, queries):
+    results = [None] * len(queries)
+    indices_by_scope = OrderedDict()
+    for i, (_, intents) in enumerate(queries):
+        indices_by_scope.setdefault(intents, []).append(i)
+    for intents, indices in iteritems(indices_by_scope):
+        texts = [queries[i][0] for i in indices]
+        scope = list(intents) if intents is not None else None
+        for i, result in zip(indices, engine.parse_batch(texts, scope)):
+            results[i] = result
+    return results
+
+
+def _get_fork_context():
+    if hasattr(multiprocessing, "get_context"):
+        return multiprocessing.get_context("fork")
+    return multiprocessing
@@ -0,0 +1,376 @@
+from __future__ import division, print_function, unicode_literals
+
+import errno
+import json
+import logging
+import os
+import signal
+import threading
+from builtins import object, range, str
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from queue import Empty, Full, Queue
+from socketserver import ThreadingMixIn
+from timeit import default_timer
+
+import plac
+from future.utils import iteritems
+
+from snips_nlu import SnipsNLUEngine
+from snips_nlu.__about__ import __version__
+from snips_nlu.cli.utils import set_nlu_logger
+from snips_nlu.instrumentation import (
+    HistogramRecorder, perf_counter_ns, set_recorder)
+from snips_nlu.preloading import preload_for_fork
+from snips_nlu.utils import json_string
+
+logger = logging.getLogger(__name__)
+
+# Duration of the whole handling of an HTTP request, including queuing
+REQUEST_HANDLING = "request_handling"
+
+# Upper bound, in seconds, of the expected parsing duration of a batch, used
+# to derive the duration after which a queued request is given up
+BATCH_PARSING_BUDGET = 0.1
+
+
+@plac.annotations(
+    engine_path=("Path to a trained engine", "positional", None, str),
+    host=("Host on which the server listens", "option", "H", str),
+    port=("Port on which the server listens", "option", "p", int),
+    workers=("Number of forked worker processes", "option", "w", int),
+    batch_window=("Maximum duration, in milliseconds, during which requests "
+                  "are gathered in a batch", "option", "b", float),
+    max_batch_size=("Maximum number of texts parsed in a batch", "option",
+                    "m", int),
+    max_queue_size=("Maximum number of requests queued in a worker, above "
+                    "which requests are rejected", "option", "q", int),
+    verbose=("Print logs", "flag", "v"),
+)
+def serve(engine_path, host="127.0.0.1", port=8080, workers=1,
+          batch_window=2.0, max_batch_size=32, max_queue_size=256,
+          verbose=False):
+    """Serve a trained NLU engine over HTTP
+
+    The engine is loaded once, fully preloaded with
+    :func:`.preload_for_fork`, and shared by the forked workers. The
+    following endpoints are exposed:
+
+    - POST /parse, with a json body such as {"text": "...", "intents": [...]}
+    - POST /parse_batch, with a json body such as {"texts": ["...", ...]}
+    - GET /metrics, which returns the latency of each parsing stage, the
+      hit rates of the entity parsers caches and the requests counters of the
+      worker handling the request
+    """
+    if verbose:
+        set_nlu_logger(logging.DEBUG)
+
+    engine = SnipsNLUEngine.from_path(engine_path)
+    server = ParsingServer((host, port), engine, batch_window / 1000,
+                           max_batch_size, max_queue_size)
+    print("Serving %s on http://%s:%s with %s worker(s)"
+          % (engine_path, host, server.server_address[1], workers))
+    try:
+        if workers <= 1 or not hasattr(os, "fork"):
+            server.serve_forever()
+        else:
+            preload_for_fork(engine)
+            _run_workers(server, workers)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+class ParsingServer(ThreadingMixIn, HTTPServer):
+    """Multi-threaded HTTP server parsing the requests with a
+    :class:`.ParsingBatcher`
+
+    The server socket is bound on creation, so that the server can be shared
+    by several forked processes calling :meth:`serve_forever`.
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, server_address, engine, batch_window=0.002,
+                 max_batch_size=32, max_queue_size=256):
+        HTTPServer.__init__(self, server_address, _ParsingRequestHandler)
+        self.engine = engine
+        self.batcher = ParsingBatcher(engine, batch_window, max_batch_size,
+                                      max_queue_size)
+        self.recorder = HistogramRecorder()
+        self.counters = {"parse": 0, "parse_batch": 0, "shed": 0,
+                         "timeouts": 0, "errors": 0}
+        self._counters_lock = threading.Lock()
+
+    def serve_forever(self, poll_interval=0.5):
+        # Threads do not survive forks, hence the batcher is started in the
+        # serving process
+        set_recorder(self.recorder)
+        self.batcher.start()
+        HTTPServer.serve_forever(self, poll_interval)
+
+    def increment(self, counter):
+        with self._counters_lock:
+            self.counters[counter] += 1
+
+    def get_metrics(self):
+        with self._counters_lock:
+            counters = dict(self.counters)
+        caches = dict()
+        parsers = [
+            ("builtin_entity_parser", self.engine.builtin_entity_parser),
+            ("custom_entity_parser", self.engine.custom_entity_parser)
+        ]
+        for name, parser in parsers:
+            if parser is None:
+                continue
+            num_lookups = parser.cache_hits + parser.cache_misses
+            caches[name] = {
+                "hits": parser.cache_hits,
+                "misses": parser.cache_misses,
+                "hit_rate": parser.cache_hits / num_lookups
+                if num_lookups else None
+            }
+        return {
+            "worker_pid": os.getpid(),
+            "requests": counters,
+            "queue": {
+                "size": self.batcher.queue.qsize(),
+                "max_size": self.batcher.queue.maxsize
+            },
+            "batches": {
+                "count": self.batcher.num_batches,
+                "texts": self.batcher.num_texts
+            },
+            "stages": self.recorder.summary(),
+            "caches": caches
+        }
+
+
+class ParsingBatcher(object):
+    """Parses queued requests in micro-batches, in a background thread
+
+    Requests are gathered until *max_batch_size* texts are queued or
+    *batch_window* seconds have elapsed since the first one, and are then
+    parsed with :meth:`.SnipsNLUEngine.parse_batch`, which parses identical
+    texts only once. Requests are rejected with :class:`queue.Full` when
+    *max_queue_size* requests are already waiting.
+
+    The *request_timeout*, in seconds, is the duration after which waiting
+    for the results of a request is given up. It defaults to the time needed
+    to parse a full queue, with one batch per queued request.
+    """
+
+    def __init__(self, engine, batch_window=0.002, max_batch_size=32,
+                 max_queue_size=256, request_timeout=None):
+        self.engine = engine
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        if request_timeout is None:
+            request_timeout = (max_queue_size + 1) * (
+                batch_window + BATCH_PARSING_BUDGET)
+        self.request_timeout = request_timeout
+        self.queue = Queue(maxsize=max_queue_size)
+        self.num_batches = 0
+        self.num_texts = 0
+        self._thread = None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def submit(self, texts, intents=None):
+        """Queues the parsing of *texts* and returns a
+        :class:`.ParsingRequest` which can be waited on
+
+        Raises:
+            queue.Full: When too many requests are already queued
+        """
+        request = ParsingRequest(texts, intents)
+        self.queue.put_nowait(request)
+        return request
+
+    def _run(self):
+        while True:
+            requests = [self.queue.get()]
+            num_texts = len(requests[0].texts)
+            deadline = default_timer() + self.batch_window
+            while num_texts < self.max_batch_size:
+                timeout = deadline - default_timer()
+                if timeout <= 0:
+                    break
+                try:
+                    request = self.queue.get(timeout=timeout)
+                except Empty:
+                    break
+                requests.append(request)
+                num_texts += len(request.texts)
+            self._parse_batch(requests)
+
+    def _parse_batch(self, requests):
+        requests_by_scope = OrderedDict()
+        for request in requests:
+            requests_by_scope.setdefault(request.scope, []).append(request)
+        for scope, scope_requests in iteritems(requests_by_scope):
+            texts = [text for request in scope_requests
+                     for text in request.texts]
+            intents = list(scope) if scope is not None else None
+            try:
+                results = self.engine.parse_batch(texts, intents)
+            except Exception as e:  # pylint:disable=broad-except
+                logger.exception("Error while parsing a batch")
+                for request in scope_requests:
+                    request.set_error(e)
+                continue
+            self.num_batches += 1
+            self.num_texts += len(texts)
+            start = 0
+            for request in scope_requests:
+                end = start + len(request.texts)
+                request.set_results(results[start:end])
+                start = end
+
+
+class ParsingRequest(object):
+    """Texts to parse with a given intents scope, along with their parsing
+    results once available"""
+
+    def __init__(self, texts, intents=None):
+        self.texts = texts
+        if isinstance(intents, str):
+            intents = [intents]
+        self.scope = tuple(sorted(set(intents))) \
+            if intents is not None else None
+        self.results = None
+        self.error = None
+        self._done = threading.Event()
+
+    def set_results(self, results):
+        self.results = results
+        self._done.set()
+
+    def set_error(self, error):
+        self.error = error
+        self._done.set()
+
+    def wait(self, timeout=None):
+        """Waits for the results and returns True if they are available"""
+        return self._done.wait(timeout)
+
+
+class _ParsingRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "snips-nlu/%s" % __version__
+
+    def do_GET(self):  # pylint:disable=invalid-name
+        if self.path != "/metrics":
+            self._send_json(404, {"error": "Not found: %s" % self.path})
+            return
+        self._send_json(200, self.server.get_metrics())
+
+    def do_POST(self):  # pylint:disable=invalid-name
+        start = perf_counter_ns()
+        if self.path not in ("/parse", "/parse_batch"):
+            self._send_json(404, {"error": "Not found: %s" % self.path})
+            return
+        try:
+            content_length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(content_length).decode("utf8"))
+            if self.path == "/parse":
+                texts = [body["text"]]
+            else:
+                texts = body["texts"]
+            intents = body.get("intents")
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            self._send_json(400, {"error": "Invalid request: %s" % e})
+            return
+        if not isinstance(texts, list) \
+                or not all(isinstance(text, str) for text in texts):
+            self._send_json(400, {"error": "Texts must be strings"})
+            return
+        if intents is not None and not isinstance(intents, str) and (
+                not isinstance(intents, list)
+                or not all(isinstance(intent, str) for intent in intents)):
+            self._send_json(400, {"error": "Intents must be a string or a "
+                                           "list of strings"})
+            return
+
+        counter = self.path[1:]
+        self.server.increment(counter)
+        try:
+            request = self.server.batcher.submit(texts, intents)
+        except Full:
+            self.server.increment("shed")
+            self._send_json(503, {"error": "Too many pending requests"},
+                            {"Retry-After": "1"})
+            return
+        if not request.wait(self.server.batcher.request_timeout):
+            self.server.increment("timeouts")
+            self._send_json(504, {"error": "Parsing timed out"})
+            return
+        if request.error is not None:
+            self.server.increment("errors")
+            self._send_json(500, {"error": str(request.error)})
+            return
+        results = request.results
+        self._send_json(200, results[0] if counter == "parse" else results)
+        self.server.recorder(REQUEST_HANDLING, perf_counter_ns() - start)
+
+    def _send_json(self, status, content, headers=None):
+        body = json_string(content, indent=None).encode("utf8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in iteritems(headers or dict()):
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint:disable=redefined-builtin
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+def _run_workers(server, num_workers):
+    workers = set()
+    stopping = []
+
+    def spawn_worker():
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.default_int_handler)
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                os._exit(0)  # pylint:disable=protected-access
+        workers.add(pid)
+
+    def stop(signum, frame):  # pylint:disable=unused-argument
+        stopping.append(signum)
+        for pid in workers:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except OSError:
+                pass
+
+    for _ in range(num_workers):
+        spawn_worker()
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    while workers:
+        try:
+            pid, _ = os.wait()
+        except OSError as e:
+            if e.errno == errno.ECHILD:
+                break
+            continue  # Interrupted by a signal
+        workers.discard(pid)
+        if not stopping:
+            logger.warning("Worker %s exited, starting a new one", pid)
+            spawn_worker()
@@ -8,6 +8,8 @@ import plac
 
 from snips_nlu import SnipsNLUEngine, load_resources
 from snips_nlu.cli.utils import set_nlu_logger
+from snips_nlu.dataset import validate_and_format_dataset
+from snips_nlu.training_cache import enable_training_cache
 
 
 @plac.annotations(
@@ -15,12 +17,19 @@ from snips_nlu.cli.utils import set_nlu_logger
                   str),
     output_path=("Path of the output model", "positional", None, str),
     config_path=("Path to the NLU engine configuration", "option", "c", str),
+    cache_dir=("Directory in which intermediate training artifacts are "
+               "cached", "option", "C", str),
+    jobs=("Number of processes used to compute the variations of large "
+          "entities", "option", "j", int),
     verbose=("Print logs", "flag", "v"),
 )
-def train(dataset_path, output_path, config_path, verbose):
+def train(dataset_path, output_path, config_path=None, cache_dir=None,
+          jobs=1, verbose=False):
     """Train an NLU engine on the provided dataset"""
     if verbose:
         set_nlu_logger(logging.DEBUG)
+    if cache_dir is not None:
+        enable_training_cache(cache_dir)
     with Path(dataset_path).open("r", encoding="utf8") as f:
         dataset = json.load(f)
 
@@ -30,6 +39,7 @@ def train(dataset_path, output_path, config_path, verbose):
             config = json.load(f)
 
     load_resources(dataset["language"])
+    dataset = validate_and_format_dataset(dataset, n_jobs=jobs)
     print("Create and train the engine...")
     engine = SnipsNLUEngine(config).fit(dataset)
 
@@ -6,8 +6,6 @@ import subprocess
 import sys
 from enum import Enum, unique
 
-import requests
-
 import snips_nlu
 from snips_nlu import __about__
 
@@ -62,6 +60,8 @@ def _color_from_level(level):
 
 
 def get_json(url, desc):
+    import requests
+
     r = requests.get(url)
     if r.status_code != 200:
         raise OSError("%s: Received status code %s when fetching the resource"
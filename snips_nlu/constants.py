@@ -56,6 +56,7 @@ CUSTOM_ENTITY_PARSER_USAGE = "custom_entity_parser_usage"
 WORD_CLUSTERS = "word_clusters"
 GAZETTEER_ENTITIES = "gazetteer_entities"
 RESOURCES_DIR = "resources_dir"
+RESOURCES_FINGERPRINT = "resources_fingerprint"
 
 # builtin entities
 SNIPS_AMOUNT_OF_MONEY = "snips/amountOfMoney"
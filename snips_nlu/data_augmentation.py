@@ -11,6 +11,7 @@ from snips_nlu_ontology import get_builtin_entity_examples
 from snips_nlu.constants import (
     CAPITALIZE, DATA, ENTITIES, ENTITY, INTENTS, TEXT, UTTERANCES)
 from snips_nlu.entity_parser.builtin_entity_parser import is_builtin_entity
+from snips_nlu.instrumentation import DATA_AUGMENTATION, instrumented
 from snips_nlu.languages import get_default_sep
 from snips_nlu.preprocessing import tokenize_light
 from snips_nlu.resources import get_stop_words
@@ -95,6 +96,7 @@ def num_queries_to_generate(dataset, intent_name, min_utterances):
     return max(nb_utterances, min_utterances)
 
 
+@instrumented(DATA_AUGMENTATION)
 def augment_utterances(dataset, intent_name, language, min_utterances,
                        capitalization_ratio, add_builtin_entities_examples,
                        random_state):
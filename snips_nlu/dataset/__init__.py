@@ -1,7 +1,11 @@
 from snips_nlu.dataset.dataset import Dataset
 from snips_nlu.dataset.entity import Entity, EntityFormatError
 from snips_nlu.dataset.intent import Intent, IntentFormatError
+from snips_nlu.dataset.synthetic import (
+    SyntheticDatasetGenerator, generate_synthetic_dataset)
 from snips_nlu.dataset.utils import (
-    extract_intent_entities, extract_utterance_entities,
-    get_dataset_gazetteer_entities, get_text_from_chunks)
-from snips_nlu.dataset.validation import validate_and_format_dataset
+    extract_intent_entities, extract_utterance_entities, get_content_hash,
+    get_dataset_fingerprints, get_dataset_gazetteer_entities,
+    get_text_from_chunks)
+from snips_nlu.dataset.validation import (
+    ValidatedDataset, validate_and_format_dataset)
@@ -5,13 +5,13 @@ import io
 from itertools import cycle
 from pathlib import Path
 
-import yaml
 from deprecation import deprecated
 from snips_nlu_ontology import get_builtin_entity_examples
 
 from snips_nlu.__about__ import __version__
 from snips_nlu.dataset.entity import Entity
 from snips_nlu.dataset.intent import Intent
+from snips_nlu.dataset.utils import yaml_safe_load_all
 
 
 class DatasetFormatError(TypeError):
@@ -173,7 +173,7 @@ class Dataset(object):
     def _load_dataset_parts(cls, stream, stream_description):
         intents = []
         entities = []
-        for doc in yaml.safe_load_all(stream):
+        for doc in yaml_safe_load_all(stream):
             doc_type = doc.get("type")
             if doc_type == "entity":
                 entities.append(Entity.from_yaml(doc))
@@ -8,7 +8,6 @@ from io import IOBase
 from pathlib import Path
 
 import six
-import yaml
 from deprecation import deprecated
 from snips_nlu_ontology import get_all_builtin_entities
 
@@ -16,6 +15,7 @@ from snips_nlu.__about__ import __version__
 from snips_nlu.constants import (
     AUTOMATICALLY_EXTENSIBLE, DATA, MATCHING_STRICTNESS, SYNONYMS,
     USE_SYNONYMS, VALUE)
+from snips_nlu.dataset.utils import yaml_safe_load
 
 AUTO_EXT_REGEX = re.compile(r'^#\sautomatically_extensible=(true|false)\s*$')
 
@@ -115,7 +115,7 @@ class Entity(object):
                 :ref:`expected entity format <yaml_entity_format>`
         """
         if isinstance(yaml_dict, IOBase):
-            yaml_dict = yaml.safe_load(yaml_dict)
+            yaml_dict = yaml_safe_load(yaml_dict)
 
         object_type = yaml_dict.get("type")
         if object_type and object_type != "entity":
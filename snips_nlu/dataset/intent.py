@@ -5,12 +5,12 @@ from builtins import object
 from io import IOBase
 from pathlib import Path
 
-import yaml
 from deprecation import deprecated
 from future.utils import with_metaclass
 
 from snips_nlu.__about__ import __version__
 from snips_nlu.constants import DATA, ENTITY, SLOT_NAME, TEXT, UTTERANCES
+from snips_nlu.dataset.utils import yaml_safe_load
 
 
 class IntentFormatError(TypeError):
@@ -110,7 +110,7 @@ class Intent(object):
                 :ref:`expected intent format <yaml_intent_format>`
         """
         if isinstance(yaml_dict, IOBase):
-            yaml_dict = yaml.safe_load(yaml_dict)
+            yaml_dict = yaml_safe_load(yaml_dict)
 
         object_type = yaml_dict.get("type")
         if object_type and object_type != "intent":
@@ -0,0 +1,247 @@
+from __future__ import unicode_literals
+
+from builtins import object, range
+
+from snips_nlu_ontology import (
+    get_builtin_entity_examples, get_supported_grammar_entities)
+
+from snips_nlu.constants import RES_INPUT, RES_INTENT, RES_SLOTS
+from snips_nlu.dataset.dataset import Dataset
+from snips_nlu.dataset.entity import Entity, EntityUtterance
+from snips_nlu.dataset.intent import (
+    Intent, IntentUtterance, SlotChunk, TextChunk)
+from snips_nlu.result import unresolved_slot
+from snips_nlu.utils import check_random_state
+
+_SYLLABLES = ["ba", "ko", "li", "mu", "ne", "pa", "ri", "so", "ta", "vu",
+              "da", "fe", "gi", "ho", "ja", "ke", "lo", "mi", "nu", "zo"]
+
+# Builtin entities which can be used in the generated utterances, provided
+# they are supported in the language
+_BUILTIN_ENTITIES = ["snips/number", "snips/ordinal", "snips/datetime",
+                     "snips/duration", "snips/temperature",
+                     "snips/amountOfMoney", "snips/percentage"]
+
+BUILTIN_SLOT_NAME = "builtin_slot"
+
+
+def generate_synthetic_dataset(num_intents=10, utterances_per_intent=50,
+                               num_entities=5, values_per_entity=100,
+                               synonyms_per_value=0, slots_per_utterance=2,
+                               language="en", random_seed=None,
+                               builtin_slot_density=0.0):
+    """Generates a random dataset in the json format, whose size is controlled
+    by the parameters
+
+    See :class:`.SyntheticDatasetGenerator` for a description of the
+    parameters.
+
+    Returns:
+        dict: A dataset in the json format
+    """
+    generator = SyntheticDatasetGenerator(
+        num_intents=num_intents, utterances_per_intent=utterances_per_intent,
+        num_entities=num_entities, values_per_entity=values_per_entity,
+        synonyms_per_value=synonyms_per_value,
+        slots_per_utterance=slots_per_utterance,
+        builtin_slot_density=builtin_slot_density, language=language,
+        random_seed=random_seed)
+    return generator.generate_dataset().json
+
+
+class SyntheticDatasetGenerator(object):
+    """Generates random datasets, along with labeled queries, whose size is
+    controlled by the parameters
+
+    The dataset is made of pseudo-words, each intent having its own
+    vocabulary so that intents can be distinguished. Each utterance contains
+    *slots_per_utterance* slots filled with values of custom entities, and
+    an additional builtin slot with a probability of *builtin_slot_density*.
+
+    Args:
+        num_intents (int): Number of intents
+        utterances_per_intent (int): Number of utterances per intent
+        num_entities (int): Number of custom entities
+        values_per_entity (int): Number of values of each entity
+        synonyms_per_value (int): Number of synonyms of each entity value
+        slots_per_utterance (int): Number of custom slots in each utterance,
+            when there is at least one entity
+        builtin_slot_density (float): Ratio of utterances having a builtin
+            slot, between 0.0 and 1.0
+        language (str): Language of the dataset
+        random_seed (int, optional): Seed making the generation reproducible
+
+    Example:
+
+        >>> generator = SyntheticDatasetGenerator(num_intents=2, \
+            random_seed=42)
+        >>> dataset = generator.generate_dataset()
+        >>> queries = generator.generate_queries(10)
+    """
+
+    def __init__(self, num_intents=10, utterances_per_intent=50,
+                 num_entities=5, values_per_entity=100, synonyms_per_value=0,
+                 slots_per_utterance=2, builtin_slot_density=0.0,
+                 language="en", random_seed=None):
+        if not 0.0 <= builtin_slot_density <= 1.0:
+            raise ValueError("builtin_slot_density must be between 0.0 and "
+                             "1.0, found %s" % builtin_slot_density)
+        self.utterances_per_intent = utterances_per_intent
+        self.builtin_slot_density = builtin_slot_density
+        self.language = language
+        self.random_state = check_random_state(random_seed)
+        self._words = _WordsGenerator(self.random_state)
+
+        self.entities = [
+            _generate_entity("entity_%s" % i, self._words, values_per_entity,
+                             synonyms_per_value)
+            for i in range(num_entities)
+        ]
+        self._entities_values = {
+            entity.name: [v for u in entity.utterances for v in u.variations]
+            for entity in self.entities
+        }
+        if not self.entities:
+            slots_per_utterance = 0
+
+        self._builtin_examples = dict()
+        if builtin_slot_density > 0:
+            supported_entities = get_supported_grammar_entities(language)
+            for entity in _BUILTIN_ENTITIES:
+                if entity not in supported_entities:
+                    continue
+                examples = list(get_builtin_entity_examples(entity, language))
+                if examples:
+                    self._builtin_examples[entity] = examples
+            if not self._builtin_examples:
+                raise ValueError("No builtin entity is supported in '%s'"
+                                 % language)
+        builtin_entities = sorted(self._builtin_examples)
+
+        self._intents_templates = []
+        for intent_index in range(num_intents):
+            vocabulary = [self._words.generate(2) for _ in range(20)]
+            slots_entities = [
+                self.entities[self._randint(len(self.entities))].name
+                for _ in range(slots_per_utterance)]
+            builtin_entity = None
+            if builtin_entities:
+                builtin_entity = builtin_entities[
+                    self._randint(len(builtin_entities))]
+            self._intents_templates.append(
+                ("intent_%s" % intent_index, vocabulary, slots_entities,
+                 builtin_entity))
+
+    def generate_dataset(self):
+        """Generates the dataset
+
+        Returns:
+            :class:`.Dataset`: The generated dataset
+        """
+        intents = []
+        for intent_name, vocabulary, slots_entities, builtin_entity in \
+                self._intents_templates:
+            utterances = [
+                IntentUtterance(self._generate_chunks(
+                    vocabulary, slots_entities, builtin_entity))
+                for _ in range(self.utterances_per_intent)
+            ]
+            intents.append(Intent(intent_name, utterances))
+        return Dataset(self.language, intents, list(self.entities))
+
+    def generate_queries(self, num_queries):
+        """Generates queries of random intents, labeled with their intent and
+        slots
+
+        Each query is a dict with the *input* text, the *intent* name and the
+        list of expected *slots*, in the same format as the unresolved slots
+        of the parsing results.
+
+        Returns:
+            list of dict: The labeled queries
+        """
+        queries = []
+        for _ in range(num_queries):
+            intent_name, vocabulary, slots_entities, builtin_entity = \
+                self._intents_templates[
+                    self._randint(len(self._intents_templates))]
+            chunks = self._generate_chunks(
+                vocabulary, slots_entities, builtin_entity)
+            queries.append(_chunks_to_query(intent_name, chunks))
+        return queries
+
+    def _generate_chunks(self, vocabulary, slots_entities, builtin_entity):
+        chunks = []
+        for slot_index, entity in enumerate(slots_entities):
+            chunks.append(TextChunk(self._generate_text(vocabulary) + " "))
+            values = self._entities_values[entity]
+            chunks.append(SlotChunk("slot_%s" % slot_index, entity,
+                                    values[self._randint(len(values))]))
+            chunks.append(TextChunk(" "))
+        chunks.append(TextChunk(self._generate_text(vocabulary)))
+        if builtin_entity is not None \
+                and self.random_state.rand() < self.builtin_slot_density:
+            examples = self._builtin_examples[builtin_entity]
+            chunks.append(TextChunk(" "))
+            chunks.append(SlotChunk(BUILTIN_SLOT_NAME, builtin_entity,
+                                    examples[self._randint(len(examples))]))
+        return chunks
+
+    def _generate_text(self, vocabulary):
+        num_words = self.random_state.randint(1, 4)
+        return " ".join(vocabulary[self._randint(len(vocabulary))]
+                        for _ in range(num_words))
+
+    def _randint(self, high):
+        return self.random_state.randint(high)
+
+
+def _generate_entity(name, words, values_per_entity, synonyms_per_value):
+    utterances = [
+        EntityUtterance(words.generate_phrase(),
+                        [words.generate_phrase()
+                         for _ in range(synonyms_per_value)])
+        for _ in range(values_per_entity)
+    ]
+    return Entity(name, utterances, automatically_extensible=True,
+                  use_synonyms=synonyms_per_value > 0,
+                  matching_strictness=1.0)
+
+
+def _chunks_to_query(intent_name, chunks):
+    text = ""
+    slots = []
+    for chunk in chunks:
+        if isinstance(chunk, SlotChunk):
+            match_range = [len(text), len(text) + len(chunk.text)]
+            slots.append(unresolved_slot(match_range, chunk.text,
+                                         chunk.entity, chunk.slot_name))
+        text += chunk.text
+    return {
+        RES_INPUT: text,
+        RES_INTENT: intent_name,
+        RES_SLOTS: slots
+    }
+
+
+class _WordsGenerator(object):
+    """Generates distinct pseudo-words"""
+
+    def __init__(self, random_state):
+        self.random_state = random_state
+        self.generated_words = set()
+
+    def generate(self, num_syllables):
+        while True:
+            word = "".join(
+                _SYLLABLES[self.random_state.randint(len(_SYLLABLES))]
+                for _ in range(num_syllables))
+            if word not in self.generated_words:
+                self.generated_words.add(word)
+                return word
+            num_syllables += 1
+
+    def generate_phrase(self):
+        num_words = self.random_state.randint(1, 3)
+        return " ".join(self.generate(self.random_state.randint(2, 4))
+                        for _ in range(num_words))
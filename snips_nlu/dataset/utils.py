@@ -1,11 +1,13 @@
 from __future__ import unicode_literals
 
+import hashlib
+
 from future.utils import iteritems, itervalues
-from yaml import Loader, SafeLoader
 
 from snips_nlu.constants import (
-    DATA, ENTITIES, ENTITY, INTENTS, TEXT, UTTERANCES)
+    DATA, ENTITIES, ENTITY, INTENTS, LANGUAGE, TEXT, UTTERANCES)
 from snips_nlu.entity_parser.builtin_entity_parser import is_gazetteer_entity
+from snips_nlu.utils import json_string
 
 
 def construct_yaml_str(self, node):
@@ -14,8 +16,22 @@ def construct_yaml_str(self, node):
     return self.construct_scalar(node)
 
 
-Loader.add_constructor("tag:yaml.org,2002:str", construct_yaml_str)
-SafeLoader.add_constructor("tag:yaml.org,2002:str", construct_yaml_str)
+def yaml_safe_load(stream):
+    return _get_yaml().safe_load(stream)
+
+
+def yaml_safe_load_all(stream):
+    return _get_yaml().safe_load_all(stream)
+
+
+def _get_yaml():
+    # yaml is only needed to load datasets, hence it is imported on first use
+    import yaml
+
+    yaml.Loader.add_constructor("tag:yaml.org,2002:str", construct_yaml_str)
+    yaml.SafeLoader.add_constructor("tag:yaml.org,2002:str",
+                                    construct_yaml_str)
+    return yaml
 
 
 def extract_utterance_entities(dataset):
@@ -49,3 +65,25 @@ def get_dataset_gazetteer_entities(dataset, intent=None):
     if intent is not None:
         return extract_intent_entities(dataset, is_gazetteer_entity)[intent]
     return {e for e in dataset[ENTITIES] if is_gazetteer_entity(e)}
+
+
+def get_content_hash(obj):
+    """Computes a hash of a json serializable object which does not depend on
+    the order of its keys"""
+    content = json_string(obj, indent=None, sort_keys=True)
+    return hashlib.sha1(content.encode("utf8")).hexdigest()
+
+
+def get_dataset_fingerprints(dataset):
+    """Computes content hashes of each intent and each entity of a dataset
+
+    These fingerprints are used to detect which parts of a dataset have changed
+    between two trainings.
+    """
+    return {
+        LANGUAGE: dataset[LANGUAGE],
+        INTENTS: {intent_name: get_content_hash(intent) for
+                  intent_name, intent in iteritems(dataset[INTENTS])},
+        ENTITIES: {entity_name: get_content_hash(entity) for
+                   entity_name, entity in iteritems(dataset[ENTITIES])}
+    }
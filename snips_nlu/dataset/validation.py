@@ -1,9 +1,7 @@
 from __future__ import division, unicode_literals
 
-import json
-from builtins import str
+from builtins import bytes, str
 from collections import Counter
-from copy import deepcopy
 
 from future.utils import iteritems, itervalues
 from snips_nlu_ontology import get_all_languages
@@ -15,19 +13,57 @@ from snips_nlu.constants import (
 from snips_nlu.dataset import extract_utterance_entities
 from snips_nlu.entity_parser.builtin_entity_parser import (
     BuiltinEntityParser, is_builtin_entity)
+from snips_nlu.instrumentation import DATASET_VALIDATION, instrumented
 from snips_nlu.preprocessing import tokenize_light
-from snips_nlu.string_variations import get_string_variations
+from snips_nlu.string_variations import warm_string_variations
 from snips_nlu.utils import validate_key, validate_keys, validate_type
 
 
-def validate_and_format_dataset(dataset):
-    """Checks that the dataset is valid and format it"""
+class ValidatedDataset(dict):
+    """Dataset which has been validated and formatted by
+    :func:`validate_and_format_dataset`
+
+    The top level of a validated dataset is frozen so that it can be passed
+    down to the fit methods of all the processing units, which then skip
+    validation and never copy it. Copies and unpickled versions of a
+    validated dataset are plain mutable dicts.
+    """
+
+    def _frozen(self, *args, **kwargs):
+        raise TypeError("A validated dataset cannot be modified, copy it "
+                        "first")
+
+    __setitem__ = _frozen
+    __delitem__ = _frozen
+    clear = _frozen
+    pop = _frozen
+    popitem = _frozen
+    setdefault = _frozen
+    update = _frozen
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
+@instrumented(DATASET_VALIDATION)
+def validate_and_format_dataset(dataset, n_jobs=1):
+    """Checks that the dataset is valid and format it
+
+    Args:
+        dataset (dict): Dataset to validate
+        n_jobs (int, optional): Number of processes used to compute the
+            variations of large entities. Defaults to 1.
+
+    Returns:
+        :class:`ValidatedDataset`: A validated copy of the dataset, or the
+        dataset itself if it has already been validated
+    """
     # Make this function idempotent
-    if dataset.get(VALIDATED, False):
+    if isinstance(dataset, ValidatedDataset) or dataset.get(VALIDATED, False):
         return dataset
-    dataset = deepcopy(dataset)
-    dataset = json.loads(json.dumps(dataset))
     validate_type(dataset, dict)
+    # Copy the dataset once, normalizing types as a json round-trip would
+    dataset = _copy_json_object(dataset)
     mandatory_keys = [INTENTS, ENTITIES, LANGUAGE]
     for key in mandatory_keys:
         validate_key(dataset, key, object_label="dataset")
@@ -53,9 +89,38 @@ def validate_and_format_dataset(dataset):
             dataset[ENTITIES][entity_name] = \
                 _validate_and_format_custom_entity(
                     entity, uterrance_entities, language,
-                    builtin_entity_parser)
+                    builtin_entity_parser, n_jobs)
     dataset[VALIDATED] = True
-    return dataset
+    return ValidatedDataset(dataset)
+
+
+def _copy_json_object(obj):
+    if isinstance(obj, dict):
+        return {_copy_json_key(k): _copy_json_object(v)
+                for k, v in iteritems(obj)}
+    if isinstance(obj, (list, tuple)):
+        return [_copy_json_object(v) for v in obj]
+    if isinstance(obj, str):
+        return str(obj)
+    if isinstance(obj, bytes):
+        return obj.decode("utf8")
+    if obj is None or isinstance(obj, (bool, int, float)):
+        return obj
+    raise TypeError("%r is not JSON serializable" % obj)
+
+
+def _copy_json_key(key):
+    if isinstance(key, bytes):
+        return key.decode("utf8")
+    if isinstance(key, bool):
+        return "true" if key else "false"
+    if key is None:
+        return "null"
+    if isinstance(key, (int, float)):
+        return str(key)
+    if not isinstance(key, str):
+        raise TypeError("key %r is not a string" % key)
+    return str(key)
 
 
 def _validate_and_format_intent(intent, entities):
@@ -106,7 +171,7 @@ def _extract_entity_values(entity):
 
 
 def _validate_and_format_custom_entity(entity, queries_entities, language,
-                                       builtin_entity_parser):
+                                       builtin_entity_parser, n_jobs=1):
     validate_type(entity, dict)
 
     # TODO: this is here temporarily, only to allow backward compatibility
@@ -162,6 +227,13 @@ def _validate_and_format_custom_entity(entity, queries_entities, language,
 
     # Add variations if not colliding
     all_original_values = _extract_entity_values(entity)
+    strings_to_variate = set(queries_entities)
+    for data in entity[DATA]:
+        strings_to_variate.add(data[VALUE])
+        if use_synonyms:
+            strings_to_variate.update(data[SYNONYMS])
+    strings_variations = warm_string_variations(
+        strings_to_variate, language, builtin_entity_parser, n_jobs)
     variations = dict()
     for data in entity[DATA]:
         ent_value = data[VALUE]
@@ -170,8 +242,7 @@ def _validate_and_format_custom_entity(entity, queries_entities, language,
             values_to_variate.update(set(data[SYNONYMS]))
         variations[ent_value] = set(
             v for value in values_to_variate
-            for v in get_string_variations(value, language,
-                                           builtin_entity_parser))
+            for v in strings_variations[value])
     variation_counter = Counter(
         [v for vars in itervalues(variations) for v in vars])
     non_colliding_variations = {
@@ -188,11 +259,8 @@ def _validate_and_format_custom_entity(entity, queries_entities, language,
             validated_utterances, non_colliding_variations, entry_value)
 
     # Merge queries entities
-    queries_entities_variations = {
-        ent: get_string_variations(ent, language, builtin_entity_parser)
-        for ent in queries_entities
-    }
-    for original_ent, variations in iteritems(queries_entities_variations):
+    for original_ent in queries_entities:
+        variations = strings_variations[original_ent]
         if not original_ent or original_ent in validated_utterances:
             continue
         validated_utterances[original_ent] = original_ent
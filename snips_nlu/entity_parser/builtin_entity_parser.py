@@ -12,6 +12,8 @@ from snips_nlu_ontology import (
 
 from snips_nlu.constants import DATA_PATH, ENTITIES, LANGUAGE
 from snips_nlu.entity_parser.entity_parser import EntityParser
+from snips_nlu.instrumentation import (
+    BUILTIN_ENTITY_PARSER_BUILDING, BUILTIN_ENTITY_PARSING, instrumented)
 from snips_nlu.utils import json_string, temp_dir
 
 _BUILTIN_ENTITY_PARSERS = dict()
@@ -23,6 +25,10 @@ except NameError:
 
 
 class BuiltinEntityParser(EntityParser):
+    @instrumented(BUILTIN_ENTITY_PARSING)
+    def parse(self, text, scope=None, use_cache=True):
+        return super(BuiltinEntityParser, self).parse(text, scope, use_cache)
+
     def persist(self, path):
         self._parser.persist(path)
 
@@ -32,6 +38,7 @@ class BuiltinEntityParser(EntityParser):
         return cls(parser)
 
     @classmethod
+    @instrumented(BUILTIN_ENTITY_PARSER_BUILDING)
     def build(cls, dataset=None, language=None, gazetteer_entity_scope=None):
         global _BUILTIN_ENTITY_PARSERS
 
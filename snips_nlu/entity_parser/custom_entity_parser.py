@@ -2,10 +2,11 @@
 from __future__ import unicode_literals
 
 import json
-from copy import deepcopy
+import shutil
 from pathlib import Path
 
-from future.utils import iteritems, viewvalues
+from future.builtins import object
+from future.utils import iteritems
 from snips_nlu_ontology import GazetteerEntityParser
 
 from snips_nlu.constants import (
@@ -15,85 +16,132 @@ from snips_nlu.entity_parser.builtin_entity_parser import is_builtin_entity
 from snips_nlu.entity_parser.custom_entity_parser_usage import (
     CustomEntityParserUsage)
 from snips_nlu.entity_parser.entity_parser import EntityParser
+from snips_nlu.instrumentation import (
+    CUSTOM_ENTITY_PARSER_BUILDING, CUSTOM_ENTITY_PARSING, instrumented)
 from snips_nlu.preprocessing import stem, tokenize
 from snips_nlu.utils import json_string
 
 
+# Maximum number of entity values in a gazetteer shard, entities having more
+# values than this budget are put in their own shard
+MAX_SHARD_SIZE = 100000
+
+
 class CustomEntityParser(EntityParser):
-    def __init__(self, parser, language, parser_usage):
+    """Entity parser for the custom entities of a dataset
+
+    Entities are split in shards, each one of them being handled by a separate
+    :class:`.GazetteerShard`, so that scoped parsing only runs the gazetteers
+    of the entities in the scope.
+    """
+
+    def __init__(self, parser, language, parser_usage, shards=None):
         super(CustomEntityParser, self).__init__(parser)
         self.language = language
         self.parser_usage = parser_usage
+        if shards is None:
+            shards = [GazetteerShard(entities=None, parser=parser)]
+        self.shards = shards
+
+    def preload(self):
+        for shard in self.shards:
+            shard.load()
 
     def persist(self, path):
         path = Path(path)
         path.mkdir()
-        parser_directory = "parser"
         metadata = {
             "language": self.language,
             "parser_usage": self.parser_usage.value,
-            "parser_directory": parser_directory
         }
+        if len(self.shards) == 1:
+            # A single shard handles all the entities, and is persisted with
+            # the layout used before sharding
+            parser_directory = "parser"
+            self.shards[0].persist(path / parser_directory)
+            metadata["parser_directory"] = parser_directory
+        else:
+            shards_metadata = []
+            for i, shard in enumerate(self.shards):
+                parser_directory = "parser_%s" % i
+                shard.persist(path / parser_directory)
+                shards_metadata.append({
+                    "entities": shard.entities,
+                    "parser_directory": parser_directory
+                })
+            metadata["shards"] = shards_metadata
         with (path / "metadata.json").open(mode="w", encoding="utf8") as f:
             f.write(json_string(metadata))
-        self._parser.persist(path / parser_directory)
 
     @classmethod
-    def from_path(cls, path):
+    def from_path(cls, path, lazy=False):
+        """Loads a :class:`CustomEntityParser` from a directory
+
+        Args:
+            path (str): Directory where the parser has been persisted
+            lazy (bool, optional): If True, each shard is only loaded the first
+                time it is used, in which case the directory must not be
+                removed while the parser is in use. Default to False.
+        """
         path = Path(path)
         with (path / "metadata.json").open(encoding="utf8") as f:
             metadata = json.load(f)
         language = metadata["language"]
         parser_usage = CustomEntityParserUsage(metadata["parser_usage"])
-        parser_path = path / metadata["parser_directory"]
-        parser = GazetteerEntityParser.from_path(parser_path)
-        return cls(parser, language, parser_usage)
+        shards_metadata = metadata.get("shards")
+        if shards_metadata is None:
+            # Parsers persisted before sharding consist in a single gazetteer
+            # parser handling all the entities
+            shards_metadata = [{
+                "entities": None,
+                "parser_directory": metadata["parser_directory"]
+            }]
+        shards = [
+            GazetteerShard(entities=shard_metadata["entities"],
+                           path=path / shard_metadata["parser_directory"])
+            for shard_metadata in shards_metadata
+        ]
+        if not lazy:
+            for shard in shards:
+                shard.load()
+        return cls(None, language, parser_usage, shards)
 
     @classmethod
-    def build(cls, dataset, parser_usage):
+    @instrumented(CUSTOM_ENTITY_PARSER_BUILDING)
+    def build(cls, dataset, parser_usage, max_shard_size=MAX_SHARD_SIZE):
         from snips_nlu.dataset import validate_and_format_dataset
 
+        if parser_usage is None:
+            raise ValueError("A parser usage must be defined in order to fit "
+                             "a CustomEntityParser")
         dataset = validate_and_format_dataset(dataset)
         language = dataset[LANGUAGE]
-        custom_entities = {
-            entity_name: deepcopy(entity)
+        custom_entities = (
+            (entity_name, entity)
             for entity_name, entity in iteritems(dataset[ENTITIES])
             if not is_builtin_entity(entity_name)
-        }
-        if parser_usage == CustomEntityParserUsage.WITH_AND_WITHOUT_STEMS:
-            for ent in viewvalues(custom_entities):
-                stemmed_utterances = _stem_entity_utterances(
-                    ent[UTTERANCES], language)
-                ent[UTTERANCES] = _merge_entity_utterances(
-                    ent[UTTERANCES], stemmed_utterances)
-        elif parser_usage == CustomEntityParserUsage.WITH_STEMS:
-            for ent in viewvalues(custom_entities):
-                ent[UTTERANCES] = _stem_entity_utterances(
-                    ent[UTTERANCES], language)
-        elif parser_usage is None:
-            raise ValueError("A parser usage must be defined in order to fit "
-                             "a CustomEntityParser")
-        configuration = _create_custom_entity_parser_configuration(
-            custom_entities)
-        parser = GazetteerEntityParser.build(configuration)
-        return cls(parser, language, parser_usage)
+        )
+        shards = []
+        for shard_entities in _group_entities_in_shards(custom_entities,
+                                                        max_shard_size):
+            configuration = _create_custom_entity_parser_configuration(
+                shard_entities, language, parser_usage)
+            parser = GazetteerEntityParser.build(configuration)
+            entities_names = [entity_name for entity_name, _ in shard_entities]
+            shards.append(GazetteerShard(entities_names, parser=parser))
+        return cls(None, language, parser_usage, shards)
 
+    @instrumented(CUSTOM_ENTITY_PARSING)
     def parse(self, text, scope=None, use_cache=True):
-        text = text.lower()
-        if not use_cache:
-            return self._parse(text, scope)
-        scope_key = tuple(sorted(scope)) if scope is not None else scope
-        cache_key = (text, scope_key)
-        if cache_key not in self._cache:
-            parser_result = self._parse(text, scope)
-            self._cache[cache_key] = parser_result
-        return self._cache[cache_key]
+        return super(CustomEntityParser, self).parse(text, scope, use_cache)
 
     def _parse(self, text, scope):
         tokens = tokenize(text, self.language)
         shifts = _compute_char_shifts(tokens)
         cleaned_text = " ".join(token.value for token in tokens)
-        entities = self._parser.parse(cleaned_text, scope)
+        entities = []
+        for shard in self.shards:
+            entities += shard.parse(cleaned_text, scope)
         for entity in entities:
             start = entity[RES_MATCH_RANGE][START]
             end = entity[RES_MATCH_RANGE][END]
@@ -103,6 +151,51 @@ class CustomEntityParser(EntityParser):
         return entities
 
 
+class GazetteerShard(object):
+    """Gazetteer entity parser handling a subset of the custom entities
+
+    Args:
+        entities (list of str): Names of the entities handled by the shard, or
+            None if the shard handles all the entities
+        parser (:class:`snips_nlu_ontology.GazetteerEntityParser`, optional):
+            Underlying gazetteer parser
+        path (:class:`pathlib.Path`, optional): Directory from which the
+            underlying parser is loaded, when it is not provided
+    """
+
+    def __init__(self, entities, parser=None, path=None):
+        if parser is None and path is None:
+            raise ValueError("Either a parser or a path must be provided")
+        self.entities = entities
+        self._entities_set = set(entities) if entities is not None else None
+        self._parser = parser
+        self._path = path
+
+    @property
+    def loaded(self):
+        """Whether or not the underlying parser has been loaded"""
+        return self._parser is not None
+
+    def load(self):
+        if self._parser is None:
+            self._parser = GazetteerEntityParser.from_path(self._path)
+        return self._parser
+
+    def parse(self, text, scope=None):
+        if scope is not None and self._entities_set is not None:
+            scope = [entity for entity in scope
+                     if entity in self._entities_set]
+            if not scope:
+                return []
+        return self.load().parse(text, scope)
+
+    def persist(self, path):
+        if self._parser is None:
+            shutil.copytree(str(self._path), str(path))
+        else:
+            self._parser.persist(path)
+
+
 def _stem_entity_utterances(entity_utterances, language):
     return {
         stem(raw_value, language): resolved_value
@@ -110,14 +203,28 @@ def _stem_entity_utterances(entity_utterances, language):
     }
 
 
-def _merge_entity_utterances(raw_utterances, stemmed_utterances):
-    for raw_stemmed_value, resolved_value in iteritems(stemmed_utterances):
-        if raw_stemmed_value not in raw_utterances:
-            raw_utterances[raw_stemmed_value] = resolved_value
-    return raw_utterances
+def _iter_gazetteer_values(entity_utterances, language, parser_usage):
+    """Yields the (raw value, resolved value) pairs of an entity gazetteer
 
+    The entity utterances are read in place, and the stemmed values, which
+    are shared by the stemmed parser usages, are computed only once.
+    """
+    if parser_usage != CustomEntityParserUsage.WITH_STEMS:
+        for raw_value, resolved_value in iteritems(entity_utterances):
+            yield raw_value, resolved_value
+    if parser_usage == CustomEntityParserUsage.WITHOUT_STEMS:
+        return
+    stemmed_utterances = _stem_entity_utterances(entity_utterances, language)
+    with_raw_values = \
+        parser_usage == CustomEntityParserUsage.WITH_AND_WITHOUT_STEMS
+    for stemmed_value, resolved_value in iteritems(stemmed_utterances):
+        if with_raw_values and stemmed_value in entity_utterances:
+            continue
+        yield stemmed_value, resolved_value
 
-def _create_custom_entity_parser_configuration(entities):
+
+def _create_custom_entity_parser_configuration(entities, language,
+                                               parser_usage):
     return {
         "entity_parsers": [
             {
@@ -128,14 +235,36 @@ def _create_custom_entity_parser_configuration(entities):
                         {
                             "raw_value": k,
                             "resolved_value": v
-                        } for k, v in iteritems(entity[UTTERANCES])
+                        } for k, v in _iter_gazetteer_values(
+                            entity[UTTERANCES], language, parser_usage)
                     ]
                 }
-            } for entity_name, entity in iteritems(entities)
+            } for entity_name, entity in entities
         ]
     }
 
 
+def _group_entities_in_shards(entities, max_shard_size):
+    """Groups the (name, entity) pairs in shards containing at most
+    *max_shard_size* entity values, unless an entity is bigger than this
+    budget in which case it has its own shard"""
+    shards = []
+    current_shard = []
+    current_shard_size = 0
+    for entity_name, entity in entities:
+        entity_size = len(entity[UTTERANCES])
+        if current_shard and \
+                current_shard_size + entity_size > max_shard_size:
+            shards.append(current_shard)
+            current_shard = []
+            current_shard_size = 0
+        current_shard.append((entity_name, entity))
+        current_shard_size += entity_size
+    if current_shard:
+        shards.append(current_shard)
+    return shards
+
+
 def _compute_char_shifts(tokens):
     """Compute the shifts in characters that occur when comparing the
     tokens string with the string consisting of all tokens separated with a
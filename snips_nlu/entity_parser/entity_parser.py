@@ -23,18 +23,32 @@ class EntityParser(with_metaclass(ABCMeta, object)):
     def __init__(self, parser):
         self._parser = parser
         self._cache = LimitedSizeDict(size_limit=1000)
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def parse(self, text, scope=None, use_cache=True):
         text = text.lower()
         if not use_cache:
-            return self._parser.parse(text, scope)
+            return self._parse(text, scope)
         scope_key = tuple(sorted(scope)) if scope is not None else scope
         cache_key = (text, scope_key)
-        if cache_key not in self._cache:
-            parser_result = self._parser.parse(text, scope)
-            self._cache[cache_key] = parser_result
+        if cache_key in self._cache:
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+            self._cache[cache_key] = self._parse(text, scope)
         return self._cache[cache_key]
 
+    def _parse(self, text, scope):
+        return self._parser.parse(text, scope)
+
+    def clear_cache(self):
+        self._cache.clear()
+
+    def preload(self):
+        """Loads the state which is otherwise lazily loaded on first use"""
+        pass
+
     @abstractmethod
     def persist(self, path):
         pass
@@ -0,0 +1,279 @@
+from __future__ import division, unicode_literals
+
+import math
+import threading
+from builtins import object
+from contextlib import contextmanager
+from functools import wraps
+
+from future.utils import iteritems
+
+try:
+    from time import perf_counter_ns
+except ImportError:
+    try:
+        from time import perf_counter
+    except ImportError:  # python 2
+        from time import time as perf_counter
+
+    def perf_counter_ns():
+        return int(perf_counter() * 1e9)
+
+# Stages of the parsing pipeline which are instrumented. Stages can be nested,
+# for instance the tokenization stage is also included in the featurization
+# stage.
+PARSING = "parsing"
+TOKENIZATION = "tokenization"
+BUILTIN_ENTITY_PARSING = "builtin_entity_parsing"
+CUSTOM_ENTITY_PARSING = "custom_entity_parsing"
+DETERMINISTIC_MATCHING = "deterministic_matching"
+FEATURIZATION = "featurization"
+INTENT_CLASSIFICATION = "intent_classification"
+CRF_FEATURES_COMPUTATION = "crf_features_computation"
+CRF_DECODING = "crf_decoding"
+SLOT_RESOLUTION = "slot_resolution"
+
+# Phases of the training which are instrumented
+DATASET_VALIDATION = "dataset_validation"
+CUSTOM_ENTITY_PARSER_BUILDING = "custom_entity_parser_building"
+BUILTIN_ENTITY_PARSER_BUILDING = "builtin_entity_parser_building"
+INTENT_CLASSIFIER_DATA_BUILDING = "intent_classifier_data_building"
+FEATURIZER_FITTING = "featurizer_fitting"
+INTENT_CLASSIFIER_FITTING = "intent_classifier_fitting"
+DATA_AUGMENTATION = "data_augmentation"
+CRF_FEATURES_EXTRACTION = "crf_features_extraction"
+CRF_TRAINING = "crf_training"
+PERSISTING = "persisting"
+
+TRAINING_STAGES = (
+    DATASET_VALIDATION, CUSTOM_ENTITY_PARSER_BUILDING,
+    BUILTIN_ENTITY_PARSER_BUILDING, INTENT_CLASSIFIER_DATA_BUILDING,
+    FEATURIZER_FITTING, INTENT_CLASSIFIER_FITTING, DATA_AUGMENTATION,
+    CRF_FEATURES_EXTRACTION, CRF_TRAINING, PERSISTING)
+
+_RECORDER = None
+
+
+def set_recorder(recorder):
+    """Sets the recorder receiving the duration of the instrumented stages
+
+    The recorder is a callable which is called with the name of a stage and
+    its duration in nanoseconds. Passing None disables the instrumentation,
+    which is the default.
+
+    Recorders may also define ``enter_stage(stage)`` and
+    ``exit_stage(stage)`` methods, which are then called right before and
+    right after each stage, for instance to profile it.
+    """
+    global _RECORDER  # pylint:disable=global-statement
+    _RECORDER = recorder
+
+
+def get_recorder():
+    return _RECORDER
+
+
+@contextmanager
+def recording(recorder):
+    """Context manager which sets *recorder* and restores the previous one on
+    exit"""
+    previous_recorder = get_recorder()
+    set_recorder(recorder)
+    try:
+        yield recorder
+    finally:
+        set_recorder(previous_recorder)
+
+
+def timed_stage(stage):
+    """Returns a context manager timing the enclosed code as *stage*
+
+    When no recorder is set, a no-op context manager is returned.
+    """
+    if _RECORDER is None:
+        return _NULL_TIMER
+    return _StageTimer(stage, _RECORDER)
+
+
+def instrumented(stage):
+    """Decorator timing each call to the decorated function as *stage*"""
+
+    def decorator(func):
+        @wraps(func)
+        def wrapped(*args, **kwargs):
+            recorder = _RECORDER
+            if recorder is None:
+                return func(*args, **kwargs)
+            with _StageTimer(stage, recorder):
+                return func(*args, **kwargs)
+
+        return wrapped
+
+    return decorator
+
+
+class _StageTimer(object):
+    __slots__ = ("stage", "recorder", "start")
+
+    def __init__(self, stage, recorder):
+        self.stage = stage
+        self.recorder = recorder
+        self.start = None
+
+    def __enter__(self):
+        enter_stage = getattr(self.recorder, "enter_stage", None)
+        if enter_stage is not None:
+            enter_stage(self.stage)
+        self.start = perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        duration = perf_counter_ns() - self.start
+        exit_stage = getattr(self.recorder, "exit_stage", None)
+        if exit_stage is not None:
+            exit_stage(self.stage)
+        self.recorder(self.stage, duration)
+
+
+class _NullTimer(object):
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class HistogramRecorder(object):
+    """Recorder aggregating the stage durations in log-scaled histograms
+
+    Durations are stored in buckets whose bounds grow geometrically by a
+    factor of *1 + relative_precision*, so that the memory footprint does not
+    depend on the number of recorded durations while percentiles are
+    estimated with a bounded relative error.
+
+    Example:
+
+        >>> from snips_nlu.instrumentation import (
+        ...     HistogramRecorder, set_recorder)
+        >>> recorder = HistogramRecorder()
+        >>> set_recorder(recorder)
+        >>> # parse some queries
+        >>> recorder.summary()  # doctest: +SKIP
+    """
+
+    def __init__(self, relative_precision=0.01):
+        self.relative_precision = relative_precision
+        self._log_base = math.log1p(relative_precision)
+        self._histograms = dict()
+        self._lock = threading.Lock()
+
+    def __call__(self, stage, duration_ns):
+        self.record(stage, duration_ns)
+
+    def record(self, stage, duration_ns):
+        bucket = self._get_bucket(duration_ns)
+        with self._lock:
+            histogram = self._histograms.get(stage)
+            if histogram is None:
+                histogram = _Histogram()
+                self._histograms[stage] = histogram
+            histogram.add(bucket, duration_ns)
+
+    @property
+    def stages(self):
+        with self._lock:
+            return sorted(self._histograms)
+
+    def count(self, stage):
+        with self._lock:
+            return self._histograms[stage].count
+
+    def percentile(self, stage, percent):
+        """Estimated duration, in nanoseconds, below which *percent* % of the
+        durations of *stage* fall"""
+        with self._lock:
+            histogram = self._histograms[stage].copy()
+        return self._estimate_percentile(histogram, percent)
+
+    def summary(self, percentiles=(50, 95, 99)):
+        """Returns, for each stage, the number of recorded durations along with
+        their total, mean, maximum and percentiles in milliseconds"""
+        # Histograms are copied under the lock, as durations can be recorded
+        # concurrently, and summarized outside of it
+        with self._lock:
+            histograms = {stage: histogram.copy()
+                          for stage, histogram in iteritems(self._histograms)}
+        summary = dict()
+        for stage, histogram in iteritems(histograms):
+            stage_summary = {
+                "count": histogram.count,
+                "total_ms": histogram.total / 1e6,
+                "mean_ms": histogram.total / histogram.count / 1e6,
+                "max_ms": histogram.max / 1e6,
+            }
+            for percent in percentiles:
+                stage_summary["p%s_ms" % percent] = \
+                    self._estimate_percentile(histogram, percent) / 1e6
+            summary[stage] = stage_summary
+        return summary
+
+    def reset(self):
+        with self._lock:
+            self._histograms = dict()
+
+    def _get_bucket(self, duration_ns):
+        if duration_ns <= 1:
+            return 0
+        return int(math.log(duration_ns) / self._log_base)
+
+    def _get_bucket_value(self, bucket):
+        # Middle of the bucket bounds
+        return math.exp((bucket + 0.5) * self._log_base)
+
+    def _estimate_percentile(self, histogram, percent):
+        bucket = histogram.get_percentile_bucket(percent)
+        estimate = self._get_bucket_value(bucket)
+        # The estimate can not exceed the observed extremes
+        return min(max(estimate, histogram.min), histogram.max)
+
+
+class _Histogram(object):
+    def __init__(self):
+        self.counts = dict()
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def add(self, bucket, duration_ns):
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        self.count += 1
+        self.total += duration_ns
+        if self.min is None or duration_ns < self.min:
+            self.min = duration_ns
+        if self.max is None or duration_ns > self.max:
+            self.max = duration_ns
+
+    def copy(self):
+        histogram = _Histogram()
+        histogram.counts = dict(self.counts)
+        histogram.count = self.count
+        histogram.total = self.total
+        histogram.min = self.min
+        histogram.max = self.max
+        return histogram
+
+    def get_percentile_bucket(self, percent):
+        rank = int(math.ceil(percent / 100 * self.count))
+        cumulated_count = 0
+        bucket = None
+        for bucket, bucket_count in sorted(iteritems(self.counts)):
+            cumulated_count += bucket_count
+            if cumulated_count >= rank:
+                break
+        return bucket
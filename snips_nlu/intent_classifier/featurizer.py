@@ -1,15 +1,9 @@
 from __future__ import division, unicode_literals
 
-from builtins import object, range
+from builtins import object
 
 import numpy as np
-import scipy.sparse as sp
 from future.utils import iteritems
-from sklearn.exceptions import NotFittedError
-from sklearn.feature_extraction.text import TfidfTransformer, TfidfVectorizer
-from sklearn.feature_selection import chi2
-from sklearn.utils.validation import check_is_fitted
-from snips_nlu_utils import normalize
 
 from snips_nlu.constants import (
     BUILTIN_ENTITY_PARSER, CUSTOM_ENTITY_PARSER, CUSTOM_ENTITY_PARSER_USAGE,
@@ -18,9 +12,13 @@ from snips_nlu.dataset import get_text_from_chunks
 from snips_nlu.entity_parser.builtin_entity_parser import (BuiltinEntityParser,
                                                            is_builtin_entity)
 from snips_nlu.entity_parser.custom_entity_parser import CustomEntityParser
+from snips_nlu.intent_classifier.inference import (
+    HashingTfidfVectorizer, InferenceTfidfVectorizer)
+from snips_nlu.instrumentation import (
+    FEATURIZATION, FEATURIZER_FITTING, instrumented)
 from snips_nlu.languages import get_default_sep
 from snips_nlu.pipeline.configs import FeaturizerConfig
-from snips_nlu.preprocessing import stem, tokenize_light
+from snips_nlu.preprocessing import normalize, stem, tokenize_light
 from snips_nlu.resources import (
     get_stop_words, get_word_cluster)
 from snips_nlu.slot_filler.features_utils import get_all_ngrams
@@ -34,8 +32,8 @@ class Featurizer(object):
         self.config = config
         self.language = language
         if tfidf_vectorizer is None:
-            tfidf_vectorizer = _get_tfidf_vectorizer(
-                self.language, sublinear_tf=self.config.sublinear_tf)
+            tfidf_vectorizer = _build_tfidf_vectorizer(self.language,
+                                                       self.config)
         self.tfidf_vectorizer = tfidf_vectorizer
         self.best_features = best_features
         self.unknown_words_replacement_string = \
@@ -46,16 +44,23 @@ class Featurizer(object):
 
     @property
     def fitted(self):
-        try:
-            check_is_fitted(self.tfidf_vectorizer, 'vocabulary_')
-            return True
-        except NotFittedError:
-            return False
+        if isinstance(self.tfidf_vectorizer, HashingTfidfVectorizer):
+            return self.tfidf_vectorizer.idf_ is not None
+        return hasattr(self.tfidf_vectorizer, "vocabulary_")
 
+    @instrumented(FEATURIZER_FITTING)
     def fit(self, dataset, utterances, classes):
+        from sklearn.feature_selection import chi2
+
         self.fit_builtin_entity_parser_if_needed(dataset)
         self.fit_custom_entity_parser_if_needed(dataset)
 
+        if not hasattr(self.tfidf_vectorizer, "fit_transform"):
+            # Persisted featurizers are loaded with an inference only
+            # vectorizer
+            self.tfidf_vectorizer = _build_tfidf_vectorizer(self.language,
+                                                            self.config)
+
         utterances_texts = (get_text_from_chunks(u[DATA]) for u in utterances)
         if not any(tokenize_light(q, self.language) for q in utterances_texts):
             return None
@@ -65,32 +70,41 @@ class Featurizer(object):
         X_train_tfidf = self.tfidf_vectorizer.fit_transform(
             preprocessed_utterances)
         # pylint: enable=C0103
-        features_idx = {self.tfidf_vectorizer.vocabulary_[word]: word for word
-                        in self.tfidf_vectorizer.vocabulary_}
+        if isinstance(self.tfidf_vectorizer, HashingTfidfVectorizer):
+            features_words = self.tfidf_vectorizer.get_buckets_words(
+                preprocessed_utterances)
+        else:
+            features_words = {
+                index: {word} for word, index
+                in iteritems(self.tfidf_vectorizer.vocabulary_)}
 
         stop_words = get_stop_words(self.language)
 
-        _, pval = chi2(X_train_tfidf, classes)
+        # The p-values of the empty hashing buckets are undefined
+        with np.errstate(divide="ignore", invalid="ignore"):
+            _, pval = chi2(X_train_tfidf, classes)
         self.best_features = [i for i, v in enumerate(pval) if
                               v < self.config.pvalue_threshold]
         if not self.best_features:
             self.best_features = [idx for idx, val in enumerate(pval) if
-                                  val == pval.min()]
+                                  val == np.nanmin(pval)]
 
         feature_names = {}
         for utterance_index in self.best_features:
             feature_names[utterance_index] = {
-                "word": features_idx[utterance_index],
+                "words": features_words[utterance_index],
                 "pval": pval[utterance_index]}
 
         for feat in feature_names:
-            if feature_names[feat]["word"] in stop_words:
+            if all(word in stop_words
+                   for word in feature_names[feat]["words"]):
                 if feature_names[feat]["pval"] > \
                         self.config.pvalue_threshold / 2.0:
                     self.best_features.remove(feat)
 
         return self
 
+    @instrumented(FEATURIZATION)
     def transform(self, utterances):
         preprocessed_utterances = self.preprocess_utterances(utterances)
         # pylint: disable=C0103
@@ -103,6 +117,15 @@ class Featurizer(object):
     def fit_transform(self, dataset, queries, y):
         return self.fit(dataset, queries, y).transform(queries)
 
+    def get_best_features_names(self):
+        """Returns the names of the selected features, which are either words
+        or hashing buckets"""
+        if isinstance(self.tfidf_vectorizer, HashingTfidfVectorizer):
+            return ["bucket_%s" % i for i in self.best_features]
+        words = {index: word for word, index
+                 in iteritems(self.tfidf_vectorizer.vocabulary_)}
+        return [words[i] for i in self.best_features]
+
     def preprocess_utterances(self, utterances):
         return [
             _preprocess_utterance(
@@ -140,14 +163,14 @@ class Featurizer(object):
 
     def to_dict(self):
         """Returns a json-serializable dict"""
-        if hasattr(self.tfidf_vectorizer, "vocabulary_"):
-            # pylint: # pylint: disable=W0212
-            vocab = {k: int(v) for k, v in
-                     iteritems(self.tfidf_vectorizer.vocabulary_)}
-            idf_diag = self.tfidf_vectorizer._tfidf._idf_diag.data.tolist()
-        else:
-            vocab = None
-            idf_diag = None
+        vocab = None
+        idf_diag = None
+        if self.fitted:
+            # Hashing vectorizers have no vocabulary
+            if hasattr(self.tfidf_vectorizer, "vocabulary_"):
+                vocab = {k: int(v) for k, v in
+                         iteritems(self.tfidf_vectorizer.vocabulary_)}
+            idf_diag = self.tfidf_vectorizer.idf_.tolist()
 
         tfidf_vectorizer = {
             "vocab": vocab,
@@ -172,7 +195,7 @@ class Featurizer(object):
         language = obj_dict["language_code"]
         config = FeaturizerConfig.from_dict(obj_dict["config"])
         tfidf_vectorizer = _deserialize_tfidf_vectorizer(
-            obj_dict["tfidf_vectorizer"], language, config.sublinear_tf)
+            obj_dict["tfidf_vectorizer"], language, config)
         self = cls(
             language=language,
             tfidf_vectorizer=tfidf_vectorizer,
@@ -231,7 +254,16 @@ def _preprocess_utterance(utterance, language, builtin_entity_parser,
     return features
 
 
+def _build_tfidf_vectorizer(language, config):
+    if config.num_hashing_buckets is not None:
+        return HashingTfidfVectorizer(language, config.num_hashing_buckets,
+                                      config.sublinear_tf)
+    return _get_tfidf_vectorizer(language, sublinear_tf=config.sublinear_tf)
+
+
 def _get_tfidf_vectorizer(language, sublinear_tf=False):
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
     return TfidfVectorizer(tokenizer=lambda x: tokenize_light(x, language),
                            sublinear_tf=sublinear_tf)
 
@@ -270,18 +302,13 @@ def _get_word_cluster_features(query_tokens, clusters_name, language):
     return cluster_features
 
 
-def _deserialize_tfidf_vectorizer(vectorizer_dict, language, sublinear_tf):
-    tfidf_vectorizer = _get_tfidf_vectorizer(language, sublinear_tf)
-    tfidf_transformer = TfidfTransformer()
+def _deserialize_tfidf_vectorizer(vectorizer_dict, language, config):
     vocab = vectorizer_dict["vocab"]
-    if vocab is not None:  # If the vectorizer has been fitted
-        tfidf_vectorizer.vocabulary_ = vocab
-        idf_diag_data = np.array(vectorizer_dict["idf_diag"])
-        idf_diag_shape = (len(idf_diag_data), len(idf_diag_data))
-        row = list(range(idf_diag_shape[0]))
-        col = list(range(idf_diag_shape[0]))
-        idf_diag = sp.csr_matrix((idf_diag_data, (row, col)),
-                                 shape=idf_diag_shape)
-        tfidf_transformer._idf_diag = idf_diag  # pylint: disable=W0212
-    tfidf_vectorizer._tfidf = tfidf_transformer  # pylint: disable=W0212
-    return tfidf_vectorizer
+    idf_diag = vectorizer_dict["idf_diag"]
+    if config.num_hashing_buckets is not None:
+        return HashingTfidfVectorizer(language, config.num_hashing_buckets,
+                                      config.sublinear_tf, idf_diag)
+    if vocab is None:  # The vectorizer has not been fitted
+        return _get_tfidf_vectorizer(language, config.sublinear_tf)
+    return InferenceTfidfVectorizer(language, vocab, idf_diag,
+                                    config.sublinear_tf)
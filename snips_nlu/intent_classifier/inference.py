@@ -0,0 +1,173 @@
+from __future__ import division, unicode_literals
+
+import zlib
+from abc import ABCMeta, abstractmethod
+from builtins import object
+
+import numpy as np
+from future.utils import with_metaclass
+
+from snips_nlu.preprocessing import tokenize_light
+
+
+class TfidfVectorizerBase(with_metaclass(ABCMeta, object)):
+    """Abstract TF-IDF vectorizer computing the same features as
+    :class:`sklearn.feature_extraction.text.TfidfVectorizer`, using
+    :func:`.tokenize_light` as tokenizer, without relying on scikit-learn"""
+
+    def __init__(self, language, idf=None, sublinear_tf=False):
+        self.language = language
+        self.idf_ = np.array(idf, dtype=np.float64) \
+            if idf is not None else None
+        self.sublinear_tf = sublinear_tf
+
+    @abstractmethod
+    def get_feature_index(self, word):
+        """Returns the index of the feature corresponding to *word*, or None
+        when the word is out of the vocabulary"""
+        pass
+
+    def transform(self, texts):
+        """Computes the l2-normalized TF-IDF features of *texts*
+
+        Returns:
+            :class:`scipy.sparse.csr_matrix`: The features of each text, of
+            shape (len(texts), n_features)
+        """
+        import scipy.sparse as sp
+
+        data = []
+        indices = []
+        indptr = [0]
+        for text in texts:
+            counts = dict()
+            for token in tokenize_light(text.lower(), self.language):
+                index = self.get_feature_index(token)
+                if index is not None:
+                    counts[index] = counts.get(index, 0) + 1
+            row_indices = sorted(counts)
+            row_data = np.array([counts[i] for i in row_indices],
+                                dtype=np.float64)
+            if self.sublinear_tf:
+                np.log(row_data, row_data)
+                row_data += 1
+            row_data *= self.idf_[row_indices]
+            norm = np.sqrt(np.dot(row_data, row_data))
+            if norm > 0:
+                row_data /= norm
+            data.append(row_data)
+            indices.extend(row_indices)
+            indptr.append(len(indices))
+        data = np.concatenate(data) if data else np.array([])
+        return sp.csr_matrix(
+            (data, np.array(indices, dtype=np.int32), indptr),
+            shape=(len(texts), len(self.idf_)))
+
+
+class InferenceTfidfVectorizer(TfidfVectorizerBase):
+    """Fitted TF-IDF vectorizer which only supports the transformation of
+    texts, and which is used to load persisted featurizers
+
+    Args:
+        language (str): Language of the texts
+        vocabulary (dict): Mapping between the words and their feature index
+        idf (list of float): Inverse document frequency of each feature
+        sublinear_tf (bool, optional): Whether or not the term frequencies are
+            replaced with 1 + log(tf). Defaults to False.
+    """
+
+    def __init__(self, language, vocabulary, idf, sublinear_tf=False):
+        super(InferenceTfidfVectorizer, self).__init__(
+            language, idf, sublinear_tf)
+        self.vocabulary_ = vocabulary
+
+    def get_feature_index(self, word):
+        return self.vocabulary_.get(word)
+
+
+class HashingTfidfVectorizer(TfidfVectorizerBase):
+    """TF-IDF vectorizer whose features are buckets of words, indexed by the
+    CRC32 hash of the words modulo the number of buckets
+
+    Contrary to a vocabulary, the memory used by the vectorizer and by its
+    serialization only depends on the number of buckets, at the cost of
+    collisions between words.
+
+    Args:
+        language (str): Language of the texts
+        num_buckets (int): Number of features
+        sublinear_tf (bool, optional): Whether or not the term frequencies are
+            replaced with 1 + log(tf). Defaults to False.
+        idf (list of float, optional): Inverse document frequency of each
+            bucket, when the vectorizer is already fitted
+    """
+
+    def __init__(self, language, num_buckets, sublinear_tf=False, idf=None):
+        super(HashingTfidfVectorizer, self).__init__(
+            language, idf, sublinear_tf)
+        self.num_buckets = num_buckets
+
+    def get_feature_index(self, word):
+        return (zlib.crc32(word.encode("utf8")) & 0xffffffff) \
+               % self.num_buckets
+
+    def get_buckets_words(self, texts):
+        """Returns a dict mapping the index of the non empty buckets to the
+        set of words of *texts* which they contain"""
+        buckets_words = dict()
+        for text in texts:
+            for token in tokenize_light(text.lower(), self.language):
+                buckets_words.setdefault(
+                    self.get_feature_index(token), set()).add(token)
+        return buckets_words
+
+    def fit(self, texts):
+        """Computes the smoothed inverse document frequency of each bucket,
+        as scikit-learn does"""
+        document_frequencies = np.zeros(self.num_buckets, dtype=np.float64)
+        for text in texts:
+            tokens = tokenize_light(text.lower(), self.language)
+            for bucket_index in set(self.get_feature_index(token)
+                                    for token in tokens):
+                document_frequencies[bucket_index] += 1
+        num_documents = len(texts)
+        self.idf_ = np.log((1 + num_documents) / (1 + document_frequencies))
+        self.idf_ += 1
+        return self
+
+    def fit_transform(self, texts):
+        return self.fit(texts).transform(texts)
+
+
+class InferenceLogRegClassifier(object):
+    """Fitted one-vs-rest logistic regression which only supports the
+    computation of decision scores, without relying on scikit-learn
+
+    It holds the weights of a fitted
+    :class:`sklearn.linear_model.SGDClassifier` and is used to load persisted
+    intent classifiers.
+
+    Args:
+        coef (list of list of float): Weights of the features, of shape
+            (n_classes, n_features), or (1, n_features) with two classes
+        intercept (list of float): Intercept of each class
+        t (float, optional): Number of weight updates performed during
+            training, kept for serialization purposes
+    """
+
+    def __init__(self, coef, intercept, t=None):
+        self.coef_ = np.array(coef, dtype=np.float64)
+        self.intercept_ = np.array(intercept, dtype=np.float64)
+        self.t_ = t
+
+    def decision_function(self, X):  # pylint: disable=C0103
+        """Computes the confidence score of each class for each sample of *X*
+
+        Returns:
+            :class:`numpy.ndarray`: Scores of shape (n_samples, n_classes), or
+            of shape (n_samples,) with two classes
+        """
+        scores = X.dot(self.coef_.T) + self.intercept_
+        if scores.shape[1] == 1:
+            return scores.ravel()
+        return scores
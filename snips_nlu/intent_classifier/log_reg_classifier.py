@@ -6,17 +6,21 @@ from builtins import range, str, zip
 from pathlib import Path
 
 import numpy as np
-from future.utils import iteritems
-from sklearn.linear_model import SGDClassifier
 
 from snips_nlu.constants import LANGUAGE
-from snips_nlu.dataset import validate_and_format_dataset
+from snips_nlu.dataset import (
+    get_dataset_fingerprints, validate_and_format_dataset)
+from snips_nlu.instrumentation import (
+    INTENT_CLASSIFICATION, INTENT_CLASSIFIER_FITTING, instrumented,
+    timed_stage)
 from snips_nlu.intent_classifier.featurizer import Featurizer
+from snips_nlu.intent_classifier.inference import InferenceLogRegClassifier
 from snips_nlu.intent_classifier.intent_classifier import IntentClassifier
 from snips_nlu.intent_classifier.log_reg_classifier_utils import (
     build_training_data, get_regularization_factor, text_to_utterance)
 from snips_nlu.pipeline.configs import LogRegIntentClassifierConfig
 from snips_nlu.result import intent_classification_result
+from snips_nlu.training_cache import cached_training_step
 from snips_nlu.utils import (
     DifferedLoggingMessage, check_persisted_path, check_random_state,
     fitted_required, json_string, log_elapsed_time)
@@ -64,40 +68,73 @@ class LogRegIntentClassifier(IntentClassifier):
         Returns:
             :class:`LogRegIntentClassifier`: The same instance, trained
         """
+        from sklearn.linear_model import SGDClassifier
+
         logger.debug("Fitting LogRegIntentClassifier...")
         dataset = validate_and_format_dataset(dataset)
         self.fit_builtin_entity_parser_if_needed(dataset)
         self.fit_custom_entity_parser_if_needed(dataset)
         language = dataset[LANGUAGE]
         random_state = check_random_state(self.config.random_seed)
+        dataset_fingerprints = get_dataset_fingerprints(dataset)
 
         data_augmentation_config = self.config.data_augmentation_config
-        utterances, classes, intent_list = build_training_data(
-            dataset, language, data_augmentation_config, random_state)
+        utterances, classes, intent_list = cached_training_step(
+            "intent_classifier_training_data",
+            [dataset_fingerprints, data_augmentation_config.to_dict()],
+            lambda: build_training_data(
+                dataset, language, data_augmentation_config, random_state),
+            language, self.config.random_seed, step=0,
+            random_state=random_state)
 
         self.intent_list = intent_list
         if len(self.intent_list) <= 1:
             return self
 
-        self.featurizer = Featurizer(
-            language,
-            data_augmentation_config.unknown_words_replacement_string,
-            self.config.featurizer_config,
-            builtin_entity_parser=self.builtin_entity_parser,
-            custom_entity_parser=self.custom_entity_parser
-        )
-        self.featurizer = self.featurizer.fit(dataset, utterances, classes)
+        def featurize():
+            featurizer = Featurizer(
+                language,
+                data_augmentation_config.unknown_words_replacement_string,
+                self.config.featurizer_config,
+                builtin_entity_parser=self.builtin_entity_parser,
+                custom_entity_parser=self.custom_entity_parser
+            )
+            featurizer = featurizer.fit(dataset, utterances, classes)
+            if featurizer is None:
+                return None, None
+            return featurizer, featurizer.transform(utterances)
+
+        # pylint: disable=C0103
+        self.featurizer, X = cached_training_step(
+            "intent_classifier_features",
+            [dataset_fingerprints, self.config.to_dict()], featurize,
+            language, self.config.random_seed, step=1,
+            random_state=random_state,
+            serialize=_serialize_featurizer_output,
+            deserialize=self._deserialize_featurizer_output)
+        # pylint: enable=C0103
         if self.featurizer is None:
             return self
 
-        X = self.featurizer.transform(utterances)  # pylint: disable=C0103
         alpha = get_regularization_factor(dataset)
         self.classifier = SGDClassifier(random_state=random_state,
                                         alpha=alpha, **LOG_REG_ARGS)
-        self.classifier.fit(X, classes)
+        with timed_stage(INTENT_CLASSIFIER_FITTING):
+            self.classifier.fit(X, classes)
         logger.debug("%s", DifferedLoggingMessage(self.log_best_features))
         return self
 
+    def _deserialize_featurizer_output(self, featurizer_output):
+        featurizer_dict, X = featurizer_output  # pylint: disable=C0103
+        if featurizer_dict is None:
+            return None, None
+        featurizer = Featurizer.from_dict(
+            featurizer_dict,
+            builtin_entity_parser=self.builtin_entity_parser,
+            custom_entity_parser=self.custom_entity_parser)
+        return featurizer, X
+
+    @instrumented(INTENT_CLASSIFICATION)
     @fitted_required
     def get_intent(self, text, intents_filter=None):
         """Performs intent classification on the provided *text*
@@ -145,8 +182,6 @@ class LogRegIntentClassifier(IntentClassifier):
         return None
 
     def _predict_proba(self, X, intents_filter):  # pylint: disable=C0103
-        self.classifier._check_proba()  # pylint: disable=W0212
-
         filtered_out_indexes = None
         if intents_filter is not None:
             filtered_out_indexes = [
@@ -205,16 +240,13 @@ class LogRegIntentClassifier(IntentClassifier):
         """
         config = LogRegIntentClassifierConfig.from_dict(unit_dict["config"])
         intent_classifier = cls(config=config, **shared)
-        sgd_classifier = None
+        classifier = None
         coeffs = unit_dict['coeffs']
         intercept = unit_dict['intercept']
         t_ = unit_dict["t_"]
         if coeffs is not None and intercept is not None:
-            sgd_classifier = SGDClassifier(**LOG_REG_ARGS)
-            sgd_classifier.coef_ = np.array(coeffs)
-            sgd_classifier.intercept_ = np.array(intercept)
-            sgd_classifier.t_ = t_
-        intent_classifier.classifier = sgd_classifier
+            classifier = InferenceLogRegClassifier(coeffs, intercept, t_)
+        intent_classifier.classifier = classifier
         intent_classifier.intent_list = unit_dict['intent_list']
         featurizer = unit_dict['featurizer']
         if featurizer is not None:
@@ -246,11 +278,7 @@ class LogRegIntentClassifier(IntentClassifier):
 
     def log_best_features(self, top_n=20):
         log = "Top {} features weights by intent:".format(top_n)
-        voca = {
-            v: k for k, v in
-            iteritems(self.featurizer.tfidf_vectorizer.vocabulary_)
-        }
-        features = [voca[i] for i in self.featurizer.best_features]
+        features = self.featurizer.get_best_features_names()
         for intent_ix in range(self.classifier.coef_.shape[0]):
             intent_name = self.intent_list[intent_ix]
             log += "\n\n\nFor intent {}\n".format(intent_name)
@@ -277,11 +305,7 @@ class LogRegIntentClassifier(IntentClassifier):
         top_n_activations_ix = np.unravel_index(
             top_n_activations_ix, activations.shape)
 
-        voca = {
-            v: k for k, v in
-            iteritems(self.featurizer.tfidf_vectorizer.vocabulary_)
-        }
-        features = [voca[i] for i in self.featurizer.best_features]
+        features = self.featurizer.get_best_features_names()
 
         features_intent_and_activation = [
             (self.intent_list[i], features[f], activations[i, f])
@@ -296,3 +320,10 @@ class LogRegIntentClassifier(IntentClassifier):
                 feature, intent, float(activation))
         log += "\n\n"
         return log
+
+
+def _serialize_featurizer_output(featurizer_output):
+    featurizer, X = featurizer_output  # pylint: disable=C0103
+    if featurizer is None:
+        return None, None
+    return featurizer.to_dict(), X
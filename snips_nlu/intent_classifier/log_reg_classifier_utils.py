@@ -14,6 +14,8 @@ from snips_nlu.constants import (DATA, ENTITIES, ENTITY, INTENTS, TEXT,
 from snips_nlu.data_augmentation import augment_utterances
 from snips_nlu.dataset import get_text_from_chunks
 from snips_nlu.entity_parser.builtin_entity_parser import is_builtin_entity
+from snips_nlu.instrumentation import (
+    INTENT_CLASSIFIER_DATA_BUILDING, instrumented)
 from snips_nlu.preprocessing import tokenize_light
 from snips_nlu.resources import get_noise
 
@@ -121,6 +123,7 @@ def get_dataset_specific_noise(dataset, language):
     return specific_noise
 
 
+@instrumented(INTENT_CLASSIFIER_DATA_BUILDING)
 def build_training_data(dataset, language, data_augmentation_config,
                         random_state):
     # Create class mapping
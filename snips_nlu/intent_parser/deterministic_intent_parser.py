@@ -8,7 +8,6 @@ from collections import defaultdict
 from pathlib import Path
 
 from future.utils import iteritems, iterkeys, itervalues
-from snips_nlu_utils import normalize
 
 from snips_nlu.constants import (
     BUILTIN_ENTITY_PARSER, CUSTOM_ENTITY_PARSER, DATA, END, ENTITIES, ENTITY,
@@ -16,9 +15,11 @@ from snips_nlu.constants import (
     START, TEXT, UTTERANCES)
 from snips_nlu.dataset import validate_and_format_dataset
 from snips_nlu.entity_parser.builtin_entity_parser import is_builtin_entity
+from snips_nlu.instrumentation import DETERMINISTIC_MATCHING, timed_stage
 from snips_nlu.intent_parser.intent_parser import IntentParser
 from snips_nlu.pipeline.configs import DeterministicIntentParserConfig
-from snips_nlu.preprocessing import normalize_token, tokenize, tokenize_light
+from snips_nlu.preprocessing import (
+    normalize, normalize_token, tokenize, tokenize_light)
 from snips_nlu.resources import get_stop_words
 from snips_nlu.result import (
     empty_result, intent_classification_result, parsing_result,
@@ -193,17 +194,19 @@ class DeterministicIntentParser(IntentParser):
         cleaned_text = self._preprocess_text(text)
         cleaned_processed_text = self._preprocess_text(processed_text)
 
-        for intent, regexes in iteritems(self.regexes_per_intent):
-            if intents is not None and intent not in intents:
-                continue
-            for regex in regexes:
-                res = self._get_matching_result(text, cleaned_processed_text,
-                                                regex, intent, ranges_mapping)
-                if res is None:
-                    res = self._get_matching_result(text, cleaned_text, regex,
-                                                    intent)
-                if res is not None:
-                    return res
+        with timed_stage(DETERMINISTIC_MATCHING):
+            for intent, regexes in iteritems(self.regexes_per_intent):
+                if intents is not None and intent not in intents:
+                    continue
+                for regex in regexes:
+                    res = self._get_matching_result(
+                        text, cleaned_processed_text, regex, intent,
+                        ranges_mapping)
+                    if res is None:
+                        res = self._get_matching_result(
+                            text, cleaned_text, regex, intent)
+                    if res is not None:
+                        return res
         return empty_result(text)
 
     def _preprocess_text(self, string):
@@ -12,6 +12,11 @@ class IntentParser(with_metaclass(ABCMeta, ProcessingUnit)):
     :class:`.SnipsNLUEngine`
     """
 
+    supports_incremental_fit = False
+    """Whether or not :meth:`fit` retrains, when *force_retrain* is False,
+    the sub units whose training data have changed. The NLU engine only
+    refits already fitted intent parsers which support it."""
+
     @abstractmethod
     def fit(self, dataset, force_retrain):
         """Fit the intent parser with a valid Snips dataset
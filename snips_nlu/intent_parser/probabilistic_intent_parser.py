@@ -9,8 +9,10 @@ from pathlib import Path
 
 from future.utils import iteritems, itervalues
 
-from snips_nlu.constants import INTENTS, RES_INTENT_NAME
-from snips_nlu.dataset import validate_and_format_dataset
+from snips_nlu.constants import ENTITIES, INTENTS, LANGUAGE, RES_INTENT_NAME
+from snips_nlu.dataset import (
+    extract_intent_entities, get_content_hash, get_dataset_fingerprints,
+    validate_and_format_dataset)
 from snips_nlu.intent_parser.intent_parser import IntentParser
 from snips_nlu.pipeline.configs import ProbabilisticIntentParserConfig
 from snips_nlu.pipeline.processing_unit import (build_processing_unit,
@@ -29,6 +31,7 @@ class ProbabilisticIntentParser(IntentParser):
 
     unit_name = "probabilistic_intent_parser"
     config_type = ProbabilisticIntentParserConfig
+    supports_incremental_fit = True
 
     # pylint:disable=line-too-long
     def __init__(self, config=None, **shared):
@@ -39,6 +42,8 @@ class ProbabilisticIntentParser(IntentParser):
         super(ProbabilisticIntentParser, self).__init__(config, **shared)
         self.intent_classifier = None
         self.slot_fillers = dict()
+        self.intent_classifier_fingerprint = None
+        self.slot_fillers_fingerprints = dict()
 
     # pylint:enable=line-too-long
 
@@ -59,8 +64,9 @@ class ProbabilisticIntentParser(IntentParser):
         Args:
             dataset (dict): A valid Snips dataset
             force_retrain (bool, optional): If *False*, will not retrain intent
-                classifier and slot fillers when they are already fitted.
-                Default to *True*.
+                classifier and slot fillers when they are already fitted and
+                when the parts of the dataset they depend on have not changed
+                since their last training. Default to *True*.
 
         Returns:
             :class:`ProbabilisticIntentParser`: The same instance, trained
@@ -70,6 +76,7 @@ class ProbabilisticIntentParser(IntentParser):
         self.fit_builtin_entity_parser_if_needed(dataset)
         self.fit_custom_entity_parser_if_needed(dataset)
         intents = list(dataset[INTENTS])
+        fingerprints = get_dataset_fingerprints(dataset)
         if self.intent_classifier is None:
             self.intent_classifier = build_processing_unit(
                 self.config.intent_classifier_config)
@@ -78,11 +85,25 @@ class ProbabilisticIntentParser(IntentParser):
         self.intent_classifier.custom_entity_parser = \
             self.custom_entity_parser
 
-        if force_retrain or not self.intent_classifier.fitted:
+        classifier_fingerprint = get_content_hash({
+            "dataset": fingerprints,
+            "config": self.config.intent_classifier_config.to_dict()
+        })
+        if force_retrain or not self.intent_classifier.fitted or _has_changed(
+                self.intent_classifier_fingerprint, classifier_fingerprint):
             self.intent_classifier.fit(dataset)
+        self.intent_classifier_fingerprint = classifier_fingerprint
 
         if self.slot_fillers is None:
             self.slot_fillers = dict()
+        # Slot fillers of intents which have been removed are dropped
+        self.slot_fillers = {
+            intent_name: slot_filler
+            for intent_name, slot_filler in iteritems(self.slot_fillers)
+            if intent_name in dataset[INTENTS]
+        }
+        intents_entities = extract_intent_entities(dataset)
+        slot_fillers_fingerprints = dict()
         slot_fillers_start = datetime.now()
         for intent_name in intents:
             # We need to copy the slot filler config as it may be mutated
@@ -90,14 +111,36 @@ class ProbabilisticIntentParser(IntentParser):
                 slot_filler_config = deepcopy(self.config.slot_filler_config)
                 self.slot_fillers[intent_name] = build_processing_unit(
                     slot_filler_config)
-            self.slot_fillers[intent_name].builtin_entity_parser = \
-                self.builtin_entity_parser
-            if force_retrain or not self.slot_fillers[intent_name].fitted:
-                self.slot_fillers[intent_name].fit(dataset, intent_name)
+            slot_filler = self.slot_fillers[intent_name]
+            slot_filler.builtin_entity_parser = self.builtin_entity_parser
+            slot_filler.custom_entity_parser = self.custom_entity_parser
+            fingerprint = self._get_slot_filler_fingerprint(
+                fingerprints, intent_name, intents_entities[intent_name])
+            if force_retrain or not slot_filler.fitted or _has_changed(
+                    self.slot_fillers_fingerprints.get(intent_name),
+                    fingerprint):
+                slot_filler.fit(dataset, intent_name)
+            else:
+                logger.debug("Reusing %s slot filler as its training data "
+                             "did not change", intent_name)
+            slot_fillers_fingerprints[intent_name] = fingerprint
+        self.slot_fillers_fingerprints = slot_fillers_fingerprints
         logger.debug("Fitted slot fillers in %s",
                      elapsed_since(slot_fillers_start))
         return self
 
+    def _get_slot_filler_fingerprint(self, dataset_fingerprints, intent_name,
+                                     intent_entities):
+        return get_content_hash({
+            LANGUAGE: dataset_fingerprints[LANGUAGE],
+            "intent": dataset_fingerprints[INTENTS][intent_name],
+            "entities": {
+                entity: dataset_fingerprints[ENTITIES].get(entity)
+                for entity in intent_entities
+            },
+            "config": self.config.slot_filler_config.to_dict()
+        })
+
     # pylint:enable=arguments-differ
 
     @log_result(logger, logging.DEBUG,
@@ -144,7 +187,8 @@ class ProbabilisticIntentParser(IntentParser):
             slot_filler.persist(path / slot_filler_name)
             slot_fillers.append({
                 "intent": intent,
-                "slot_filler_name": slot_filler_name
+                "slot_filler_name": slot_filler_name,
+                "fingerprint": self.slot_fillers_fingerprints.get(intent)
             })
 
         if self.intent_classifier is not None:
@@ -152,6 +196,8 @@ class ProbabilisticIntentParser(IntentParser):
 
         model = {
             "config": self.config.to_dict(),
+            "intent_classifier_fingerprint":
+                self.intent_classifier_fingerprint,
             "slot_fillers": slot_fillers
         }
         model_json = json_string(model)
@@ -184,12 +230,26 @@ class ProbabilisticIntentParser(IntentParser):
             classifier = load_processing_unit(intent_classifier_path, **shared)
 
         slot_fillers = dict()
+        slot_fillers_fingerprints = dict()
         for slot_filler_conf in model["slot_fillers"]:
             intent = slot_filler_conf["intent"]
             slot_filler_path = path / slot_filler_conf["slot_filler_name"]
             slot_filler = load_processing_unit(slot_filler_path, **shared)
             slot_fillers[intent] = slot_filler
+            fingerprint = slot_filler_conf.get("fingerprint")
+            if fingerprint is not None:
+                slot_fillers_fingerprints[intent] = fingerprint
 
         parser.intent_classifier = classifier
         parser.slot_fillers = slot_fillers
+        parser.intent_classifier_fingerprint = model.get(
+            "intent_classifier_fingerprint")
+        parser.slot_fillers_fingerprints = slot_fillers_fingerprints
         return parser
+
+
+def _has_changed(previous_fingerprint, fingerprint):
+    # When the previous fingerprint is unknown, the unit has been fitted
+    # outside of this parser and is assumed to be up to date
+    return previous_fingerprint is not None \
+           and previous_fingerprint != fingerprint
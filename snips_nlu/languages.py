@@ -3,8 +3,6 @@ from __future__ import unicode_literals
 import re
 import string
 
-from num2words import num2words
-
 _PUNCTUATION_REGEXES = dict()
 _NUM2WORDS_SUPPORT = dict()
 
@@ -36,6 +34,8 @@ def supports_num2words(language):
     global _NUM2WORDS_SUPPORT
 
     if language not in _NUM2WORDS_SUPPORT:
+        from num2words import num2words
+
         try:
             num2words(0, lang=language)
             _NUM2WORDS_SUPPORT[language] = True
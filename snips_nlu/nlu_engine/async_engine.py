@@ -0,0 +1,182 @@
+from __future__ import unicode_literals
+
+import asyncio
+import multiprocessing
+import sys
+from builtins import object, str
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from copy import deepcopy
+from functools import partial
+
+from future.utils import iteritems
+
+# Engines used by the worker processes, indexed by the id of their
+# AsyncSnipsNLUEngine wrapper. They are registered in the parent process
+# before the workers are forked, so that they do not need to be pickled.
+_PROCESS_ENGINES = dict()
+
+
+class AsyncSnipsNLUEngine(object):
+    """Asyncio wrapper around a fitted :class:`.SnipsNLUEngine`
+
+    The parsing is offloaded to an executor so that the event loop is never
+    blocked. Concurrent requests are coalesced into micro-batches, which are
+    parsed with :meth:`.SnipsNLUEngine.parse_batch`, and identical requests
+    which are pending or being parsed share the same parsing.
+
+    Args:
+        engine (:class:`.SnipsNLUEngine`): A fitted NLU engine
+        batch_window (float, optional): Maximum duration, in seconds, during
+            which requests are gathered before their batch is parsed.
+            Defaults to 0.002.
+        max_batch_size (int, optional): Number of distinct requests above
+            which a batch is parsed without waiting for the end of the
+            window. Defaults to 64.
+        num_processes (int, optional): If provided, batches are parsed in a
+            pool of processes forked from the current one, which requires a
+            platform supporting forking. By default, batches are parsed in a
+            single background thread.
+        executor (:class:`concurrent.futures.Executor`, optional): Executor in
+            which batches are parsed, instead of the default one. The engine
+            is passed to the executor along with each batch.
+        loop (:class:`asyncio.AbstractEventLoop`, optional): Event loop of the
+            requests. Defaults to the current event loop.
+
+    Example:
+
+        >>> async_engine = AsyncSnipsNLUEngine(engine)  # doctest: +SKIP
+        >>> result = await async_engine.parse("Turn on the lights")
+        ... # doctest: +SKIP
+    """
+
+    def __init__(self, engine, batch_window=0.002, max_batch_size=64,
+                 num_processes=None, executor=None, loop=None):
+        if num_processes is not None and executor is not None:
+            raise ValueError("num_processes and executor can not be both "
+                             "provided")
+        self.engine = engine
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self._loop = loop
+        self._owns_executor = executor is None
+        if num_processes is not None:
+            _PROCESS_ENGINES[id(self)] = engine
+            self._executor = _get_fork_process_pool(num_processes)
+            self._parse_batch = partial(_parse_batch_in_process, id(self))
+        else:
+            if executor is None:
+                executor = ThreadPoolExecutor(max_workers=1)
+            self._executor = executor
+            self._parse_batch = engine.parse_batch
+        # Waiting futures of each pending or in-flight request
+        self._waiters = dict()
+        self._pending_requests = OrderedDict()
+        self._flush_handle = None
+
+    def parse(self, text, intents=None):
+        """Performs intent parsing on the provided *text* asynchronously
+
+        Args:
+            text (str): Input
+            intents (str or list of str): If provided, reduces the scope of
+                intent parsing to the provided list of intents
+
+        Returns:
+            :class:`asyncio.Future`: A future resolving to the parsing
+            result. See :meth:`.SnipsNLUEngine.parse` for its format.
+
+        Raises:
+            TypeError: When input type is not unicode
+        """
+        if not isinstance(text, str):
+            raise TypeError("Expected unicode but received: %s" % type(text))
+        if isinstance(intents, str):
+            intents = [intents]
+        if intents is not None:
+            intents = tuple(sorted(set(intents)))
+
+        loop = self._get_loop()
+        waiter = asyncio.Future(loop=loop)
+        request = (text, intents)
+        waiters = self._waiters.get(request)
+        if waiters is not None:
+            waiters.append(waiter)
+            return waiter
+
+        self._waiters[request] = [waiter]
+        self._pending_requests[request] = None
+        if len(self._pending_requests) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(
+                self.batch_window, self._flush)
+        return waiter
+
+    def shutdown(self, wait=True):
+        """Cancels the pending requests and shuts the executor down, when it
+        was created by this wrapper"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        for request in self._pending_requests:
+            for waiter in self._waiters.pop(request):
+                waiter.cancel()
+        self._pending_requests = OrderedDict()
+        if self._owns_executor:
+            self._executor.shutdown(wait=wait)
+        _PROCESS_ENGINES.pop(id(self), None)
+
+    def _get_loop(self):
+        if self._loop is None:
+            self._loop = asyncio.get_event_loop()
+        return self._loop
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        requests_by_scope = OrderedDict()
+        for text, intents in self._pending_requests:
+            requests_by_scope.setdefault(intents, []).append(text)
+        self._pending_requests = OrderedDict()
+
+        loop = self._get_loop()
+        for intents, texts in iteritems(requests_by_scope):
+            scope = list(intents) if intents is not None else None
+            batch = loop.run_in_executor(
+                self._executor, self._parse_batch, texts, scope)
+            batch.add_done_callback(
+                partial(self._on_batch_parsed, texts, intents))
+
+    def _on_batch_parsed(self, texts, intents, batch):
+        requests_waiters = [self._waiters.pop((text, intents))
+                            for text in texts]
+        if batch.cancelled() or batch.exception() is not None:
+            for waiters in requests_waiters:
+                for waiter in waiters:
+                    if waiter.done():
+                        continue
+                    if batch.cancelled():
+                        waiter.cancel()
+                    else:
+                        waiter.set_exception(batch.exception())
+            return
+
+        for waiters, result in zip(requests_waiters, batch.result()):
+            for i, waiter in enumerate(waiters):
+                if waiter.done():
+                    continue
+                # Each caller gets its own copy of the result
+                waiter.set_result(result if i == 0 else deepcopy(result))
+
+
+def _parse_batch_in_process(engine_id, texts, intents):
+    return _PROCESS_ENGINES[engine_id].parse_batch(texts, intents)
+
+
+def _get_fork_process_pool(num_processes):
+    if sys.version_info >= (3, 7):
+        return ProcessPoolExecutor(
+            num_processes, mp_context=multiprocessing.get_context("fork"))
+    return ProcessPoolExecutor(num_processes)
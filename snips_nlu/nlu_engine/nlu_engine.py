@@ -3,25 +3,31 @@ from __future__ import unicode_literals
 import json
 import logging
 from builtins import str
-from collections import defaultdict
+from collections import Counter, defaultdict
+from copy import deepcopy
 from pathlib import Path
 
-from future.utils import iteritems
+from future.utils import iteritems, itervalues
 
 from snips_nlu.__about__ import __model_version__, __version__
 from snips_nlu.constants import (
     AUTOMATICALLY_EXTENSIBLE, BUILTIN_ENTITY_PARSER, CUSTOM_ENTITY_PARSER,
-    ENTITIES, ENTITY, ENTITY_KIND, LANGUAGE, RESOLVED_VALUE,
-    RES_ENTITY, RES_INTENT, RES_MATCH_RANGE,
-    RES_SLOTS, RES_VALUE)
+    DATA, ENTITIES, ENTITY, ENTITY_KIND, INTENTS, LANGUAGE, RESOLVED_VALUE,
+    RES_ENTITY, RES_INTENT, RES_MATCH_RANGE, RES_SLOTS, RES_VALUE, TEXT,
+    UTTERANCES)
 from snips_nlu.dataset import validate_and_format_dataset
 from snips_nlu.default_configs import DEFAULT_CONFIGS
 from snips_nlu.entity_parser import CustomEntityParser
 from snips_nlu.entity_parser.builtin_entity_parser import (
     BuiltinEntityParser, is_builtin_entity)
+from snips_nlu.instrumentation import (
+    PARSING, PERSISTING, SLOT_RESOLUTION, instrumented)
 from snips_nlu.pipeline.configs import NLUEngineConfig
 from snips_nlu.pipeline.processing_unit import (
     ProcessingUnit, build_processing_unit, load_processing_unit)
+from snips_nlu.preprocessing import (
+    MEMO_TABLE_SIZE, get_memo_tables, load_memo_tables, tokenize_light,
+    warm_memo_tables)
 from snips_nlu.resources import load_resources_from_dir, persist_resources
 from snips_nlu.result import (
     builtin_slot, custom_slot, empty_result, is_empty, parsing_result)
@@ -62,6 +68,7 @@ class SnipsNLUEngine(ProcessingUnit):
         self.intent_parsers = []
         """list of :class:`.IntentParser`"""
         self._dataset_metadata = None
+        self._vocabulary = []
 
     @property
     def fitted(self):
@@ -75,8 +82,12 @@ class SnipsNLUEngine(ProcessingUnit):
 
         Args:
             dataset (dict): A valid Snips dataset
-            force_retrain (bool, optional): If *False*, will not retrain intent
-                parsers when they are already fitted. Default to *True*.
+            force_retrain (bool, optional): If *False*, the intent parsers
+                which are already fitted are not retrained, except the ones
+                supporting incremental fitting, such as the
+                :class:`.ProbabilisticIntentParser`, whose sub units are
+                retrained when the parts of the dataset they depend on have
+                changed. Default to *True*.
 
         Returns:
             The same object, trained.
@@ -91,6 +102,8 @@ class SnipsNLUEngine(ProcessingUnit):
             else:
                 self.config = self.config_type()
 
+        self._vocabulary = _get_dataset_vocabulary(dataset)
+        warm_memo_tables(self._vocabulary, dataset[LANGUAGE])
         self.fit_builtin_entity_parser_if_needed(dataset)
         self.fit_custom_entity_parser_if_needed(dataset)
 
@@ -107,7 +120,8 @@ class SnipsNLUEngine(ProcessingUnit):
 
             recycled_parser.builtin_entity_parser = self.builtin_entity_parser
             recycled_parser.custom_entity_parser = self.custom_entity_parser
-            if force_retrain or not recycled_parser.fitted:
+            if force_retrain or not recycled_parser.fitted \
+                    or recycled_parser.supports_incremental_fit:
                 recycled_parser.fit(dataset, force_retrain)
             parsers.append(recycled_parser)
 
@@ -115,6 +129,7 @@ class SnipsNLUEngine(ProcessingUnit):
         return self
 
     @log_elapsed_time(logger, logging.DEBUG, "Parsed query in {elapsed_time}")
+    @instrumented(PARSING)
     @fitted_required
     def parse(self, text, intents=None):
         """Performs intent parsing on the provided *text* by calling its intent
@@ -148,6 +163,36 @@ class SnipsNLUEngine(ProcessingUnit):
                                   slots=resolved_slots)
         return empty_result(text)
 
+    @fitted_required
+    def parse_batch(self, texts, intents=None):
+        """Performs intent parsing on a batch of texts
+
+        Identical texts are parsed only once.
+
+        Args:
+            texts (list of str): Inputs
+            intents (str or list of str): If provided, reduces the scope of
+                intent parsing to the provided list of intents
+
+        Returns:
+            list of dict: The parsing results, in the same order as *texts*.
+            See :func:`.parsing_result` for the output format.
+
+        Raises:
+            NotTrained: When the nlu engine is not fitted
+            TypeError: When an input type is not unicode
+        """
+        parsed = dict()
+        results = []
+        for text in texts:
+            if text in parsed:
+                results.append(deepcopy(parsed[text]))
+            else:
+                parsed[text] = self.parse(text, intents)
+                results.append(parsed[text])
+        return results
+
+    @instrumented(SLOT_RESOLUTION)
     def resolve_slots(self, text, slots):
         builtin_scope = [slot[RES_ENTITY] for slot in slots
                          if is_builtin_entity(slot[RES_ENTITY])]
@@ -204,6 +249,7 @@ class SnipsNLUEngine(ProcessingUnit):
 
         return resolved_slots
 
+    @instrumented(PERSISTING)
     @check_persisted_path
     def persist(self, path):
         """Persist the NLU engine at the given directory path
@@ -260,16 +306,22 @@ class SnipsNLUEngine(ProcessingUnit):
             f.write(model_json)
 
         if self.fitted:
+            language = self._dataset_metadata["language_code"]
             required_resources = self.config.get_required_resources()
             if required_resources:
-                language = self._dataset_metadata["language_code"]
                 resources_path = directory_path / "resources"
                 resources_path.mkdir()
                 persist_resources(resources_path / language,
                                   required_resources, language)
 
+            memo_tables = get_memo_tables(self._vocabulary, language)
+            memo_tables_json = json_string(memo_tables)
+            memo_tables_path = directory_path / "memo_tables.json"
+            with memo_tables_path.open(mode="w") as f:
+                f.write(memo_tables_json)
+
     @classmethod
-    def from_path(cls, path, **shared):
+    def from_path(cls, path, lazy=False, **shared):
         """Load a :class:`SnipsNLUEngine` instance from a directory path
 
         The data at the given path must have been generated using
@@ -278,6 +330,10 @@ class SnipsNLUEngine(ProcessingUnit):
         Args:
             path (str): The path where the nlu engine is
                 stored.
+            lazy (bool, optional): If True, the shards of the custom entity
+                parser are only loaded the first time they are used, in which
+                case the directory must not be removed while the engine is in
+                use. Default to False.
         """
         directory_path = Path(path)
         model_path = directory_path / "nlu_engine.json"
@@ -294,11 +350,18 @@ class SnipsNLUEngine(ProcessingUnit):
                 % (model_version, __model_version__))
 
         dataset_metadata = model["dataset_metadata"]
+        vocabulary = []
         if dataset_metadata is not None:
             language = dataset_metadata["language_code"]
             resources_dir = directory_path / "resources" / language
             if resources_dir.is_dir():
                 load_resources_from_dir(resources_dir)
+            memo_tables_path = directory_path / "memo_tables.json"
+            if memo_tables_path.exists():
+                with memo_tables_path.open(encoding="utf8") as f:
+                    memo_tables = json.load(f)
+                load_memo_tables(memo_tables, language)
+                vocabulary = sorted(memo_tables["normalized_values"])
 
         if shared.get(BUILTIN_ENTITY_PARSER) is None:
             path = model["builtin_entity_parser"]
@@ -312,12 +375,13 @@ class SnipsNLUEngine(ProcessingUnit):
             if path is not None:
                 parser_path = directory_path / path
                 shared[CUSTOM_ENTITY_PARSER] = CustomEntityParser.from_path(
-                    parser_path)
+                    parser_path, lazy=lazy)
 
         nlu_engine = cls(config=model["config"], **shared)
 
         # pylint:disable=protected-access
         nlu_engine._dataset_metadata = dataset_metadata
+        nlu_engine._vocabulary = vocabulary
         # pylint:enable=protected-access
         intent_parsers = []
         for intent_parser_name in model["intent_parsers"]:
@@ -343,3 +407,23 @@ def _get_dataset_metadata(dataset):
         "entities": entities,
         "slot_name_mappings": slot_name_mappings
     }
+
+
+def _get_dataset_vocabulary(dataset):
+    """Returns the words of the dataset utterances, from the most frequent to
+    the least frequent one, capped to the size of the memo tables
+
+    Entity values, in the entities data and in the slots of the utterances,
+    are excluded so that the persisted memo tables do not grow with the
+    gazetteers.
+    """
+    language = dataset[LANGUAGE]
+    words_counts = Counter()
+    for intent in itervalues(dataset[INTENTS]):
+        for utterance in intent[UTTERANCES]:
+            for chunk in utterance[DATA]:
+                if ENTITY not in chunk:
+                    words_counts.update(tokenize_light(chunk[TEXT], language))
+    vocabulary = sorted(words_counts,
+                        key=lambda word: (-words_counts[word], word))
+    return vocabulary[:MEMO_TABLE_SIZE]
\ No newline at end of file
@@ -166,14 +166,19 @@ class FeaturizerConfig(Config):
             (vs linear) term frequencies, default is *False*.
         pvalue_threshold (float, optional): max pvalue for a feature to be
         kept in the feature selection
+        num_hashing_buckets (int, optional): If provided, words are hashed
+            into this number of features instead of being indexed in a
+            vocabulary, which bounds the size of the featurizer
     """
 
     def __init__(self, sublinear_tf=False, pvalue_threshold=0.4,
-                 word_clusters_name=None, use_stemming=False):
+                 word_clusters_name=None, use_stemming=False,
+                 num_hashing_buckets=None):
         self.sublinear_tf = sublinear_tf
         self.pvalue_threshold = pvalue_threshold
         self.word_clusters_name = word_clusters_name
         self.use_stemming = use_stemming
+        self.num_hashing_buckets = num_hashing_buckets
 
     def get_required_resources(self):
         if self.use_stemming:
@@ -191,12 +196,17 @@ class FeaturizerConfig(Config):
         }
 
     def to_dict(self):
-        return {
+        config_dict = {
             "sublinear_tf": self.sublinear_tf,
             "pvalue_threshold": self.pvalue_threshold,
             "word_clusters_name": self.word_clusters_name,
             "use_stemming": self.use_stemming
         }
+        # The option is only serialized when used, so that the default
+        # configuration and the persisted models are unchanged
+        if self.num_hashing_buckets is not None:
+            config_dict["num_hashing_buckets"] = self.num_hashing_buckets
+        return config_dict
 
     @classmethod
     def from_dict(cls, obj_dict):
@@ -42,6 +42,12 @@ class ProcessingUnit(with_metaclass(ABCMeta, object)):
         """Whether or not the processing unit has already been trained"""
         pass
 
+    def preload(self):
+        """Loads the state which is otherwise lazily loaded on first use, such
+        as models which are loaded or tables which are computed during the
+        first parsing"""
+        pass
+
     def fit_builtin_entity_parser_if_needed(self, dataset):
         # We only fit a builtin entity parser when the unit has already been
         # fitted or if the parser is none.
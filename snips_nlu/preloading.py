@@ -0,0 +1,68 @@
+from __future__ import unicode_literals
+
+import gc
+
+from future.utils import itervalues
+
+from snips_nlu.entity_parser.entity_parser import EntityParser
+from snips_nlu.pipeline.processing_unit import ProcessingUnit
+
+
+def preload_for_fork(engine=None):
+    """Prepares the current process to be forked into workers which share
+    its memory
+
+    The lazily loaded state of the engine, such as the gazetteer shards and
+    the CRF taggers, is loaded so that each worker does not load its own
+    copy. The garbage collector then runs a full collection and, on python
+    3.7+, moves all the tracked objects to a permanent generation which is
+    ignored by the collections happening in the workers. Otherwise, these
+    collections would write to the memory pages of every object loaded in
+    the parent process, forcing the operating system to copy them.
+
+    This function must be called right before forking. Objects created
+    afterwards in the parent process are not frozen.
+
+    Args:
+        engine (:class:`.SnipsNLUEngine`, optional): A fitted NLU engine,
+            which is going to be used in the workers
+
+    Example:
+
+        >>> from snips_nlu import SnipsNLUEngine, preload_for_fork
+        >>> engine = SnipsNLUEngine.from_path("path/to/engine")
+        ... # doctest: +SKIP
+        >>> preload_for_fork(engine)  # doctest: +SKIP
+        >>> # fork the workers
+    """
+    if engine is not None:
+        for component in _iter_components(engine):
+            component.preload()
+    gc.collect()
+    if hasattr(gc, "freeze"):
+        gc.freeze()
+
+
+def _iter_components(root):
+    """Yields the processing units and entity parsers reachable from *root*,
+    directly or through a list or a dict attribute, each one of them once"""
+    seen = set()
+    to_visit = [root]
+    while to_visit:
+        component = to_visit.pop()
+        if id(component) in seen:
+            continue
+        seen.add(id(component))
+        yield component
+        for value in itervalues(vars(component)):
+            if isinstance(value, dict):
+                values = list(itervalues(value))
+            elif isinstance(value, (list, tuple)):
+                values = value
+            else:
+                values = [value]
+            to_visit.extend(v for v in values if _is_component(v))
+
+
+def _is_component(obj):
+    return isinstance(obj, (ProcessingUnit, EntityParser))
@@ -1,15 +1,43 @@
 # coding=utf-8
 from __future__ import unicode_literals
 
-from builtins import object
+import itertools
+from array import array
+from builtins import object, range
 
+from future.utils import iteritems, itervalues
 from snips_nlu_utils import (
-    normalize, tokenize as _tokenize, tokenize_light as _tokenize_light)
+    normalize as _normalize, tokenize as _tokenize,
+    tokenize_light as _tokenize_light)
 
-from snips_nlu.resources import get_stems
+from snips_nlu.instrumentation import TOKENIZATION, instrumented
+from snips_nlu.resources import MissingResource, get_stems
+from snips_nlu.utils import LimitedSizeDict
+
+MEMO_TABLE_SIZE = 100000
+
+_NORMALIZED_VALUES = LimitedSizeDict(size_limit=MEMO_TABLE_SIZE)
+_STEMMED_VALUES = dict()
+
+
+def normalize(string):
+    """Normalizes the input string
+
+    Normalized values are memoized in a bounded table which is shared across
+    all the processing units.
+    """
+    normalized_string = _NORMALIZED_VALUES.get(string)
+    if normalized_string is None:
+        normalized_string = _normalize(string)
+        _NORMALIZED_VALUES[string] = normalized_string
+    return normalized_string
 
 
 def stem(string, language):
+    """Normalizes and stems the input string
+
+    Each word is stemmed with :func:`_stem`, whose values are memoized.
+    """
     normalized_string = normalize(string)
     tokens = tokenize_light(normalized_string, language)
     stemmed_tokens = [_stem(token, language) for token in tokens]
@@ -32,8 +60,86 @@ def normalize_token(token):
     return token.normalized_value
 
 
-def _stem(string, language):
-    return get_stems(language).get(string, string)
+def _stem(word, language):
+    """Stems a normalized word
+
+    Stemmed values are memoized in a bounded table per language, which is
+    shared across all the processing units.
+    """
+    stemmed_values = _get_stemmed_values(language)
+    stemmed_word = stemmed_values.get(word)
+    if stemmed_word is None:
+        stemmed_word = get_stems(language).get(word, word)
+        stemmed_values[word] = stemmed_word
+    return stemmed_word
+
+
+def _get_stemmed_values(language):
+    if language not in _STEMMED_VALUES:
+        _STEMMED_VALUES[language] = LimitedSizeDict(
+            size_limit=MEMO_TABLE_SIZE)
+    return _STEMMED_VALUES[language]
+
+
+def warm_memo_tables(words, language):
+    """Fills the normalization and stemming memo tables with the provided
+    words, typically the most frequent words of a training dataset
+
+    Only the first :data:`MEMO_TABLE_SIZE` words are used, as the following
+    ones would evict them from the tables. Stemming is skipped when no stems
+    are loaded for the language.
+    """
+    use_stemming = _has_stems(language)
+    for word in itertools.islice(words, MEMO_TABLE_SIZE):
+        normalized_word = normalize(word)
+        if use_stemming:
+            _stem(normalized_word, language)
+
+
+def get_memo_tables(words, language):
+    """Returns the normalized and stemmed values of the provided words, in
+    a json serializable format
+
+    Only the first :data:`MEMO_TABLE_SIZE` words are included, so that the
+    dumped tables neither depend on what else has been processed in the
+    current process nor exceed the size of the memo tables.
+    """
+    words = list(itertools.islice(words, MEMO_TABLE_SIZE))
+    normalized_values = {word: normalize(word) for word in words}
+    stemmed_values = dict()
+    if _has_stems(language):
+        stemmed_values = {
+            normalized_word: _stem(normalized_word, language)
+            for normalized_word in itervalues(normalized_values)
+        }
+    return {
+        "normalized_values": normalized_values,
+        "stemmed_values": stemmed_values
+    }
+
+
+def load_memo_tables(memo_tables, language):
+    """Loads memo tables which have been generated with
+    :func:`get_memo_tables`"""
+    for string, normalized_string in iteritems(
+            memo_tables["normalized_values"]):
+        _NORMALIZED_VALUES[string] = normalized_string
+    stemmed_values = _get_stemmed_values(language)
+    for string, stemmed_string in iteritems(memo_tables["stemmed_values"]):
+        stemmed_values[string] = stemmed_string
+
+
+def _has_stems(language):
+    try:
+        get_stems(language)
+        return True
+    except MissingResource:
+        return False
+
+
+def clear_memo_tables():
+    _NORMALIZED_VALUES.clear()
+    _STEMMED_VALUES.clear()
 
 
 class Token(object):
@@ -47,6 +153,9 @@ class Token(object):
         stemmed_value (str): Stemmed value of the tokenized string
     """
 
+    __slots__ = ("value", "start", "end", "normalized_value",
+                 "stemmed_value")
+
     def __init__(self, value, start, end, normalized_value=None,
                  stemmed_value=None):
         self.value = value
@@ -65,7 +174,130 @@ class Token(object):
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def __repr__(self):
+        return "Token(value=%r, start=%s, end=%s)" % (
+            self.value, self.start, self.end)
 
+
+class TokenSequence(object):
+    """Columnar sequence of tokens
+
+    Token values, start positions and end positions are stored in three
+    separate columns, which avoids the allocation of one :class:`Token` object
+    per token. Normalized and stemmed values are lazily computed and memoized
+    per index.
+
+    A :class:`TokenSequence` can still be used as a list of :class:`Token`:
+    indexing it with an integer, or iterating over it, builds the
+    corresponding :class:`Token` objects on the fly.
+
+    Attributes:
+        values (list of str): Tokenized strings
+        starts (array of int): Start positions of the tokens
+        ends (array of int): End positions of the tokens
+    """
+
+    __slots__ = ("values", "starts", "ends", "_normalized_values",
+                 "_stemmed_values")
+
+    def __init__(self, values=None, starts=None, ends=None):
+        self.values = list(values) if values is not None else []
+        self.starts = array("i", starts if starts is not None else [])
+        self.ends = array("i", ends if ends is not None else [])
+        if not len(self.values) == len(self.starts) == len(self.ends):
+            raise ValueError("Token values, starts and ends must have the "
+                             "same length")
+        self._normalized_values = None
+        self._stemmed_values = None
+
+    @classmethod
+    def from_tokens(cls, tokens):
+        """Builds a :class:`TokenSequence` from a list of :class:`Token`"""
+        if isinstance(tokens, TokenSequence):
+            return tokens
+        sequence = cls([t.value for t in tokens], [t.start for t in tokens],
+                       [t.end for t in tokens])
+        if any(t.normalized_value for t in tokens):
+            sequence._normalized_values = [t.normalized_value for t in tokens]
+        if any(t.stemmed_value for t in tokens):
+            sequence._stemmed_values = [t.stemmed_value for t in tokens]
+        return sequence
+
+    def append(self, value, start, end):
+        self.values.append(value)
+        self.starts.append(start)
+        self.ends.append(end)
+        if self._normalized_values is not None:
+            self._normalized_values.append(None)
+        if self._stemmed_values is not None:
+            self._stemmed_values.append(None)
+
+    def normalized_value(self, index):
+        """Normalized value of the token at position *index*"""
+        if self._normalized_values is None:
+            self._normalized_values = [None] * len(self.values)
+        value = self._normalized_values[index]
+        if value is None:
+            value = normalize(self.values[index])
+            self._normalized_values[index] = value
+        return value
+
+    def stemmed_value(self, index, language):
+        """Stemmed value of the token at position *index*"""
+        if self._stemmed_values is None:
+            self._stemmed_values = [None] * len(self.values)
+        value = self._stemmed_values[index]
+        if value is None:
+            value = _stem(self.normalized_value(index), language)
+            self._stemmed_values[index] = value
+        return value
+
+    def to_tokens(self):
+        """Returns the sequence as a list of :class:`Token`"""
+        return [self[i] for i in range(len(self))]
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            indexes = range(*item.indices(len(self)))
+            return TokenSequence([self.values[i] for i in indexes],
+                                 [self.starts[i] for i in indexes],
+                                 [self.ends[i] for i in indexes])
+        normalized_value = None
+        if self._normalized_values is not None:
+            normalized_value = self._normalized_values[item]
+        stemmed_value = None
+        if self._stemmed_values is not None:
+            stemmed_value = self._stemmed_values[item]
+        return Token(self.values[item], self.starts[item], self.ends[item],
+                     normalized_value, stemmed_value)
+
+    def __eq__(self, other):
+        if isinstance(other, TokenSequence):
+            return (self.values == other.values
+                    and self.starts == other.starts
+                    and self.ends == other.ends)
+        try:
+            if len(other) != len(self):
+                return False
+            return all(token == self[i] for i, token in enumerate(other))
+        except TypeError:
+            return False
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        return "TokenSequence(%r)" % self.to_tokens()
+
+
+@instrumented(TOKENIZATION)
 def tokenize(string, language):
     """Tokenizes the input
 
@@ -83,6 +315,18 @@ def tokenize(string, language):
     return tokens
 
 
+@instrumented(TOKENIZATION)
+def tokenize_sequence(string, language):
+    """Same behavior as :func:`tokenize` but returns a :class:`TokenSequence`
+        instead of a list of :class:`Token`"""
+    sequence = TokenSequence()
+    for token in _tokenize(string, language):
+        sequence.append(token["value"], token["char_range"]["start"],
+                        token["char_range"]["end"])
+    return sequence
+
+
+@instrumented(TOKENIZATION)
 def tokenize_light(string, language):
     """Same behavior as :func:`tokenize` but returns tokenized strings instead
         of :class:`Token` objects"""
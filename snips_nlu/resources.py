@@ -1,5 +1,6 @@
 from __future__ import unicode_literals
 
+import hashlib
 import json
 import shutil
 from builtins import next
@@ -7,7 +8,7 @@ from pathlib import Path
 
 from snips_nlu.constants import (
     CUSTOM_ENTITY_PARSER_USAGE, DATA_PATH, GAZETTEERS, NOISE, RESOURCES_DIR,
-    STEMS, STOP_WORDS, WORD_CLUSTERS)
+    RESOURCES_FINGERPRINT, STEMS, STOP_WORDS, WORD_CLUSTERS)
 from snips_nlu.entity_parser.custom_entity_parser import (
     CustomEntityParserUsage)
 from snips_nlu.utils import get_package_path, is_package, json_string
@@ -83,6 +84,8 @@ def load_resources_from_dir(resources_dir):
         NOISE: noise,
         STEMS: stems,
         RESOURCES_DIR: str(resources_dir),
+        RESOURCES_FINGERPRINT: hashlib.sha1(
+            json_string(metadata).encode("utf8")).hexdigest(),
     }
 
 
@@ -143,6 +146,12 @@ def get_resources_dir(language):
     return _get_resource(language, RESOURCES_DIR)
 
 
+def get_resources_fingerprint(language):
+    """Returns a hash of the metadata of the resources loaded for *language*,
+    which identifies their version and the resource files they contain"""
+    return _get_resource(language, RESOURCES_FINGERPRINT)
+
+
 def merge_required_resources(lhs, rhs):
     if not lhs:
         return dict() if rhs is None else rhs
@@ -274,13 +283,16 @@ def _load_word_clusters(word_clusters_dir, clusters_names):
         return dict()
 
     clusters = dict()
+    # Many words share the same cluster, which is stored only once
+    canonical_clusters = dict()
     for clusters_name in clusters_names:
         clusters_path = (word_clusters_dir / clusters_name).with_suffix(".txt")
         clusters[clusters_name] = dict()
         with clusters_path.open(encoding="utf8") as f:
             for line in f:
                 split = line.rstrip().split("\t")
-                clusters[clusters_name][split[0]] = split[1]
+                cluster = canonical_clusters.setdefault(split[1], split[1])
+                clusters[clusters_name][split[0]] = cluster
     return clusters
 
 
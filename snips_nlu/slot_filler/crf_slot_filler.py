@@ -4,6 +4,7 @@ import base64
 import json
 import logging
 import math
+import numbers
 import shutil
 import tempfile
 from builtins import range
@@ -11,23 +12,27 @@ from copy import copy
 from itertools import groupby, product
 from pathlib import Path
 
+import numpy as np
 from future.utils import iteritems
-from sklearn_crfsuite import CRF
 
 from snips_nlu.constants import (
-    DATA, END, ENTITY_KIND, LANGUAGE, RES_ENTITY,
+    DATA, END, ENTITIES, ENTITY_KIND, INTENTS, LANGUAGE, RES_ENTITY,
     RES_MATCH_RANGE, RES_VALUE, START)
 from snips_nlu.data_augmentation import augment_utterances
-from snips_nlu.dataset import validate_and_format_dataset
+from snips_nlu.dataset import (
+    extract_intent_entities, validate_and_format_dataset)
 from snips_nlu.entity_parser.builtin_entity_parser import is_builtin_entity
+from snips_nlu.instrumentation import (
+    CRF_DECODING, CRF_FEATURES_COMPUTATION, CRF_FEATURES_EXTRACTION,
+    CRF_TRAINING, instrumented, timed_stage)
 from snips_nlu.pipeline.configs import CRFSlotFillerConfig
-from snips_nlu.preprocessing import tokenize
+from snips_nlu.preprocessing import TokenSequence, tokenize_sequence
 from snips_nlu.slot_filler.crf_utils import (
     OUTSIDE, TAGS, TOKENS, positive_tagging, tag_name_to_slot_name,
     tags_to_preslots, tags_to_slots, utterance_to_sample)
-from snips_nlu.slot_filler.feature import TOKEN_NAME
 from snips_nlu.slot_filler.feature_factory import get_feature_factory
 from snips_nlu.slot_filler.slot_filler import SlotFiller
+from snips_nlu.training_cache import cached_training_step
 from snips_nlu.utils import (
     DifferedLoggingMessage, UnupdatableDict, check_persisted_path,
     check_random_state, fitted_required, get_slot_name_mapping, json_string,
@@ -54,7 +59,8 @@ class CRFSlotFiller(SlotFiller):
         if config is None:
             config = self.config_type()
         super(CRFSlotFiller, self).__init__(config, **shared)
-        self.crf_model = None
+        self._crf_model = None
+        self._labels_tables = None
         self.features_factories = [get_feature_factory(conf) for conf in
                                    self.config.feature_factory_configs]
         self._features = None
@@ -62,6 +68,16 @@ class CRFSlotFiller(SlotFiller):
         self.intent = None
         self.slot_name_mapping = None
 
+    @property
+    def crf_model(self):
+        """Underlying :class:`sklearn_crfsuite.CRF` model"""
+        return self._crf_model
+
+    @crf_model.setter
+    def crf_model(self, value):
+        self._crf_model = value
+        self._labels_tables = None
+
     @property
     def features(self):
         """List of :class:`.Feature` used by the CRF"""
@@ -85,11 +101,32 @@ class CRFSlotFiller(SlotFiller):
         prefix which depends on the :class:`.TaggingScheme` that is used
         (BIO by default).
         """
-        labels = []
-        if self.crf_model.tagger_ is not None:
-            labels = [_decode_tag(label) for label in
-                      self.crf_model.tagger_.labels()]
-        return labels
+        return list(self._get_labels_tables()[0])
+
+    def preload(self):
+        if self.crf_model is None:
+            return
+        self.features  # pylint:disable=pointless-statement
+        self._get_labels_tables()
+
+    def _get_labels_tables(self):
+        """Returns the list of CRF labels along with two dicts mapping the
+        encoded crfsuite labels to the CRF labels and conversely
+
+        The tables are computed once per CRF model, as decoding labels is
+        costly and done on every inference.
+        """
+        if self._labels_tables is None:
+            crf_labels = []
+            if self.crf_model.tagger_ is not None:
+                crf_labels = self.crf_model.tagger_.labels()
+            labels = [_decode_tag(crf_label) for crf_label in crf_labels]
+            self._labels_tables = (
+                labels,
+                dict(zip(crf_labels, labels)),
+                dict(zip(labels, crf_labels))
+            )
+        return self._labels_tables
 
     @property
     def fitted(self):
@@ -123,10 +160,16 @@ class CRFSlotFiller(SlotFiller):
             return self
 
         random_state = check_random_state(self.config.random_seed)
-        augmented_intent_utterances = augment_utterances(
-            dataset, self.intent, language=self.language,
-            random_state=random_state,
-            **self.config.data_augmentation_config.to_dict())
+        dataset_slice = _get_intent_dataset_slice(dataset, intent)
+        augmented_intent_utterances = cached_training_step(
+            "crf_augmented_utterances",
+            [dataset_slice, self.config.data_augmentation_config.to_dict()],
+            lambda: augment_utterances(
+                dataset, self.intent, language=self.language,
+                random_state=random_state,
+                **self.config.data_augmentation_config.to_dict()),
+            self.language, self.config.random_seed, step=0,
+            random_state=random_state)
 
         crf_samples = [
             utterance_to_sample(u[DATA], self.config.tagging_scheme,
@@ -136,20 +179,14 @@ class CRFSlotFiller(SlotFiller):
         for factory in self.features_factories:
             factory.fit(dataset, intent)
 
-        # Ensure that X, Y are safe and that the OUTSIDE label is learnt to
-        # avoid segfault at inference time
-        # pylint: disable=C0103
-        X = [self.compute_features(sample[TOKENS], drop_out=True)
-             for sample in crf_samples]
-        Y = [[tag for tag in sample[TAGS]] for sample in crf_samples]
-        X, Y = _ensure_safe(X, Y)
-
-        # ensure ascii tags
-        Y = [[_encode_tag(tag) for tag in y] for y in Y]
-
-        # pylint: enable=C0103
-        self.crf_model = _get_crf_model(self.config.crf_args)
-        self.crf_model.fit(X, Y)
+        self.crf_model = cached_training_step(
+            "crf_model", [dataset_slice, self.config.to_dict()],
+            lambda: self._fit_crf_model(crf_samples), self.language,
+            self.config.random_seed, step=1, random_state=random_state,
+            serialize=_crf_model_to_bytes,
+            deserialize=lambda data: _crf_model_from_bytes(
+                data, self.config.crf_args.get("model_filename")))
+        self._get_labels_tables()
 
         logger.debug(
             "Most relevant features for %s:\n%s", self.intent,
@@ -172,12 +209,14 @@ class CRFSlotFiller(SlotFiller):
             # Early return if the intent has no slots
             return []
 
-        tokens = tokenize(text, self.language)
+        tokens = tokenize_sequence(text, self.language)
         if not tokens:
             return []
         features = self.compute_features(tokens)
-        tags = [_decode_tag(tag) for tag in
-                self.crf_model.predict_single(features)]
+        _, decoding_table, _ = self._get_labels_tables()
+        with timed_stage(CRF_DECODING):
+            crf_labels = self.crf_model.predict_single(features)
+        tags = [decoding_table[crf_label] for crf_label in crf_labels]
         slots = tags_to_slots(text, tokens, tags, self.config.tagging_scheme,
                               self.slot_name_mapping)
 
@@ -191,15 +230,21 @@ class CRFSlotFiller(SlotFiller):
         tags = _replace_builtin_tags(tags, builtin_slots_names)
         return self._augment_slots(text, tokens, tags, builtin_slots_names)
 
+    @instrumented(CRF_FEATURES_COMPUTATION)
     def compute_features(self, tokens, drop_out=False):
         """Compute features on the provided tokens
 
         The *drop_out* parameters allows to activate drop out on features that
         have a positive drop out ratio. This should only be used during
         training.
+
+        The tokens can be passed either as a list of :class:`.Token` or as a
+        :class:`.TokenSequence`, which avoids materializing one object per
+        token.
         """
 
-        cache = [{TOKEN_NAME: token} for token in tokens]
+        tokens = TokenSequence.from_tokens(tokens)
+        cache = [dict() for _ in range(len(tokens))]
         features = []
         random_state = check_random_state(self.config.random_seed)
         for i in range(len(tokens)):
@@ -208,12 +253,124 @@ class CRFSlotFiller(SlotFiller):
                 f_drop_out = feature.drop_out
                 if drop_out and random_state.rand() < f_drop_out:
                     continue
-                value = feature.compute(i, cache)
+                value = feature.compute(i, cache, tokens)
                 if value is not None:
                     token_features[feature.name] = value
             features.append(token_features)
         return features
 
+    def compute_corpus_features(self, tokens_sequences, drop_out=False):
+        """Compute features on a whole corpus of token sequences
+
+        This returns the same features as calling :meth:`compute_features` on
+        each sequence, but each base feature is computed only once per token,
+        token-wise features are computed only once per distinct token value
+        of the corpus, and the drop out mask is drawn at once for the whole
+        corpus.
+        """
+        return list(self._iter_corpus_features(tokens_sequences, drop_out))
+
+    def _iter_corpus_features(self, tokens_sequences, drop_out):
+        features = self.features
+        base_features = dict()
+        for feature in features:
+            base_features.setdefault(feature.base_name, feature)
+        token_wise_values = {
+            base_name: dict() for base_name, feature in iteritems(base_features)
+            if feature.token_wise
+        }
+        lengths = [len(tokens) for tokens in tokens_sequences]
+        if drop_out:
+            drop_out_masks = self._get_drop_out_masks(lengths)
+        else:
+            drop_out_masks = [None for _ in lengths]
+
+        for tokens, drop_out_mask in zip(tokens_sequences, drop_out_masks):
+            tokens = TokenSequence.from_tokens(tokens)
+            columns = dict()
+            for base_name, feature in iteritems(base_features):
+                if feature.token_wise:
+                    memo = token_wise_values[base_name]
+                    column = []
+                    for i, value in enumerate(tokens.values):
+                        if value not in memo:
+                            memo[value] = feature.function(tokens, i)
+                        column.append(memo[value])
+                else:
+                    column = [feature.function(tokens, i)
+                              for i in range(len(tokens))]
+                columns[base_name] = column
+
+            sequence_features = []
+            for i in range(len(tokens)):
+                token_features = dict()
+                for feature_index, feature in enumerate(features):
+                    if drop_out_mask is not None \
+                            and drop_out_mask[i, feature_index]:
+                        continue
+                    index = i + feature.offset
+                    if not 0 <= index < len(tokens):
+                        continue
+                    value = columns[feature.base_name][index]
+                    if value is not None:
+                        token_features[feature.name] = value
+                sequence_features.append(token_features)
+            yield sequence_features
+
+    def _fit_crf_model(self, crf_samples):
+        """Trains the CRF model by streaming the samples to the crfsuite
+        trainer, without materializing the features of the whole corpus"""
+        crf_model = _get_crf_model(self.config.crf_args)
+        crf_model.modelfile.refresh()
+        trainer = crf_model._get_trainer()  # pylint:disable=protected-access
+        attributes = dict()
+        encoded_tags = dict()
+        has_items = False
+        has_labels = False
+        tokens_sequences = [sample[TOKENS] for sample in crf_samples]
+        features_sequences = self._iter_corpus_features(
+            tokens_sequences, drop_out=True)
+        with timed_stage(CRF_FEATURES_EXTRACTION):
+            for features, sample in zip(features_sequences, crf_samples):
+                items = [_to_crf_item(token_features, attributes)
+                         for token_features in features]
+                labels = []
+                for tag in sample[TAGS]:
+                    if tag not in encoded_tags:
+                        encoded_tags[tag] = _encode_tag(tag)
+                    labels.append(encoded_tags[tag])
+                trainer.append(items, labels)
+                has_items = has_items or bool(items)
+                has_labels = has_labels or bool(labels)
+
+        # Ensure that the OUTSIDE label is learnt to avoid segfault at
+        # inference time
+        if not has_items or not has_labels:
+            trainer.append([""], [_encode_tag(OUTSIDE)])
+        with timed_stage(CRF_TRAINING):
+            trainer.train(crf_model.modelfile.name, holdout=-1)
+        return crf_model
+
+    def _get_drop_out_masks(self, lengths):
+        # The masks are drawn in the same order as in compute_features, which
+        # draws one random number per token and per feature
+        drop_outs = np.array([feature.drop_out for feature in self.features])
+        random_seed = self.config.random_seed
+        random_state = check_random_state(random_seed)
+        if isinstance(random_seed, (numbers.Integral, np.integer)):
+            # The random state is re-seeded for each sequence in
+            # compute_features, hence all sequences share the same mask
+            mask = random_state.rand(max(lengths or [0]), len(drop_outs)) \
+                   < drop_outs
+            return [mask[:length] for length in lengths]
+        mask = random_state.rand(sum(lengths), len(drop_outs)) < drop_outs
+        masks = []
+        start = 0
+        for length in lengths:
+            masks.append(mask[start:start + length])
+            start += length
+        return masks
+
     @fitted_required
     def get_sequence_probability(self, tokens, labels):
         """Gives the joint probability of a sequence of tokens and CRF labels
@@ -237,13 +394,15 @@ class CRFSlotFiller(SlotFiller):
     def _get_sequence_probability(self, features, labels):
         # Use a default substitution label when a label was not seen during
         # training
-        substitution_label = OUTSIDE if OUTSIDE in self.labels else \
-            self.labels[0]
-        cleaned_labels = [
-            _encode_tag(substitution_label if l not in self.labels else l)
-            for l in labels]
-        self.crf_model.tagger_.set(features)
-        return self.crf_model.tagger_.probability(cleaned_labels)
+        crf_labels, _, encoding_table = self._get_labels_tables()
+        substitution_label = OUTSIDE if OUTSIDE in encoding_table else \
+            crf_labels[0]
+        encoded_substitution_label = encoding_table[substitution_label]
+        cleaned_labels = [encoding_table.get(l, encoded_substitution_label)
+                          for l in labels]
+        with timed_stage(CRF_DECODING):
+            self.crf_model.tagger_.set(features)
+            return self.crf_model.tagger_.probability(cleaned_labels)
 
     @fitted_required
     def log_weights(self):
@@ -253,6 +412,7 @@ class CRFSlotFiller(SlotFiller):
             return "No weights to display: intent '%s' has no slots" \
                    % self.intent
         log = ""
+        _, decoding_table, _ = self._get_labels_tables()
         transition_features = self.crf_model.transition_features_
         transition_features = sorted(
             iteritems(transition_features),
@@ -261,7 +421,7 @@ class CRFSlotFiller(SlotFiller):
         log += "\nTransition weights: \n\n"
         for (state_1, state_2), weight in transition_features:
             log += "\n%s %s: %s" % (
-                _decode_tag(state_1), _decode_tag(state_2), weight)
+                decoding_table[state_1], decoding_table[state_2], weight)
         feature_weights = self.crf_model.state_features_
         feature_weights = sorted(
             iteritems(feature_weights),
@@ -269,7 +429,7 @@ class CRFSlotFiller(SlotFiller):
             reverse=True)
         log += "\n\nFeature weights: \n\n"
         for (feat, tag), weight in feature_weights:
-            log += "\n%s %s: %s" % (feat, _decode_tag(tag), weight)
+            log += "\n%s %s: %s" % (feat, decoding_table[tag], weight)
         return log
 
     def _augment_slots(self, text, tokens, tags, builtin_slots_names):
@@ -388,6 +548,8 @@ class CRFSlotFiller(SlotFiller):
 
 
 def _get_crf_model(crf_args):
+    from sklearn_crfsuite import CRF
+
     model_filename = crf_args.get("model_filename", None)
     if model_filename is not None:
         directory = Path(model_filename).parent
@@ -397,6 +559,20 @@ def _get_crf_model(crf_args):
     return CRF(model_filename=model_filename, **crf_args)
 
 
+def _to_crf_item(token_features, attributes):
+    """Converts token features into a crfsuite item, a list of 'name:value'
+    attributes which are interned in *attributes*"""
+    item = []
+    for name, value in iteritems(token_features):
+        key = (name, value)
+        attribute = attributes.get(key)
+        if attribute is None:
+            attribute = "%s:%s" % (name, value)
+            attributes[key] = attribute
+        item.append(attribute)
+    return item
+
+
 def _replace_builtin_tags(tags, builtin_slot_names):
     new_tags = []
     for tag in tags:
@@ -424,11 +600,14 @@ def _filter_overlapping_builtins(builtin_entities, tokens, tags,
 
 
 def _spans_to_tokens_indexes(spans, tokens):
+    tokens = TokenSequence.from_tokens(tokens)
+    starts = tokens.starts
+    ends = tokens.ends
     tokens_indexes = []
     for span in spans:
         indexes = []
-        for i, token in enumerate(tokens):
-            if span[END] > token.start and span[START] < token.end:
+        for i in range(len(tokens)):
+            if span[END] > starts[i] and span[START] < ends[i]:
                 indexes.append(i)
         tokens_indexes.append(indexes)
     return tokens_indexes
@@ -506,6 +685,19 @@ def _decode_tag(tag):
 def _crf_model_from_path(crf_model_path):
     with crf_model_path.open(mode="rb") as f:
         crf_model_data = f.read()
+    return _crf_model_from_bytes(crf_model_data)
+
+
+def _crf_model_from_bytes(crf_model_data, model_filename=None):
+    from sklearn_crfsuite import CRF
+
+    if model_filename is not None:
+        directory = Path(model_filename).parent
+        if not directory.is_dir():
+            mkdir_p(directory)
+        with Path(model_filename).open(mode="wb") as f:
+            f.write(crf_model_data)
+        return CRF(model_filename=model_filename)
     with tempfile.NamedTemporaryFile(suffix=".crfsuite", prefix="model",
                                      delete=False) as f:
         f.write(crf_model_data)
@@ -514,20 +706,16 @@ def _crf_model_from_path(crf_model_path):
     return crf
 
 
-# pylint: disable=invalid-name
-def _ensure_safe(X, Y):
-    """Ensure that Y has at least one not empty label, otherwise the CRF model
-    does not contain any label and crashes at
-    Args:
-        X: features
-        Y: labels
+def _crf_model_to_bytes(crf_model):
+    with Path(crf_model.modelfile.name).open(mode="rb") as f:
+        return f.read()
 
-    Returns: (safe_X, safe_Y) a pair of safe features and labels
 
-    """
-    safe_X = list(X)
-    safe_Y = list(Y)
-    if not any(X) or not any(Y):
-        safe_X.append([""])  # empty feature
-        safe_Y.append([OUTSIDE])  # outside label
-    return safe_X, safe_Y
+def _get_intent_dataset_slice(dataset, intent):
+    intent_entities = extract_intent_entities(dataset)[intent]
+    return {
+        LANGUAGE: dataset[LANGUAGE],
+        INTENTS: {intent: dataset[INTENTS][intent]},
+        ENTITIES: {entity: dataset[ENTITIES][entity]
+                   for entity in sorted(intent_entities)}
+    }
@@ -1,10 +1,10 @@
 from __future__ import unicode_literals
 
-from builtins import range
+from builtins import range, zip
 from enum import Enum, unique
 
 from snips_nlu.constants import END, SLOT_NAME, START, TEXT
-from snips_nlu.preprocessing import Token, tokenize
+from snips_nlu.preprocessing import TokenSequence, tokenize_sequence
 from snips_nlu.result import unresolved_slot
 
 BEGINNING_PREFIX = "B-"
@@ -112,14 +112,16 @@ def end_of_bilou_slot(tags, i):
 def _tags_to_preslots(tags, tokens, is_start_of_slot, is_end_of_slot):
     slots = []
     current_slot_start = 0
+    starts = tokens.starts
+    ends = tokens.ends
     for i, tag in enumerate(tags):
         if is_start_of_slot(tags, i):
             current_slot_start = i
         if is_end_of_slot(tags, i):
             slots.append({
                 RANGE: {
-                    START: tokens[current_slot_start].start,
-                    END: tokens[i].end
+                    START: starts[current_slot_start],
+                    END: ends[i]
                 },
                 SLOT_NAME: tag_name_to_slot_name(tag)
             })
@@ -128,6 +130,7 @@ def _tags_to_preslots(tags, tokens, is_start_of_slot, is_end_of_slot):
 
 
 def tags_to_preslots(tokens, tags, tagging_scheme):
+    tokens = TokenSequence.from_tokens(tokens)
     if tagging_scheme == TaggingScheme.IO:
         slots = _tags_to_preslots(tags, tokens, start_of_io_slot,
                                   end_of_io_slot)
@@ -185,12 +188,13 @@ def negative_tagging(size):
 
 
 def utterance_to_sample(query_data, tagging_scheme, language):
-    tokens, tags = [], []
+    tokens, tags = TokenSequence(), []
     current_length = 0
     for chunk in query_data:
-        chunk_tokens = tokenize(chunk[TEXT], language)
-        tokens += [Token(t.value, current_length + t.start,
-                         current_length + t.end) for t in chunk_tokens]
+        chunk_tokens = tokenize_sequence(chunk[TEXT], language)
+        for value, start, end in zip(chunk_tokens.values, chunk_tokens.starts,
+                                     chunk_tokens.ends):
+            tokens.append(value, current_length + start, current_length + end)
         current_length += len(chunk[TEXT])
         if SLOT_NAME not in chunk:
             tags += negative_tagging(len(chunk_tokens))
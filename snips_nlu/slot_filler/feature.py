@@ -2,6 +2,8 @@ from __future__ import unicode_literals
 
 from builtins import object
 
+from snips_nlu.preprocessing import TokenSequence
+
 TOKEN_NAME = "token"
 
 
@@ -19,13 +21,17 @@ class Feature(object):
             the feature (e.g -1 for computing the feature on the previous word)
         drop_out (float, optional): Drop out to use when computing the
             feature during training
+        token_wise (bool, optional): Whether or not the feature value only
+            depends on the value of the considered token, in which case it can
+            be shared between all the occurrences of a token
 
     Note:
         The easiest way to add additional features to the existing ones is
         to create a :class:`.CRFFeatureFactory`
     """
 
-    def __init__(self, base_name, func, offset=0, drop_out=0):
+    def __init__(self, base_name, func, offset=0, drop_out=0,
+                 token_wise=False):
         if base_name == TOKEN_NAME:
             raise ValueError("'%s' name is reserved" % TOKEN_NAME)
         self.offset = offset
@@ -34,6 +40,7 @@ class Feature(object):
         self.base_name = base_name
         self.function = func
         self.drop_out = drop_out
+        self.token_wise = token_wise
 
     @property
     def name(self):
@@ -48,14 +55,21 @@ class Feature(object):
         self._name = _offset_name(value, self.offset)
         self._base_name = _offset_name(value, 0)
 
-    def compute(self, token_index, cache):
+    def compute(self, token_index, cache, tokens=None):
+        """Computes the feature on the token at position *token_index*
+
+        Values are memoized in *cache*, which contains one dict per token. The
+        tokens are either passed explicitly as a :class:`.TokenSequence` or
+        read from the cache, under the 'token' key.
+        """
         if not 0 <= (token_index + self.offset) < len(cache):
             return None
 
         if self.base_name in cache[token_index + self.offset]:
             return cache[token_index + self.offset][self.base_name]
 
-        tokens = [c["token"] for c in cache]
+        if tokens is None:
+            tokens = TokenSequence.from_tokens([c[TOKEN_NAME] for c in cache])
         value = self.function(tokens, token_index + self.offset)
         cache[token_index + self.offset][self.base_name] = value
         return value
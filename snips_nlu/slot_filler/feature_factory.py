@@ -1,7 +1,7 @@
 from __future__ import unicode_literals
 
 from abc import ABCMeta, abstractmethod
-from builtins import object, str
+from builtins import object, range, str
 
 from future.utils import with_metaclass
 from snips_nlu_ontology import get_supported_grammar_entities
@@ -16,7 +16,7 @@ from snips_nlu.entity_parser.builtin_entity_parser import is_builtin_entity
 from snips_nlu.entity_parser.custom_entity_parser import \
     CustomEntityParserUsage
 from snips_nlu.languages import get_default_sep
-from snips_nlu.preprocessing import Token, normalize_token, stem_token
+from snips_nlu.preprocessing import TokenSequence
 from snips_nlu.resources import get_gazetteer, get_word_clusters
 from snips_nlu.slot_filler.crf_utils import TaggingScheme, get_scheme_prefix
 from snips_nlu.slot_filler.feature import Feature
@@ -73,7 +73,14 @@ class CRFFeatureFactory(with_metaclass(ABCMeta, object)):
 
 
 class SingleFeatureFactory(with_metaclass(ABCMeta, CRFFeatureFactory)):
-    """A CRF feature factory which produces only one feature"""
+    """A CRF feature factory which produces only one feature
+
+    Factories whose feature only depends on the value of the considered token
+    should set *token_wise* to True, so that the feature is computed once per
+    distinct token when extracting the features of a whole corpus.
+    """
+
+    token_wise = False
 
     @property
     def feature_name(self):
@@ -91,7 +98,8 @@ class SingleFeatureFactory(with_metaclass(ABCMeta, CRFFeatureFactory)):
                 base_name=self.feature_name,
                 func=self.compute_feature,
                 offset=offset,
-                drop_out=self.drop_out) for offset in self.offsets
+                drop_out=self.drop_out,
+                token_wise=self.token_wise) for offset in self.offsets
         ]
 
 
@@ -99,9 +107,10 @@ class IsDigitFactory(SingleFeatureFactory):
     """Feature: is the considered token a digit?"""
 
     name = "is_digit"
+    token_wise = True
 
     def compute_feature(self, tokens, token_index):
-        return "1" if tokens[token_index].value.isdigit() else None
+        return "1" if tokens.values[token_index].isdigit() else None
 
 
 class IsFirstFactory(SingleFeatureFactory):
@@ -130,6 +139,7 @@ class PrefixFactory(SingleFeatureFactory):
     """
 
     name = "prefix"
+    token_wise = True
 
     @property
     def feature_name(self):
@@ -140,7 +150,7 @@ class PrefixFactory(SingleFeatureFactory):
         return self.args["prefix_size"]
 
     def compute_feature(self, tokens, token_index):
-        return get_word_chunk(normalize_token(tokens[token_index]),
+        return get_word_chunk(tokens.normalized_value(token_index),
                               self.prefix_size, 0)
 
 
@@ -152,6 +162,7 @@ class SuffixFactory(SingleFeatureFactory):
     """
 
     name = "suffix"
+    token_wise = True
 
     @property
     def feature_name(self):
@@ -162,8 +173,8 @@ class SuffixFactory(SingleFeatureFactory):
         return self.args["suffix_size"]
 
     def compute_feature(self, tokens, token_index):
-        return get_word_chunk(normalize_token(tokens[token_index]),
-                              self.suffix_size, len(tokens[token_index].value),
+        return get_word_chunk(tokens.normalized_value(token_index),
+                              self.suffix_size, len(tokens.values[token_index]),
                               reverse=True)
 
 
@@ -171,9 +182,10 @@ class LengthFactory(SingleFeatureFactory):
     """Feature: the length (characters) of the considered token"""
 
     name = "length"
+    token_wise = True
 
     def compute_feature(self, tokens, token_index):
-        return str(len(tokens[token_index].value))
+        return str(len(tokens.values[token_index]))
 
 
 class NgramFactory(SingleFeatureFactory):
@@ -233,18 +245,18 @@ class NgramFactory(SingleFeatureFactory):
         if 0 <= token_index < max_len and end <= max_len:
             if self.gazetteer is None:
                 if self.use_stemming:
-                    stems = (stem_token(t, self.language)
-                             for t in tokens[token_index:end])
+                    stems = (tokens.stemmed_value(i, self.language)
+                             for i in range(token_index, end))
                     return get_default_sep(self.language).join(stems)
-                normalized_values = (normalize_token(t)
-                                     for t in tokens[token_index:end])
+                normalized_values = (tokens.normalized_value(i)
+                                     for i in range(token_index, end))
                 return get_default_sep(self.language).join(normalized_values)
             words = []
-            for t in tokens[token_index:end]:
+            for i in range(token_index, end):
                 if self.use_stemming:
-                    value = stem_token(t, self.language)
+                    value = tokens.stemmed_value(i, self.language)
                 else:
-                    value = normalize_token(t)
+                    value = tokens.normalized_value(i)
                 words.append(value if value in self.gazetteer else "rare_word")
             return get_default_sep(self.language).join(words)
         return None
@@ -305,7 +317,7 @@ class ShapeNgramFactory(SingleFeatureFactory):
         end = token_index + self.n
         if 0 <= token_index < max_len and end <= max_len:
             return get_default_sep(self.language).join(
-                get_shape(t.value) for t in tokens[token_index:end])
+                get_shape(value) for value in tokens.values[token_index:end])
         return None
 
 
@@ -324,6 +336,7 @@ class WordClusterFactory(SingleFeatureFactory):
     """
 
     name = "word_cluster"
+    token_wise = True
 
     def __init__(self, factory_config):
         super(WordClusterFactory, self).__init__(factory_config)
@@ -353,9 +366,9 @@ class WordClusterFactory(SingleFeatureFactory):
 
     def compute_feature(self, tokens, token_index):
         if self.use_stemming:
-            value = stem_token(tokens[token_index], self.language)
+            value = tokens.stemmed_value(token_index, self.language)
         else:
-            value = normalize_token(tokens[token_index])
+            value = tokens.normalized_value(token_index)
         cluster = get_word_clusters(self.language)[self.cluster_name]
         return cluster.get(value, None)
 
@@ -421,19 +434,19 @@ class CustomEntityMatchFactory(CRFFeatureFactory):
         return self
 
     def _transform(self, tokens):
+        tokens = TokenSequence.from_tokens(tokens)
         if self.use_stemming:
-            light_tokens = (stem_token(t, self.language) for t in tokens)
+            light_tokens = (tokens.stemmed_value(i, self.language)
+                            for i in range(len(tokens)))
         else:
-            light_tokens = (normalize_token(t) for t in tokens)
+            light_tokens = (tokens.normalized_value(i)
+                            for i in range(len(tokens)))
         current_index = 0
-        transformed_tokens = []
+        transformed_tokens = TokenSequence()
         for light_token in light_tokens:
-            transformed_token = Token(
-                value=light_token,
-                start=current_index,
-                end=current_index + len(light_token))
-            transformed_tokens.append(transformed_token)
-            current_index = transformed_token.end + 1
+            end = current_index + len(light_token)
+            transformed_tokens.append(light_token, current_index, end)
+            current_index = end + 1
         return transformed_tokens
 
     def build_features(self, builtin_entity_parser=None,
@@ -456,16 +469,18 @@ class CustomEntityMatchFactory(CRFFeatureFactory):
         def entity_match(tokens, token_index):
             transformed_tokens = self._transform(tokens)
             text = initial_string_from_tokens(transformed_tokens)
-            token_start = transformed_tokens[token_index].start
-            token_end = transformed_tokens[token_index].end
+            starts = transformed_tokens.starts
+            ends = transformed_tokens.ends
+            token_start = starts[token_index]
+            token_end = ends[token_index]
             custom_entities = custom_entity_parser.parse(
                 text, scope=[entity], use_cache=True)
             custom_entities = [ent for ent in custom_entities
                                if entity_filter(ent, token_start, token_end)]
             for ent in custom_entities:
                 indexes = []
-                for index, token in enumerate(transformed_tokens):
-                    if entity_filter(ent, token.start, token.end):
+                for index in range(len(transformed_tokens)):
+                    if entity_filter(ent, starts[index], ends[index]):
                         indexes.append(index)
                 return get_scheme_prefix(token_index, indexes,
                                          self.tagging_scheme)
@@ -543,8 +558,10 @@ class BuiltinEntityMatchFactory(CRFFeatureFactory):
 
         def builtin_entity_match(tokens, token_index):
             text = initial_string_from_tokens(tokens)
-            start = tokens[token_index].start
-            end = tokens[token_index].end
+            starts = tokens.starts
+            ends = tokens.ends
+            start = starts[token_index]
+            end = ends[token_index]
 
             builtin_entities = builtin_entity_parser.parse(
                 text, scope=[builtin_entity], use_cache=True)
@@ -554,9 +571,9 @@ class BuiltinEntityMatchFactory(CRFFeatureFactory):
                 entity_start = ent[RES_MATCH_RANGE][START]
                 entity_end = ent[RES_MATCH_RANGE][END]
                 indexes = []
-                for index, token in enumerate(tokens):
-                    if (entity_start <= token.start < entity_end) \
-                            and (entity_start < token.end <= entity_end):
+                for index in range(len(tokens)):
+                    if (entity_start <= starts[index] < entity_end) \
+                            and (entity_start < ends[index] <= entity_end):
                         indexes.append(index)
                 return get_scheme_prefix(token_index, indexes,
                                          self.tagging_scheme)
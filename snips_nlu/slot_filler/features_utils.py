@@ -1,10 +1,12 @@
 from __future__ import unicode_literals
 
+from builtins import zip
 from copy import deepcopy
 
 from snips_nlu_utils import compute_all_ngrams
 
 from snips_nlu.constants import (END, RES_MATCH_RANGE, START)
+from snips_nlu.preprocessing import TokenSequence
 from snips_nlu.utils import LimitedSizeDict
 
 _NGRAMS_CACHE = LimitedSizeDict(size_limit=1000)
@@ -31,13 +33,14 @@ def get_word_chunk(word, chunk_size, chunk_start, reverse=False):
 
 
 def initial_string_from_tokens(tokens):
+    tokens = TokenSequence.from_tokens(tokens)
     current_index = 0
     s = ""
-    for t in tokens:
-        if t.start > current_index:
-            s += " " * (t.start - current_index)
-        s += t.value
-        current_index = t.end
+    for value, start, end in zip(tokens.values, tokens.starts, tokens.ends):
+        if start > current_index:
+            s += " " * (start - current_index)
+        s += value
+        current_index = end
     return s
 
 
@@ -2,11 +2,12 @@
 from __future__ import unicode_literals
 
 import itertools
+import multiprocessing
+import os
 import re
 from builtins import range, str, zip
 
 from future.utils import iteritems
-from num2words import num2words
 from snips_nlu_utils import normalize
 
 from snips_nlu.constants import (
@@ -15,6 +16,7 @@ from snips_nlu.constants import (
 from snips_nlu.languages import (
     get_default_sep, get_punctuation_regex, supports_num2words)
 from snips_nlu.preprocessing import tokenize_light
+from snips_nlu.utils import LimitedSizeDict
 
 AND_UTTERANCES = {
     LANGUAGE_EN: ["and", "&"],
@@ -32,6 +34,17 @@ AND_REGEXES = {
 
 MAX_ENTITY_VARIATIONS = 10
 
+VARIATIONS_CACHE_SIZE = 100000
+
+# Minimum number of strings for which variations are computed in parallel
+PARALLEL_VARIATIONS_THRESHOLD = 1000
+
+_VARIATIONS_CACHE = LimitedSizeDict(size_limit=VARIATIONS_CACHE_SIZE)
+
+# Builtin entity parser used by the worker processes. It is set in the parent
+# process right before the workers are forked, as it cannot be pickled.
+_WORKERS_BUILTIN_ENTITY_PARSER = None
+
 
 def build_variated_query(string, ranges_and_utterances):
     variated_string = ""
@@ -105,6 +118,8 @@ def digit_value(number_entity):
 
 
 def alphabetic_value(number_entity, language):
+    from num2words import num2words
+
     value = number_entity[ENTITY][VALUE]
     if value != int(value):  # num2words does not handle floats correctly
         return None
@@ -156,6 +171,93 @@ def flatten(results):
 
 
 def get_string_variations(string, language, builtin_entity_parser):
+    """Returns the variations of *string*, as a frozenset
+
+    Variations are memoized per string, language and builtin entity parser.
+    """
+    cache_key = (string, language, builtin_entity_parser)
+    variations = _VARIATIONS_CACHE.get(cache_key)
+    if variations is None:
+        variations = frozenset(_get_string_variations(
+            string, language, builtin_entity_parser))
+        _VARIATIONS_CACHE[cache_key] = variations
+    return variations
+
+
+def clear_string_variations_cache():
+    _VARIATIONS_CACHE.clear()
+
+
+def warm_string_variations(strings, language, builtin_entity_parser,
+                           n_jobs=1):
+    """Computes the variations of *strings*
+
+    When *n_jobs* is greater than 1 and there are enough strings to variate,
+    the computation is distributed over *n_jobs* forked processes.
+
+    Returns:
+        dict: Mapping between each string and its variations, as a frozenset.
+        The variations cache is only filled once all of them are computed,
+        so the returned mapping remains complete even when the cache evicts
+        some of its entries.
+    """
+    variations = dict()
+    strings_to_variate = []
+    for string in set(strings):
+        cached_variations = _VARIATIONS_CACHE.get(
+            (string, language, builtin_entity_parser))
+        if cached_variations is None:
+            strings_to_variate.append(string)
+        else:
+            variations[string] = cached_variations
+
+    if n_jobs <= 1 or not hasattr(os, "fork") \
+            or len(strings_to_variate) < PARALLEL_VARIATIONS_THRESHOLD:
+        computed_variations = [
+            _get_string_variations(string, language, builtin_entity_parser)
+            for string in strings_to_variate]
+    else:
+        computed_variations = _compute_variations_in_parallel(
+            strings_to_variate, language, builtin_entity_parser, n_jobs)
+
+    for string, string_variations in zip(strings_to_variate,
+                                         computed_variations):
+        variations[string] = frozenset(string_variations)
+    for string in strings_to_variate:
+        _VARIATIONS_CACHE[(string, language, builtin_entity_parser)] = \
+            variations[string]
+    return variations
+
+
+def _compute_variations_in_parallel(strings, language, builtin_entity_parser,
+                                    n_jobs):
+    global _WORKERS_BUILTIN_ENTITY_PARSER  # pylint:disable=global-statement
+    _WORKERS_BUILTIN_ENTITY_PARSER = builtin_entity_parser
+    try:
+        if hasattr(multiprocessing, "get_context"):
+            pool = multiprocessing.get_context("fork").Pool(n_jobs)
+        else:
+            pool = multiprocessing.Pool(n_jobs)
+        try:
+            chunk_size = max(1, len(strings) // (4 * n_jobs))
+            return pool.map(
+                _compute_string_variations,
+                ((string, language) for string in strings),
+                chunksize=chunk_size)
+        finally:
+            pool.close()
+            pool.join()
+    finally:
+        _WORKERS_BUILTIN_ENTITY_PARSER = None
+
+
+def _compute_string_variations(args):
+    string, language = args
+    return list(_get_string_variations(
+        string, language, _WORKERS_BUILTIN_ENTITY_PARSER))
+
+
+def _get_string_variations(string, language, builtin_entity_parser):
     variations = {string}
     variations.update(flatten(case_variations(v) for v in variations))
     variations.update(flatten(normalization_variations(v) for v in variations))
@@ -0,0 +1,86 @@
+from __future__ import unicode_literals
+
+from unittest import skipIf
+
+from mock import MagicMock
+
+from snips_nlu import SnipsNLUEngine
+from snips_nlu.tests.utils import BEVERAGE_DATASET, SnipsTest
+
+try:
+    import asyncio
+    from snips_nlu.nlu_engine.async_engine import AsyncSnipsNLUEngine
+except ImportError:  # python 2
+    asyncio = None
+
+
+@skipIf(asyncio is None, "asyncio is not available")
+class TestAsyncSnipsNLUEngine(SnipsTest):
+    def setUp(self):
+        super(TestAsyncSnipsNLUEngine, self).setUp()
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+        super(TestAsyncSnipsNLUEngine, self).tearDown()
+
+    def test_should_parse_like_engine(self):
+        # Given
+        engine = SnipsNLUEngine().fit(BEVERAGE_DATASET)
+        async_engine = AsyncSnipsNLUEngine(engine, loop=self.loop)
+        texts = ["make me two cups of tea", "I want a hot coffee"]
+
+        # When
+        results = self.loop.run_until_complete(
+            asyncio.gather(*[async_engine.parse(text) for text in texts]))
+        async_engine.shutdown()
+
+        # Then
+        expected_results = [engine.parse(text) for text in texts]
+        self.assertListEqual(expected_results, results)
+
+    def test_should_coalesce_and_deduplicate_requests(self):
+        # Given
+        engine = MagicMock()
+        engine.parse_batch.side_effect = lambda texts, intents: [
+            {"input": text, "intents": intents} for text in texts]
+        async_engine = AsyncSnipsNLUEngine(engine, batch_window=0.01,
+                                           loop=self.loop)
+
+        # When
+        futures = [
+            async_engine.parse("foo"),
+            async_engine.parse("bar"),
+            async_engine.parse("foo"),
+            async_engine.parse("foo", intents="intent1"),
+        ]
+        results = self.loop.run_until_complete(asyncio.gather(*futures))
+        async_engine.shutdown()
+
+        # Then
+        self.assertEqual(2, engine.parse_batch.call_count)
+        self.assertListEqual(
+            [["foo", "bar"], None],
+            list(engine.parse_batch.call_args_list[0][0]))
+        self.assertListEqual(
+            [["foo"], ["intent1"]],
+            list(engine.parse_batch.call_args_list[1][0]))
+        expected_results = [
+            {"input": "foo", "intents": None},
+            {"input": "bar", "intents": None},
+            {"input": "foo", "intents": None},
+            {"input": "foo", "intents": ["intent1"]},
+        ]
+        self.assertListEqual(expected_results, results)
+        self.assertIsNot(results[0], results[2])
+
+    def test_should_propagate_parsing_errors(self):
+        # Given
+        engine = MagicMock()
+        engine.parse_batch.side_effect = ValueError("parsing error")
+        async_engine = AsyncSnipsNLUEngine(engine, loop=self.loop)
+
+        # When / Then
+        with self.assertRaises(ValueError):
+            self.loop.run_until_complete(async_engine.parse("foo"))
+        async_engine.shutdown()
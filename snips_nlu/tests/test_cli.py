@@ -1,12 +1,28 @@
 # coding=utf-8
 from __future__ import unicode_literals
 
+import json
 import shutil
 import tempfile
 
+from mock import MagicMock
+
 from snips_nlu import SnipsNLUEngine
-from snips_nlu.cli import cross_val_metrics, parse, train, train_test_metrics
+from snips_nlu.cli.bench import (
+    _measure_latencies, bench, bench_import, get_benchmark_queries)
+from snips_nlu.cli.bench_training import bench_training
+from snips_nlu.cli.generate_dataset import generate_synthetic_data
+from snips_nlu.cli.inference import parse, parse_file
+from snips_nlu.cli.metrics import cross_val_metrics, train_test_metrics
+from snips_nlu.cli.training import train
+from snips_nlu.instrumentation import CRF_TRAINING, PERSISTING
+from snips_nlu.pipeline.configs import (
+    CRFSlotFillerConfig, DeterministicIntentParserConfig,
+    LogRegIntentClassifierConfig, NLUEngineConfig,
+    ProbabilisticIntentParserConfig)
+from snips_nlu.result import is_empty
 from snips_nlu.tests.utils import BEVERAGE_DATASET_PATH, SnipsTest, TEST_PATH
+from snips_nlu.utils import json_string
 
 
 def mk_sys_argv(args):
@@ -53,6 +69,34 @@ class TestCLI(SnipsTest):
         with self.fail_if_exception("Failed to parse using CLI script"):
             parse(str(self.tmp_file_path), "Make me two cups of coffee")
 
+    def test_parse_file(self):
+        # Given
+        train(BEVERAGE_DATASET_PATH, str(self.tmp_file_path), config_path=None,
+              verbose=False)
+        queries = [
+            {"input": "Make me two cups of coffee"},
+            {"input": "I want a hot tea", "intents": ["MakeTea"]},
+            {"input": "Make me two cups of coffee", "intents": "MakeTea"},
+        ] * 3
+        queries_path = self.fixture_dir / "queries.jsonl"
+        with queries_path.open(mode="w", encoding="utf8") as f:
+            for query in queries:
+                f.write(json_string(query, indent=None))
+                f.write("\n")
+        results_path = self.fixture_dir / "results.jsonl"
+
+        # When
+        parse_file(str(self.tmp_file_path), str(queries_path),
+                   str(results_path), num_workers=2, batch_size=2)
+
+        # Then
+        with results_path.open(encoding="utf8") as f:
+            results = [json.loads(line) for line in f]
+        engine = SnipsNLUEngine.from_path(self.tmp_file_path)
+        expected_results = [engine.parse(query["input"], query.get("intents"))
+                            for query in queries]
+        self.assertListEqual(expected_results, results)
+
     def test_cross_val_metrics(self):
         # Given / When
         cross_val_metrics(str(BEVERAGE_DATASET_PATH), str(self.tmp_file_path))
@@ -61,6 +105,37 @@ class TestCLI(SnipsTest):
         if not self.tmp_file_path.exists():
             self.fail("No metrics found")
 
+    def test_cross_val_metrics_should_not_depend_on_the_number_of_jobs(self):
+        # Given
+        config = NLUEngineConfig([
+            DeterministicIntentParserConfig(),
+            ProbabilisticIntentParserConfig(
+                LogRegIntentClassifierConfig(random_seed=42),
+                CRFSlotFillerConfig(random_seed=42))
+        ])
+        config_path = self.fixture_dir / "config.json"
+        with config_path.open(mode="w", encoding="utf8") as f:
+            f.write(json_string(config.to_dict()))
+        sequential_metrics_path = self.fixture_dir / "sequential_metrics.json"
+        parallel_metrics_path = self.fixture_dir / "parallel_metrics.json"
+
+        # When
+        cross_val_metrics(str(BEVERAGE_DATASET_PATH),
+                          str(sequential_metrics_path),
+                          config_path=str(config_path), nb_folds=2, jobs=1,
+                          random_seed=42)
+        cross_val_metrics(str(BEVERAGE_DATASET_PATH),
+                          str(parallel_metrics_path),
+                          config_path=str(config_path), nb_folds=2, jobs=2,
+                          random_seed=42)
+
+        # Then
+        with sequential_metrics_path.open(encoding="utf8") as f:
+            sequential_metrics = json.load(f)
+        with parallel_metrics_path.open(encoding="utf8") as f:
+            parallel_metrics = json.load(f)
+        self.assertDictEqual(sequential_metrics, parallel_metrics)
+
     def test_train_test_metrics(self):
         # Given / When
         train_test_metrics(str(BEVERAGE_DATASET_PATH),
@@ -69,3 +144,145 @@ class TestCLI(SnipsTest):
         # Then
         if not self.tmp_file_path.exists():
             self.fail("No metrics found")
+
+    def test_train_test_metrics_in_batch_mode(self):
+        # Given / When
+        train_test_metrics(str(BEVERAGE_DATASET_PATH),
+                           str(BEVERAGE_DATASET_PATH), str(self.tmp_file_path),
+                           batch=True, jobs=2)
+
+        # Then
+        if not self.tmp_file_path.exists():
+            self.fail("No metrics found")
+        with self.tmp_file_path.open(encoding="utf8") as f:
+            metrics = json.load(f)
+        self.assertSetEqual({"training", "inference", "metrics", "total"},
+                            set(metrics["timings"]))
+
+    def test_bench(self):
+        # Given / When
+        bench(str(self.tmp_file_path), None, None, 0, 5, 1, 1, 42, False,
+              str(BEVERAGE_DATASET_PATH))
+
+        # Then
+        if not self.tmp_file_path.exists():
+            self.fail("No benchmark report found")
+        with self.tmp_file_path.open(encoding="utf8") as f:
+            report = json.load(f)
+        dataset_report = report["datasets"]["beverage_dataset"]
+        self.assertSetEqual(
+            {"training_time_s", "cold_start", "latency", "stages", "batch"},
+            set(dataset_report))
+        self.assertSetEqual({"deterministic", "probabilistic", "slot_heavy"},
+                            set(dataset_report["latency"]))
+
+    def test_should_get_benchmark_queries_matching_their_parsers(self):
+        # Given
+        with BEVERAGE_DATASET_PATH.open(encoding="utf8") as f:
+            dataset = json.load(f)
+        engine = SnipsNLUEngine().fit(dataset)
+        first_parser = engine.intent_parsers[0]
+
+        # When
+        queries = get_benchmark_queries(dataset, engine, num_queries=5,
+                                        random_seed=42)
+
+        # Then
+        self.assertGreater(len(queries["deterministic"]), 0)
+        for text in queries["deterministic"]:
+            self.assertFalse(is_empty(first_parser.parse(text)))
+        for query_type in ("probabilistic", "slot_heavy"):
+            self.assertGreater(len(queries[query_type]), 0)
+            for text in queries[query_type]:
+                self.assertTrue(is_empty(first_parser.parse(text)))
+
+    def test_should_measure_latencies_of_empty_query_type(self):
+        # Given
+        engine = MagicMock()
+
+        # When
+        latencies = _measure_latencies(engine, [], 3)
+
+        # Then
+        expected_latencies = {
+            "count": 0,
+            "mean_ms": None,
+            "p50_ms": None,
+            "p95_ms": None,
+            "p99_ms": None,
+            "max_ms": None,
+        }
+        self.assertDictEqual(expected_latencies, latencies)
+        engine.parse.assert_not_called()
+
+    def test_bench_with_probabilistic_parser_only(self):
+        # Given
+        config = NLUEngineConfig([ProbabilisticIntentParserConfig()])
+        config_path = self.fixture_dir / "config.json"
+        with config_path.open(mode="w", encoding="utf8") as f:
+            f.write(json_string(config.to_dict()))
+
+        # When
+        bench(str(self.tmp_file_path), str(config_path), None, 0, 5, 1, 1, 42,
+              False, str(BEVERAGE_DATASET_PATH))
+
+        # Then
+        with self.tmp_file_path.open(encoding="utf8") as f:
+            report = json.load(f)
+        latency = report["datasets"]["beverage_dataset"]["latency"]
+        self.assertGreater(latency["deterministic"]["count"], 0)
+        for query_type_latency in latency.values():
+            if query_type_latency["count"] == 0:
+                self.assertIsNone(query_type_latency["p50_ms"])
+
+    def test_bench_import(self):
+        # When
+        bench_import(str(self.tmp_file_path), 1, "snips_nlu")
+
+        # Then
+        with self.tmp_file_path.open(encoding="utf8") as f:
+            report = json.load(f)
+        module_report = report["modules"]["snips_nlu"]
+        self.assertGreater(module_report["median_s"], 0)
+        self.assertListEqual([], module_report["imported_lazy_dependencies"])
+
+    def test_bench_training(self):
+        # Given
+        profile_dir = self.fixture_dir / "profiles"
+
+        # When
+        bench_training(str(self.tmp_file_path), None, "2,3", "10", "1", "5",
+                       "1", str(profile_dir), False, 42, False)
+
+        # Then
+        if not self.tmp_file_path.exists():
+            self.fail("No benchmark report found")
+        with self.tmp_file_path.open(encoding="utf8") as f:
+            report = json.load(f)
+        self.assertListEqual(["i2_u10_E1_e5_s1", "i3_u10_E1_e5_s1"],
+                             [run["name"] for run in report["runs"]])
+        for run in report["runs"]:
+            self.assertIn(CRF_TRAINING, run["stages"])
+            self.assertIn(PERSISTING, run["stages"])
+            self.assertEqual(run["parameters"]["num_intents"],
+                             run["stages"][CRF_TRAINING]["count"])
+            self.assertTrue(
+                (profile_dir / run["name"] / "crf_training.prof").exists())
+
+    def test_generate_synthetic_data(self):
+        # Given
+        workload_path = self.fixture_dir / "queries.jsonl"
+
+        # When
+        generate_synthetic_data(str(self.tmp_file_path), str(workload_path),
+                                15, 3, 10, 2, 20, 1, 1, 0.5, "en", 42)
+
+        # Then
+        with self.tmp_file_path.open(encoding="utf8") as f:
+            dataset = json.load(f)
+        with workload_path.open(encoding="utf8") as f:
+            queries = [json.loads(line) for line in f]
+        self.assertEqual(3, len(dataset["intents"]))
+        self.assertEqual(15, len(queries))
+        for query in queries:
+            self.assertIn(query["intent"], dataset["intents"])
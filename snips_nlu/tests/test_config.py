@@ -86,6 +86,23 @@ class TestConfig(SnipsTest):
         # Then
         self.assertDictEqual(config_dict, serialized_config)
 
+    def test_featurizer_config_with_hashing(self):
+        # Given
+        config_dict = {
+            "sublinear_tf": False,
+            "pvalue_threshold": 0.4,
+            "word_clusters_name": None,
+            "use_stemming": False,
+            "num_hashing_buckets": 1024
+        }
+
+        # When
+        config = FeaturizerConfig.from_dict(config_dict)
+        serialized_config = config.to_dict()
+
+        # Then
+        self.assertDictEqual(config_dict, serialized_config)
+
     def test_intent_classifier_config(self):
         # Given
         config_dict = {
@@ -4,8 +4,7 @@ from __future__ import unicode_literals
 from builtins import range
 from pathlib import Path
 
-from mock import MagicMock
-from sklearn_crfsuite import CRF
+from mock import MagicMock, patch
 
 from snips_nlu.constants import (
     DATA, END, ENTITY, ENTITY_KIND, LANGUAGE_EN, RES_MATCH_RANGE, SLOT_NAME,
@@ -15,11 +14,11 @@ from snips_nlu.pipeline.configs import CRFSlotFillerConfig
 from snips_nlu.preprocessing import Token, tokenize
 from snips_nlu.result import unresolved_slot
 from snips_nlu.slot_filler.crf_slot_filler import (
-    CRFSlotFiller, _disambiguate_builtin_entities, _ensure_safe,
+    CRFSlotFiller, _decode_tag, _disambiguate_builtin_entities,
     _filter_overlapping_builtins, _get_slots_permutations,
-    _spans_to_tokens_indexes)
+    _spans_to_tokens_indexes, _to_crf_item)
 from snips_nlu.slot_filler.crf_utils import (
-    BEGINNING_PREFIX, INSIDE_PREFIX, TaggingScheme)
+    BEGINNING_PREFIX, INSIDE_PREFIX, TAGS, TOKENS, TaggingScheme)
 from snips_nlu.slot_filler.feature_factory import (
     IsDigitFactory, NgramFactory, ShapeNgramFactory)
 from snips_nlu.tests.utils import (
@@ -47,6 +46,27 @@ class TestCRFSlotFiller(FixtureTest):
                             slot_name='number_of_cups')]
         self.assertListEqual(slots, expected_slots)
 
+    @patch("snips_nlu.slot_filler.crf_slot_filler._decode_tag")
+    def test_should_not_decode_labels_at_inference(self, mocked_decode_tag):
+        # Given
+        mocked_decode_tag.side_effect = _decode_tag
+        dataset = BEVERAGE_DATASET
+        config = CRFSlotFillerConfig(random_seed=42)
+        slot_filler = CRFSlotFiller(config)
+        slot_filler.fit(dataset, "MakeTea")
+        labels = slot_filler.labels
+        decode_calls_count = mocked_decode_tag.call_count
+
+        # When
+        slot_filler.get_slots("make me two cups of tea")
+        slot_filler.get_slots("make me three cups of hot tea")
+        slot_filler.get_sequence_probability(
+            tokenize("make me tea", LANGUAGE_EN), ["O", "O", "O"])
+
+        # Then
+        self.assertIn("O", labels)
+        self.assertEqual(decode_calls_count, mocked_decode_tag.call_count)
+
     def test_should_get_builtin_slots(self):
         # Given
         dataset = WEATHER_DATASET
@@ -644,6 +664,71 @@ class TestCRFSlotFiller(FixtureTest):
         ]
         self.assertListEqual(expected_features, features_with_drop_out)
 
+    def test_should_compute_corpus_features(self):
+        # Given
+        features_factories = [
+            {
+                "factory_name": NgramFactory.name,
+                "args": {
+                    "n": 1,
+                    "use_stemming": False,
+                    "common_words_gazetteer_name": None
+                },
+                "offsets": [-1, 0],
+                "drop_out": 0.3
+            },
+            {
+                "factory_name": IsDigitFactory.name,
+                "args": {},
+                "offsets": [0, 1],
+                "drop_out": 0.5
+            },
+        ]
+        slot_filler_config = CRFSlotFillerConfig(
+            feature_factory_configs=features_factories, random_seed=40)
+        slot_filler = CRFSlotFiller(slot_filler_config)
+        slot_filler.fit(SAMPLE_DATASET, intent="dummy_intent_1")
+        tokens_sequences = [
+            tokenize("foo hello world bar", LANGUAGE_EN),
+            tokenize("2 foo", LANGUAGE_EN),
+            [],
+            tokenize("hello 3 world 4 5", LANGUAGE_EN),
+        ]
+
+        # When
+        corpus_features = slot_filler.compute_corpus_features(
+            tokens_sequences, drop_out=True)
+        corpus_features_no_drop_out = slot_filler.compute_corpus_features(
+            tokens_sequences)
+
+        # Then
+        expected_features = [
+            slot_filler.compute_features(tokens, drop_out=True)
+            for tokens in tokens_sequences]
+        expected_features_no_drop_out = [
+            slot_filler.compute_features(tokens)
+            for tokens in tokens_sequences]
+        self.assertListEqual(expected_features, corpus_features)
+        self.assertListEqual(expected_features_no_drop_out,
+                             corpus_features_no_drop_out)
+
+    def test_should_convert_features_to_interned_crf_items(self):
+        # Given
+        attributes = dict()
+        features = [
+            {"ngram_1": "foo", "is_digit": "1"},
+            {"ngram_1": "foo"},
+        ]
+
+        # When
+        items = [_to_crf_item(token_features, attributes)
+                 for token_features in features]
+
+        # Then
+        self.assertListEqual(["is_digit:1", "ngram_1:foo"], sorted(items[0]))
+        self.assertListEqual(["ngram_1:foo"], items[1])
+        self.assertIs(attributes[("ngram_1", "foo")], items[1][0])
+
     def test_spans_to_tokens_indexes(self):
         # Given
         spans = [
@@ -933,14 +1018,20 @@ class TestCRFSlotFiller(FixtureTest):
         slot_filler.fit(dataset, "dummy_intent")
         slot_filler.get_slots("ya")
 
-    def test___ensure_safe(self):
-        unsafe_examples = [
-            ([[]], [[]]),
-            ([[], []], [[], []]),
-        ]
+    @patch("snips_nlu.slot_filler.crf_slot_filler.CRFSlotFiller"
+           "._iter_corpus_features")
+    def test_should_fit_crf_model_without_items_nor_labels(
+            self, mocked_iter_corpus_features):
+        # Given
+        mocked_iter_corpus_features.return_value = iter([[], []])
+        crf_samples = [{TOKENS: [], TAGS: []}, {TOKENS: [], TAGS: []}]
+        slot_filler = CRFSlotFiller()
+
+        # When
+        # pylint: disable=protected-access
+        crf_model = slot_filler._fit_crf_model(crf_samples)
+        # pylint: enable=protected-access
 
-        # We don't assert anything here but it segfault otherwise
-        for x, y in unsafe_examples:
-            x, y = _ensure_safe(x, y)
-            model = CRF().fit(x, y)
-            model.predict_single([""])
+        # Then
+        # The OUTSIDE label is learnt, otherwise the inference segfaults
+        crf_model.predict_single([""])
@@ -1,6 +1,7 @@
 # coding=utf-8
 from __future__ import unicode_literals
 
+import json
 from pathlib import Path
 
 from mock import patch
@@ -8,9 +9,11 @@ from mock import patch
 from snips_nlu.dataset import validate_and_format_dataset
 from snips_nlu.entity_parser import CustomEntityParser
 from snips_nlu.entity_parser.custom_entity_parser import (
-    CustomEntityParserUsage, _compute_char_shifts)
+    CustomEntityParserUsage, _compute_char_shifts,
+    _create_custom_entity_parser_configuration)
 from snips_nlu.preprocessing import tokenize
 from snips_nlu.tests.utils import FixtureTest
+from snips_nlu.utils import json_string
 
 DATASET = validate_and_format_dataset({
     "intents": {
@@ -219,6 +222,23 @@ class TestCustomEntityParser(FixtureTest):
         # Then
         self.assertEqual(1, mocked_parse.call_count)
 
+    @patch("snips_nlu_ontology.GazetteerEntityParser.parse")
+    def test_should_count_cache_hits_and_misses(self, mocked_parse):
+        # Given
+        mocked_parse.return_value = []
+        parser = CustomEntityParser.build(
+            DATASET, CustomEntityParserUsage.WITHOUT_STEMS)
+
+        # When
+        parser.parse("foo")
+        parser.parse("foo")
+        parser.parse("bar")
+        parser.parse("bar", use_cache=False)
+
+        # Then
+        self.assertEqual(1, parser.cache_hits)
+        self.assertEqual(2, parser.cache_misses)
+
     def test_should_be_serializable(self):
         # Given
         parser = CustomEntityParser.build(
@@ -256,6 +276,141 @@ class TestCustomEntityParser(FixtureTest):
         ]
         self.assertListEqual(expected_entities, result)
 
+    def test_should_persist_single_shard_with_unsharded_layout(self):
+        # Given
+        parser = CustomEntityParser.build(
+            DATASET, CustomEntityParserUsage.WITHOUT_STEMS)
+        self.tmp_file_path.mkdir()
+        parser_path = self.tmp_file_path / "custom_entity_parser"
+
+        # When
+        parser.persist(parser_path)
+
+        # Then
+        with (parser_path / "metadata.json").open(encoding="utf8") as f:
+            metadata = json.load(f)
+        expected_metadata = {
+            "language": "en",
+            "parser_usage": CustomEntityParserUsage.WITHOUT_STEMS.value,
+            "parser_directory": "parser"
+        }
+        self.assertDictEqual(expected_metadata, metadata)
+        self.assertTrue((parser_path / "parser").is_dir())
+
+    def test_should_build_one_shard_per_entity_when_budget_is_small(self):
+        # Given
+        parser = CustomEntityParser.build(
+            DATASET, CustomEntityParserUsage.WITHOUT_STEMS, max_shard_size=1)
+        text = "dummy_1 dummy_2"
+
+        # When
+        result = parser.parse(text, scope=["dummy_entity_2"])
+
+        # Then
+        expected_entities = [
+            {
+                "value": "dummy_2",
+                "resolved_value": "dummy_entity_2",
+                "range": {
+                    "start": 8,
+                    "end": 15
+                },
+                "entity_kind": "dummy_entity_2"
+            }
+        ]
+        shards_entities = sorted(shard.entities for shard in parser.shards)
+        self.assertListEqual([["dummy_entity_1"], ["dummy_entity_2"]],
+                             shards_entities)
+        self.assertListEqual(expected_entities, result)
+
+    def test_should_load_scoped_shards_lazily(self):
+        # Given
+        parser = CustomEntityParser.build(
+            DATASET, CustomEntityParserUsage.WITHOUT_STEMS, max_shard_size=1)
+        self.tmp_file_path.mkdir()
+        parser_path = self.tmp_file_path / "custom_entity_parser"
+        parser.persist(parser_path)
+        loaded_parser = CustomEntityParser.from_path(parser_path, lazy=True)
+
+        # When
+        result = loaded_parser.parse("dummy_1 dummy_2",
+                                     scope=["dummy_entity_1"])
+
+        # Then
+        loaded_entities = [shard.entities for shard in loaded_parser.shards
+                           if shard.loaded]
+        self.assertListEqual([["dummy_entity_1"]], loaded_entities)
+        self.assertEqual(1, len(result))
+        self.assertEqual("dummy_entity_1", result[0]["entity_kind"])
+
+    def test_should_load_parser_persisted_without_shards(self):
+        # Given
+        parser = CustomEntityParser.build(
+            DATASET, CustomEntityParserUsage.WITHOUT_STEMS)
+        self.tmp_file_path.mkdir()
+        parser_path = self.tmp_file_path / "custom_entity_parser"
+        parser_path.mkdir()
+        parser.shards[0].persist(parser_path / "parser")
+        metadata = {
+            "language": "en",
+            "parser_usage": CustomEntityParserUsage.WITHOUT_STEMS.value,
+            "parser_directory": "parser"
+        }
+        with (parser_path / "metadata.json").open("w", encoding="utf8") as f:
+            f.write(json_string(metadata))
+
+        # When
+        loaded_parser = CustomEntityParser.from_path(parser_path)
+        result = loaded_parser.parse("dummy_1 dummy_2",
+                                     scope=["dummy_entity_2"])
+
+        # Then
+        self.assertEqual(1, len(loaded_parser.shards))
+        self.assertIsNone(loaded_parser.shards[0].entities)
+        self.assertEqual(1, len(result))
+        self.assertEqual("dummy_entity_2", result[0]["entity_kind"])
+
+    @patch("snips_nlu.entity_parser.custom_entity_parser.stem")
+    def test_should_create_configuration_with_and_without_stems(
+            self, mocked_stem):
+        # Given
+        mocked_stem.side_effect = _stem
+        utterances = {
+            "foo1": "foo",
+            "foo": "foo",
+            "bar1": "bar"
+        }
+        entities = [
+            ("dummy_entity", {
+                "utterances": utterances,
+                "matching_strictness": 0.8
+            })
+        ]
+
+        # When
+        configuration = _create_custom_entity_parser_configuration(
+            entities, "en", CustomEntityParserUsage.WITH_AND_WITHOUT_STEMS)
+
+        # Then
+        entity_parsers = configuration["entity_parsers"]
+        self.assertEqual(1, len(entity_parsers))
+        self.assertEqual("dummy_entity",
+                         entity_parsers[0]["entity_identifier"])
+        self.assertEqual(0.8, entity_parsers[0]["entity_parser"]["threshold"])
+        expected_gazetteer = [
+            {"raw_value": "bar", "resolved_value": "bar"},
+            {"raw_value": "bar1", "resolved_value": "bar"},
+            {"raw_value": "fo", "resolved_value": "foo"},
+            {"raw_value": "foo", "resolved_value": "foo"},
+            {"raw_value": "foo1", "resolved_value": "foo"},
+        ]
+        gazetteer = sorted(entity_parsers[0]["entity_parser"]["gazetteer"],
+                           key=lambda entry: entry["raw_value"])
+        self.assertListEqual(expected_gazetteer, gazetteer)
+        self.assertDictEqual(
+            {"foo1": "foo", "foo": "foo", "bar1": "bar"}, utterances)
+        self.assertEqual(3, mocked_stem.call_count)
+
     def test_should_compute_tokenization_shift(self):
         # Given
         text = "  hello?   world"
@@ -2,15 +2,29 @@
 from __future__ import unicode_literals
 
 from builtins import str
+from copy import deepcopy
 
 from mock import mock
 
-from snips_nlu.constants import ENTITIES, SNIPS_DATETIME
-from snips_nlu.dataset import validate_and_format_dataset
+from snips_nlu.constants import ENTITIES, LANGUAGE, SNIPS_DATETIME
+from snips_nlu.dataset import (
+    SyntheticDatasetGenerator, ValidatedDataset, generate_synthetic_dataset,
+    validate_and_format_dataset)
+from snips_nlu.string_variations import clear_string_variations_cache
 from snips_nlu.tests.utils import SnipsTest
 
 
 class TestDatasetValidation(SnipsTest):
+    def setUp(self):
+        super(TestDatasetValidation, self).setUp()
+        # Mocked variations must neither be skipped because of previously
+        # cached ones nor leak into the other tests through the cache
+        clear_string_variations_cache()
+
+    def tearDown(self):
+        clear_string_variations_cache()
+        super(TestDatasetValidation, self).tearDown()
+
     def test_missing_intent_key_should_raise_exception(self):
         # Given
         dataset = {
@@ -154,7 +168,7 @@ class TestDatasetValidation(SnipsTest):
             validate_and_format_dataset(dataset)
         self.assertEqual("Unknown language: 'eng'", str(ctx.exception.args[0]))
 
-    @mock.patch("snips_nlu.dataset.validation.get_string_variations")
+    @mock.patch("snips_nlu.string_variations._get_string_variations")
     def test_should_format_dataset_by_adding_synonyms(
             self, mocked_get_string_variations):
         # Given
@@ -207,7 +221,7 @@ class TestDatasetValidation(SnipsTest):
         # Then
         self.assertDictEqual(expected_dataset, dataset)
 
-    @mock.patch("snips_nlu.dataset.validation.get_string_variations")
+    @mock.patch("snips_nlu.string_variations._get_string_variations")
     def test_should_format_dataset_by_adding_entity_values(
             self, mocked_get_string_variations):
         # Given
@@ -320,7 +334,7 @@ class TestDatasetValidation(SnipsTest):
         # Then
         self.assertEqual(expected_dataset, dataset)
 
-    @mock.patch("snips_nlu.dataset.validation.get_string_variations")
+    @mock.patch("snips_nlu.string_variations._get_string_variations")
     def test_should_add_missing_reference_entity_values_when_not_use_synonyms(
             self, mocked_get_string_variations):
         # Given
@@ -461,7 +475,7 @@ class TestDatasetValidation(SnipsTest):
         with self.fail_if_exception("Could not validate dataset"):
             validate_and_format_dataset(dataset)
 
-    @mock.patch("snips_nlu.dataset.validation.get_string_variations")
+    @mock.patch("snips_nlu.string_variations._get_string_variations")
     def test_should_remove_empty_entities_value_and_empty_synonyms(
             self, mocked_get_string_variations):
         # Given
@@ -575,7 +589,7 @@ class TestDatasetValidation(SnipsTest):
         # Then
         self.assertEqual(expected_dataset, dataset)
 
-    @mock.patch("snips_nlu.dataset.validation.get_string_variations")
+    @mock.patch("snips_nlu.string_variations._get_string_variations")
     def test_should_add_capitalize_field(
             self, mocked_get_string_variations):
         # Given
@@ -751,7 +765,7 @@ class TestDatasetValidation(SnipsTest):
         # Then
         self.assertDictEqual(expected_dataset, dataset)
 
-    @mock.patch("snips_nlu.dataset.validation.get_string_variations")
+    @mock.patch("snips_nlu.string_variations._get_string_variations")
     def test_should_normalize_synonyms(
             self, mocked_get_string_variations):
         # Given
@@ -826,7 +840,7 @@ class TestDatasetValidation(SnipsTest):
         # Then
         self.assertDictEqual(expected_dataset, dataset)
 
-    @mock.patch("snips_nlu.dataset.validation.get_string_variations")
+    @mock.patch("snips_nlu.string_variations._get_string_variations")
     def test_dataset_should_handle_synonyms(
             self, mocked_get_string_variations):
         # Given
@@ -935,3 +949,83 @@ class TestDatasetValidation(SnipsTest):
             "favorïte": "a"
         }
         self.assertDictEqual(expected_utterances, entity["utterances"])
+
+    def test_should_not_copy_validated_dataset(self):
+        # Given
+        dataset = {
+            "intents": {
+                "intent1": {
+                    "utterances": [
+                        {
+                            "data": (
+                                {
+                                    "text": "hello world",
+                                },
+                            )
+                        }
+                    ]
+                }
+            },
+            "entities": {},
+            "language": "en",
+        }
+        validated_dataset = validate_and_format_dataset(dataset)
+
+        # When
+        revalidated_dataset = validate_and_format_dataset(validated_dataset)
+
+        # Then
+        self.assertIsInstance(validated_dataset, ValidatedDataset)
+        self.assertIs(validated_dataset, revalidated_dataset)
+        self.assertListEqual(
+            [{"text": "hello world"}],
+            validated_dataset["intents"]["intent1"]["utterances"][0]["data"])
+        with self.assertRaises(TypeError):
+            validated_dataset[LANGUAGE] = "fr"
+        copied_dataset = deepcopy(validated_dataset)
+        copied_dataset[LANGUAGE] = "fr"
+        self.assertEqual("fr", copied_dataset[LANGUAGE])
+
+    def test_should_generate_valid_synthetic_dataset(self):
+        # Given
+        dataset = generate_synthetic_dataset(
+            num_intents=3, utterances_per_intent=10, num_entities=2,
+            values_per_entity=20, synonyms_per_value=1, random_seed=42)
+
+        # When
+        validated_dataset = validate_and_format_dataset(dataset)
+
+        # Then
+        self.assertEqual(3, len(validated_dataset["intents"]))
+        self.assertEqual(2, len(validated_dataset[ENTITIES]))
+        for intent in validated_dataset["intents"].values():
+            self.assertEqual(10, len(intent["utterances"]))
+        self.assertDictEqual(
+            dataset, generate_synthetic_dataset(
+                num_intents=3, utterances_per_intent=10, num_entities=2,
+                values_per_entity=20, synonyms_per_value=1, random_seed=42))
+
+    def test_should_generate_synthetic_builtin_slots_and_queries(self):
+        # Given
+        generator = SyntheticDatasetGenerator(
+            num_intents=2, utterances_per_intent=5, num_entities=1,
+            values_per_entity=10, builtin_slot_density=1.0, random_seed=42)
+
+        # When
+        dataset = validate_and_format_dataset(
+            generator.generate_dataset().json)
+        queries = generator.generate_queries(20)
+
+        # Then
+        builtin_entities = [e for e in dataset[ENTITIES]
+                            if e.startswith("snips/")]
+        self.assertGreater(len(builtin_entities), 0)
+        self.assertEqual(20, len(queries))
+        for query in queries:
+            self.assertIn(query["intent"], dataset["intents"])
+            self.assertEqual(3, len(query["slots"]))
+            for slot in query["slots"]:
+                match_range = slot["range"]
+                self.assertEqual(
+                    slot["value"],
+                    query["input"][match_range["start"]:match_range["end"]])
@@ -0,0 +1,186 @@
+from __future__ import unicode_literals
+
+import threading
+from builtins import object, range
+
+from mock import MagicMock
+
+from snips_nlu import SnipsNLUEngine
+from snips_nlu.constants import INTENTS
+from snips_nlu.instrumentation import (
+    BUILTIN_ENTITY_PARSER_BUILDING, BUILTIN_ENTITY_PARSING,
+    CRF_FEATURES_EXTRACTION, CRF_TRAINING, CUSTOM_ENTITY_PARSER_BUILDING,
+    CUSTOM_ENTITY_PARSING, DATASET_VALIDATION, DATA_AUGMENTATION,
+    FEATURIZER_FITTING, HistogramRecorder, INTENT_CLASSIFIER_DATA_BUILDING,
+    INTENT_CLASSIFIER_FITTING, PARSING, SLOT_RESOLUTION, TOKENIZATION,
+    get_recorder, instrumented, recording, timed_stage)
+from snips_nlu.tests.utils import BEVERAGE_DATASET, SnipsTest
+
+
+class TestInstrumentation(SnipsTest):
+    def test_should_not_record_when_no_recorder(self):
+        # Given
+        recorder = MagicMock()
+
+        @instrumented("foo")
+        def foo():
+            return "bar"
+
+        with recording(recorder):
+            pass
+
+        # When
+        result = foo()
+        with timed_stage("baz"):
+            pass
+
+        # Then
+        self.assertIsNone(get_recorder())
+        self.assertEqual("bar", result)
+        recorder.assert_not_called()
+
+    def test_should_record_stages(self):
+        # Given
+        recorder = MagicMock()
+
+        @instrumented("foo")
+        def foo():
+            return "bar"
+
+        # When
+        with recording(recorder):
+            result = foo()
+            with timed_stage("baz"):
+                pass
+
+        # Then
+        self.assertEqual("bar", result)
+        recorded_stages = [call[0][0] for call in recorder.call_args_list]
+        self.assertListEqual(["foo", "baz"], recorded_stages)
+        for call in recorder.call_args_list:
+            self.assertGreaterEqual(call[0][1], 0)
+
+    def test_should_call_stage_hooks(self):
+        # Given
+        calls = []
+
+        class HookedRecorder(object):
+            def __call__(self, stage, duration_ns):
+                calls.append(("record", stage))
+
+            def enter_stage(self, stage):
+                calls.append(("enter", stage))
+
+            def exit_stage(self, stage):
+                calls.append(("exit", stage))
+
+        @instrumented("foo")
+        def foo():
+            with timed_stage("bar"):
+                pass
+
+        # When
+        with recording(HookedRecorder()):
+            foo()
+
+        # Then
+        expected_calls = [
+            ("enter", "foo"),
+            ("enter", "bar"),
+            ("exit", "bar"),
+            ("record", "bar"),
+            ("exit", "foo"),
+            ("record", "foo"),
+        ]
+        self.assertListEqual(expected_calls, calls)
+
+    def test_should_compute_percentiles(self):
+        # Given
+        recorder = HistogramRecorder(relative_precision=0.01)
+
+        # When
+        for duration in range(1, 1001):
+            recorder("foo", duration * 1000)
+
+        # Then
+        self.assertEqual(1000, recorder.count("foo"))
+        self.assertAlmostEqual(500000, recorder.percentile("foo", 50),
+                               delta=500000 * 0.01)
+        self.assertAlmostEqual(990000, recorder.percentile("foo", 99),
+                               delta=990000 * 0.01)
+        self.assertEqual(1000000, recorder.percentile("foo", 100))
+        summary = recorder.summary()
+        self.assertListEqual(["foo"], list(summary))
+        self.assertEqual(1000, summary["foo"]["count"])
+        self.assertAlmostEqual(0.5005, summary["foo"]["mean_ms"])
+        self.assertAlmostEqual(1.0, summary["foo"]["max_ms"])
+        for key in ["p50_ms", "p95_ms", "p99_ms"]:
+            self.assertIn(key, summary["foo"])
+
+    def test_should_summarize_while_recording_concurrently(self):
+        # Given
+        recorder = HistogramRecorder()
+        num_threads = 4
+        num_durations = 1000
+
+        def record(thread_index):
+            for i in range(num_durations):
+                recorder("stage_%s_%s" % (thread_index, i % 50), i + 1)
+                recorder("shared", i + 1)
+
+        threads = [threading.Thread(target=record, args=(i,))
+                   for i in range(num_threads)]
+
+        # When
+        for thread in threads:
+            thread.start()
+        summaries = []
+        while any(thread.is_alive() for thread in threads):
+            summaries.append(recorder.summary())
+        for thread in threads:
+            thread.join()
+        summaries.append(recorder.summary())
+
+        # Then
+        shared_counts = [summary["shared"]["count"] for summary in summaries
+                         if "shared" in summary]
+        self.assertListEqual(sorted(shared_counts), shared_counts)
+        self.assertEqual(num_threads * num_durations,
+                         summaries[-1]["shared"]["count"])
+        self.assertEqual(num_threads * 50 + 1, len(recorder.stages))
+
+    def test_should_record_training_stages(self):
+        # Given
+        recorder = HistogramRecorder()
+
+        # When
+        with recording(recorder):
+            SnipsNLUEngine().fit(BEVERAGE_DATASET)
+
+        # Then
+        expected_stages = {
+            DATASET_VALIDATION, CUSTOM_ENTITY_PARSER_BUILDING,
+            BUILTIN_ENTITY_PARSER_BUILDING, INTENT_CLASSIFIER_DATA_BUILDING,
+            FEATURIZER_FITTING, INTENT_CLASSIFIER_FITTING, DATA_AUGMENTATION,
+            CRF_FEATURES_EXTRACTION, CRF_TRAINING
+        }
+        self.assertTrue(expected_stages.issubset(set(recorder.stages)))
+        num_intents = len(BEVERAGE_DATASET[INTENTS])
+        self.assertEqual(num_intents, recorder.count(CRF_TRAINING))
+
+    def test_should_record_parsing_stages(self):
+        # Given
+        engine = SnipsNLUEngine().fit(BEVERAGE_DATASET)
+        recorder = HistogramRecorder()
+
+        # When
+        with recording(recorder):
+            engine.parse("make me two cups of tea")
+
+        # Then
+        expected_stages = {
+            PARSING, TOKENIZATION, BUILTIN_ENTITY_PARSING,
+            CUSTOM_ENTITY_PARSING, SLOT_RESOLUTION
+        }
+        self.assertTrue(expected_stages.issubset(set(recorder.stages)))
+        self.assertEqual(1, recorder.count(PARSING))
@@ -14,12 +14,13 @@ from snips_nlu.entity_parser.custom_entity_parser_usage import \
     CustomEntityParserUsage
 from snips_nlu.intent_classifier.featurizer import (
     Featurizer, _get_tfidf_vectorizer)
+from snips_nlu.intent_classifier.inference import InferenceTfidfVectorizer
 from snips_nlu.intent_classifier.log_reg_classifier_utils import (
     text_to_utterance)
 from snips_nlu.languages import get_default_sep
 from snips_nlu.pipeline.configs import FeaturizerConfig
 from snips_nlu.preprocessing import tokenize_light
-from snips_nlu.tests.utils import SnipsTest
+from snips_nlu.tests.utils import SnipsTest, get_empty_dataset
 from snips_nlu.utils import json_string
 
 
@@ -128,11 +129,8 @@ class TestIntentClassifierFeaturizer(SnipsTest):
 
         # Then
         self.assertEqual(featurizer.language, language)
-        # pylint: disable=W0212
-        self.assertListEqual(
-            featurizer.tfidf_vectorizer._tfidf._idf_diag.data.tolist(),
-            idf_diag)
-        # pylint: enable=W0212
+        self.assertListEqual(featurizer.tfidf_vectorizer.idf_.tolist(),
+                             idf_diag)
         self.assertDictEqual(featurizer.tfidf_vectorizer.vocabulary_,
                              vocabulary)
         self.assertListEqual(featurizer.best_features, best_features)
@@ -275,3 +273,64 @@ class TestIntentClassifierFeaturizer(SnipsTest):
         featurizer = Featurizer(language, None)
         # When/Then
         featurizer.to_dict()
+
+    def test_inference_vectorizer_should_transform_like_sklearn(self):
+        # Given
+        language = LANGUAGE_EN
+        training_texts = ["hello world", "Beautiful world", "hello hello here",
+                          "bird birdy", "beautiful bird"]
+        texts = ["hello beautiful world world", "unknown words", "",
+                 "Bird world"]
+
+        for sublinear_tf in (False, True):
+            tfidf_vectorizer = _get_tfidf_vectorizer(
+                language, sublinear_tf=sublinear_tf)
+            tfidf_vectorizer.fit(training_texts)
+            inference_vectorizer = InferenceTfidfVectorizer(
+                language, tfidf_vectorizer.vocabulary_,
+                tfidf_vectorizer.idf_.tolist(), sublinear_tf)
+
+            # When
+            features = inference_vectorizer.transform(texts)
+
+            # Then
+            expected_features = tfidf_vectorizer.transform(texts)
+            np.testing.assert_array_almost_equal(
+                expected_features.toarray(), features.toarray())
+
+    def test_hashing_featurizer_should_be_serializable(self):
+        # Given
+        language = LANGUAGE_EN
+        config = FeaturizerConfig(num_hashing_buckets=64)
+        featurizer = Featurizer(language, config=config,
+                                unknown_words_replacement_string=None)
+        dataset = validate_and_format_dataset(get_empty_dataset(language))
+        utterances = [
+            "hello world",
+            "beautiful world",
+            "hello here",
+            "bird birdy",
+            "beautiful bird"
+        ]
+        utterances = [text_to_utterance(u) for u in utterances]
+        classes = np.array([0, 0, 0, 1, 1])
+        featurizer.fit(dataset, utterances, classes)
+
+        # When
+        featurizer_dict = json.loads(json_string(featurizer.to_dict()))
+        loaded_featurizer = Featurizer.from_dict(
+            featurizer_dict,
+            builtin_entity_parser=featurizer.builtin_entity_parser,
+            custom_entity_parser=featurizer.custom_entity_parser)
+
+        # Then
+        self.assertIsNone(featurizer_dict["tfidf_vectorizer"]["vocab"])
+        self.assertEqual(
+            64, len(featurizer_dict["tfidf_vectorizer"]["idf_diag"]))
+        self.assertTrue(loaded_featurizer.fitted)
+        self.assertGreater(len(loaded_featurizer.best_features), 0)
+        texts = ["hello beautiful bird", "unknown words"]
+        queries = [text_to_utterance(text) for text in texts]
+        np.testing.assert_array_almost_equal(
+            featurizer.transform(queries).toarray(),
+            loaded_featurizer.transform(queries).toarray())
@@ -6,7 +6,7 @@ from builtins import str
 from mock import patch
 
 from snips_nlu.constants import (
-    INTENTS, LANGUAGE_EN, RES_INTENT_NAME, UTTERANCES)
+    INTENTS, LANGUAGE_EN, RES_INTENT_NAME, RES_PROBABILITY, UTTERANCES)
 from snips_nlu.dataset import validate_and_format_dataset
 from snips_nlu.entity_parser import BuiltinEntityParser, CustomEntityParser
 from snips_nlu.entity_parser.custom_entity_parser_usage import (
@@ -16,7 +16,7 @@ from snips_nlu.intent_classifier.featurizer import Featurizer
 from snips_nlu.intent_classifier.log_reg_classifier_utils import (
     text_to_utterance)
 from snips_nlu.pipeline.configs import (
-    LogRegIntentClassifierConfig)
+    FeaturizerConfig, LogRegIntentClassifierConfig)
 from snips_nlu.tests.utils import (
     BEVERAGE_DATASET, FixtureTest, SAMPLE_DATASET, get_empty_dataset)
 from snips_nlu.utils import NotTrained
@@ -66,6 +66,20 @@ class TestLogRegIntentClassifier(FixtureTest):
         self.assertEqual("MakeCoffee", res2[RES_INTENT_NAME])
         self.assertEqual(None, res3)
 
+    def test_intent_classifier_should_get_intent_with_hashed_features(self):
+        # Given
+        dataset = validate_and_format_dataset(BEVERAGE_DATASET)
+        config = LogRegIntentClassifierConfig(
+            featurizer_config=FeaturizerConfig(num_hashing_buckets=256))
+        classifier = LogRegIntentClassifier(config=config).fit(dataset)
+        text = "Make me two cups of tea"
+
+        # When
+        res = classifier.get_intent(text)
+
+        # Then
+        self.assertEqual("MakeTea", res[RES_INTENT_NAME])
+
     def test_should_not_get_intent_when_not_fitted(self):
         # Given
         intent_classifier = LogRegIntentClassifier()
@@ -189,6 +203,33 @@ class TestLogRegIntentClassifier(FixtureTest):
         expected_intent = "MakeTea"
         self.assertEqual(expected_intent, result[RES_INTENT_NAME])
 
+    def test_deserialized_classifier_should_get_same_probabilities(self):
+        # Given
+        dataset = validate_and_format_dataset(BEVERAGE_DATASET)
+        classifier = LogRegIntentClassifier().fit(dataset)
+        classifier.persist(self.tmp_file_path)
+        loaded_classifier = LogRegIntentClassifier.from_path(
+            self.tmp_file_path,
+            builtin_entity_parser=classifier.builtin_entity_parser,
+            custom_entity_parser=classifier.custom_entity_parser)
+        texts = ["Make me two cups of tea", "I want a hot coffee",
+                 "what is the weather"]
+
+        for intents_filter in (None, ["MakeCoffee"]):
+            for text in texts:
+                # When
+                result = loaded_classifier.get_intent(text, intents_filter)
+
+                # Then
+                expected_result = classifier.get_intent(text, intents_filter)
+                if expected_result is None:
+                    self.assertIsNone(result)
+                    continue
+                self.assertEqual(expected_result[RES_INTENT_NAME],
+                                 result[RES_INTENT_NAME])
+                self.assertAlmostEqual(expected_result[RES_PROBABILITY],
+                                       result[RES_PROBABILITY])
+
     def test_should_be_serializable_into_bytearray(self):
         # Given
         dataset = validate_and_format_dataset(BEVERAGE_DATASET)
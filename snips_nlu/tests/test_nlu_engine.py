@@ -1,6 +1,7 @@
 # coding=utf-8
 from __future__ import unicode_literals
 
+import json
 from builtins import str
 from copy import deepcopy
 from pathlib import Path
@@ -19,6 +20,7 @@ from snips_nlu.entity_parser.custom_entity_parser_usage import \
     CustomEntityParserUsage
 from snips_nlu.intent_parser import IntentParser
 from snips_nlu.nlu_engine import SnipsNLUEngine
+from snips_nlu.nlu_engine.nlu_engine import _get_dataset_vocabulary
 from snips_nlu.pipeline.configs import (
     ProcessingUnitConfig, NLUEngineConfig, ProbabilisticIntentParserConfig)
 from snips_nlu.pipeline.units_registry import (
@@ -153,6 +155,21 @@ class TestSnipsNLUEngine(FixtureTest):
         expected_parse = parsing_result(input_text, intent, expected_slots)
         self.assertDictEqual(expected_parse, parse)
 
+    def test_should_parse_batch_of_texts(self):
+        # Given
+        engine = SnipsNLUEngine().fit(BEVERAGE_DATASET)
+        texts = ["Make me two cups of coffee", "make me one tea",
+                 "Make me two cups of coffee"]
+        expected_results = [engine.parse(text) for text in texts]
+
+        # When
+        with patch.object(engine, "parse", wraps=engine.parse) as mock_parse:
+            results = engine.parse_batch(texts)
+
+        # Then
+        self.assertEqual(2, mock_parse.call_count)
+        self.assertListEqual(expected_results, results)
+
     def test_should_retrain_only_non_trained_subunits(self):
         # Given
         class TestIntentParserConfig(ProcessingUnitConfig):
@@ -228,6 +245,21 @@ class TestSnipsNLUEngine(FixtureTest):
         self.assertDictEqual(dict(fitted=True, calls=1),
                              intent_parser.sub_unit_2)
 
+    def test_should_only_refit_incremental_intent_parsers(self):
+        # Given
+        engine = SnipsNLUEngine().fit(BEVERAGE_DATASET)
+
+        # When
+        with patch("snips_nlu.intent_parser.deterministic_intent_parser"
+                   ".DeterministicIntentParser.fit") as mocked_det_fit, \
+                patch("snips_nlu.intent_parser.probabilistic_intent_parser"
+                      ".ProbabilisticIntentParser.fit") as mocked_proba_fit:
+            engine.fit(BEVERAGE_DATASET, force_retrain=False)
+
+        # Then
+        mocked_det_fit.assert_not_called()
+        mocked_proba_fit.assert_called_once()
+
     def test_should_handle_empty_dataset(self):
         # Given
         dataset = validate_and_format_dataset(get_empty_dataset(LANGUAGE_EN))
@@ -492,6 +524,33 @@ class TestSnipsNLUEngine(FixtureTest):
         self.assertEqual(result[RES_INTENT][RES_INTENT_NAME], "MakeTea")
         self.assertListEqual(result[RES_SLOTS], expected_slots)
 
+    def test_should_persist_memo_tables_of_training_vocabulary_only(self):
+        # Given
+        dataset = BEVERAGE_DATASET
+        vocabulary = _get_dataset_vocabulary(
+            validate_and_format_dataset(dataset))
+        engine = SnipsNLUEngine().fit(dataset)
+        engine.parse("some private query which is not in the dataset")
+        self.tmp_file_path.mkdir()
+        reloaded_engine_path = self.tmp_file_path / "reloaded_engine"
+
+        # When
+        engine.persist(self.tmp_file_path / "engine")
+        reloaded_engine = SnipsNLUEngine.from_path(
+            self.tmp_file_path / "engine")
+        reloaded_engine.parse("another private query")
+        reloaded_engine.persist(reloaded_engine_path)
+
+        # Then
+        self.assertNotIn("hot", vocabulary)  # entity value
+        for path in (self.tmp_file_path / "engine", reloaded_engine_path):
+            with (path / "memo_tables.json").open(encoding="utf8") as f:
+                memo_tables = json.load(f)
+            self.assertSetEqual(set(vocabulary),
+                                set(memo_tables["normalized_values"]))
+            self.assertTrue(set(memo_tables["stemmed_values"]).issubset(
+                set(memo_tables["normalized_values"].values())))
+
     def test_should_be_serializable_into_bytearray_when_empty(self):
         # Given
         engine = SnipsNLUEngine()
@@ -0,0 +1,35 @@
+from __future__ import unicode_literals
+
+from future.utils import itervalues
+from mock import patch
+
+from snips_nlu import SnipsNLUEngine
+from snips_nlu.preloading import preload_for_fork
+from snips_nlu.tests.utils import BEVERAGE_DATASET, FixtureTest
+
+
+class TestPreloading(FixtureTest):
+    # pylint: disable=protected-access
+    @patch("snips_nlu.preloading.gc")
+    def test_should_preload_lazy_state_and_freeze_gc(self, mocked_gc):
+        # Given
+        SnipsNLUEngine().fit(BEVERAGE_DATASET).persist(self.tmp_file_path)
+        engine = SnipsNLUEngine.from_path(self.tmp_file_path, lazy=True)
+        slot_fillers = [
+            slot_filler for intent_parser in engine.intent_parsers
+            for slot_filler in itervalues(
+                getattr(intent_parser, "slot_fillers", dict()))
+        ]
+
+        # When
+        preload_for_fork(engine)
+
+        # Then
+        self.assertGreater(len(engine.custom_entity_parser.shards), 0)
+        self.assertTrue(
+            all(shard.loaded for shard in engine.custom_entity_parser.shards))
+        self.assertGreater(len(slot_fillers), 0)
+        for slot_filler in slot_fillers:
+            self.assertIsNotNone(slot_filler._labels_tables)
+        mocked_gc.collect.assert_called_once_with()
+        mocked_gc.freeze.assert_called_once_with()
@@ -1,10 +1,13 @@
 # coding=utf-8
 from __future__ import unicode_literals
 
+from mock import patch
 from snips_nlu_ontology import get_all_languages
 
 from snips_nlu.constants import LANGUAGE_EN
-from snips_nlu.preprocessing import Token, tokenize
+from snips_nlu.preprocessing import (
+    Token, TokenSequence, clear_memo_tables, get_memo_tables,
+    load_memo_tables, tokenize, tokenize_sequence, warm_memo_tables)
 from snips_nlu.tests.utils import SnipsTest
 
 
@@ -71,3 +74,69 @@ class TestPreprocessing(SnipsTest):
             tokens = tokenize(text, l)
             # Then
             self.assertEqual(len(tokens), 0)
+
+    def test_should_tokenize_sequence(self):
+        # Given
+        language = LANGUAGE_EN
+        text = "Hello Beautiful World"
+
+        # When
+        tokens = tokenize_sequence(text, language)
+
+        # Then
+        self.assertListEqual(["Hello", "Beautiful", "World"], tokens.values)
+        self.assertListEqual([0, 6, 16], list(tokens.starts))
+        self.assertListEqual([5, 15, 21], list(tokens.ends))
+        self.assertEqual(tokenize(text, language), tokens)
+
+    def test_token_sequence_should_behave_like_list_of_tokens(self):
+        # Given
+        tokens = [
+            Token(value="Hello", start=0, end=5),
+            Token(value="World", start=6, end=11)
+        ]
+
+        # When
+        sequence = TokenSequence.from_tokens(tokens)
+
+        # Then
+        self.assertEqual(2, len(sequence))
+        self.assertEqual(tokens[1], sequence[1])
+        self.assertListEqual(tokens, list(sequence))
+        self.assertListEqual(tokens, sequence.to_tokens())
+        self.assertEqual(TokenSequence.from_tokens(tokens[:1]), sequence[:1])
+        self.assertEqual("hello", sequence.normalized_value(0))
+
+    def test_should_dump_and_load_memo_tables(self):
+        # Given
+        language = LANGUAGE_EN
+        words = ["Hello", "Beautiful", "Worlds"]
+        clear_memo_tables()
+        warm_memo_tables(words + ["Other"], language)
+        memo_tables = get_memo_tables(words, language)
+
+        # When
+        clear_memo_tables()
+        load_memo_tables(memo_tables, language)
+
+        # Then
+        self.assertEqual("hello",
+                         memo_tables["normalized_values"]["Hello"])
+        self.assertSetEqual(set(words),
+                            set(memo_tables["normalized_values"]))
+        self.assertSetEqual({"hello", "beautiful", "worlds"},
+                            set(memo_tables["stemmed_values"]))
+        self.assertDictEqual(memo_tables, get_memo_tables(words, language))
+
+    @patch("snips_nlu.preprocessing.MEMO_TABLE_SIZE", 2)
+    def test_should_cap_dumped_memo_tables(self):
+        # Given
+        language = LANGUAGE_EN
+        words = ["hello", "beautiful", "world"]
+
+        # When
+        memo_tables = get_memo_tables(words, language)
+
+        # Then
+        self.assertSetEqual({"hello", "beautiful"},
+                            set(memo_tables["normalized_values"]))
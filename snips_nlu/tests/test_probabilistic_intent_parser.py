@@ -1,10 +1,12 @@
 from __future__ import unicode_literals
 
+from copy import deepcopy
 from pathlib import Path
 
-from mock import patch
+from mock import MagicMock, patch
 
-from snips_nlu.constants import RES_INTENT, RES_INTENT_NAME
+from snips_nlu.constants import (
+    DATA, INTENTS, RES_INTENT, RES_INTENT_NAME, TEXT, UTTERANCES)
 from snips_nlu.dataset import validate_and_format_dataset
 from snips_nlu.intent_classifier import (
     IntentClassifier, LogRegIntentClassifier)
@@ -77,6 +79,36 @@ class TestProbabilisticIntentParser(FixtureTest):
             parser.fit(BEVERAGE_DATASET, force_retrain=False)
             self.assertEqual(1, mock_fit.call_count)
 
+    def test_should_only_retrain_units_affected_by_dataset_changes(self):
+        # Given
+        register_processing_unit(TestIntentClassifier)
+        register_processing_unit(TestSlotFiller)
+
+        parser_config = ProbabilisticIntentParserConfig(
+            intent_classifier_config=TestIntentClassifierConfig(),
+            slot_filler_config=TestSlotFillerConfig()
+        )
+        parser = ProbabilisticIntentParser(parser_config)
+        parser.fit(BEVERAGE_DATASET)
+        updated_dataset = deepcopy(BEVERAGE_DATASET)
+        updated_dataset[INTENTS]["MakeTea"][UTTERANCES].append(
+            {DATA: [{TEXT: "prepare me some tea please"}]})
+
+        # When
+        classifier_fit = MagicMock()
+        slot_filler_fit = MagicMock()
+        with patch.object(TestIntentClassifier, "fit", classifier_fit), \
+             patch.object(TestSlotFiller, "fit", slot_filler_fit):
+            parser.fit(BEVERAGE_DATASET, force_retrain=False)
+            classifier_fit.assert_not_called()
+            slot_filler_fit.assert_not_called()
+            parser.fit(updated_dataset, force_retrain=False)
+
+        # Then
+        classifier_fit.assert_called_once()
+        slot_filler_fit.assert_called_once()
+        self.assertEqual("MakeTea", slot_filler_fit.call_args[0][1])
+
     def test_should_not_parse_when_not_fitted(self):
         # Given
         parser = ProbabilisticIntentParser()
@@ -101,6 +133,7 @@ class TestProbabilisticIntentParser(FixtureTest):
                 "intent_classifier_config":
                     LogRegIntentClassifierConfig().to_dict()
             },
+            "intent_classifier_fingerprint": None,
             "slot_fillers": []
         }
         metadata = {"unit_name": "probabilistic_intent_parser"}
@@ -152,16 +185,21 @@ class TestProbabilisticIntentParser(FixtureTest):
             "slot_filler_config": {"unit_name": "test_slot_filler"},
             "intent_classifier_config": {"unit_name": "test_intent_classifier"}
         }
+        fingerprints = parser.slot_fillers_fingerprints
         expected_parser_dict = {
             "config": expected_parser_config,
+            "intent_classifier_fingerprint":
+                parser.intent_classifier_fingerprint,
             "slot_fillers": [
                 {
                     "intent": "MakeCoffee",
-                    "slot_filler_name": "slot_filler_0"
+                    "slot_filler_name": "slot_filler_0",
+                    "fingerprint": fingerprints["MakeCoffee"]
                 },
                 {
                     "intent": "MakeTea",
-                    "slot_filler_name": "slot_filler_1"
+                    "slot_filler_name": "slot_filler_1",
+                    "fingerprint": fingerprints["MakeTea"]
                 }
             ]
         }
@@ -0,0 +1,136 @@
+from __future__ import unicode_literals
+
+import json
+import threading
+from builtins import range
+
+from future.moves.queue import Full
+from future.moves.urllib.error import HTTPError
+from future.moves.urllib.request import Request, urlopen
+from mock import MagicMock
+
+from snips_nlu import SnipsNLUEngine
+from snips_nlu.cli.serve import ParsingBatcher, ParsingServer
+from snips_nlu.instrumentation import PARSING, set_recorder
+from snips_nlu.tests.utils import BEVERAGE_DATASET, SnipsTest
+
+
+class TestServe(SnipsTest):
+    def setUp(self):
+        super(TestServe, self).setUp()
+        self.engine = SnipsNLUEngine().fit(BEVERAGE_DATASET)
+        self.server = ParsingServer(("127.0.0.1", 0), self.engine)
+        self.server_thread = threading.Thread(target=self.server.serve_forever)
+        self.server_thread.daemon = True
+        self.server_thread.start()
+        self.url = "http://127.0.0.1:%s" % self.server.server_address[1]
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        set_recorder(None)
+        super(TestServe, self).tearDown()
+
+    def post(self, path, content):
+        request = Request(self.url + path,
+                          data=json.dumps(content).encode("utf8"),
+                          headers={"Content-Type": "application/json"})
+        return json.loads(urlopen(request).read().decode("utf8"))
+
+    def test_should_parse(self):
+        # Given
+        texts = ["make me two cups of tea", "I want a hot coffee"]
+
+        # When
+        results = [None] * len(texts)
+
+        def parse(i):
+            results[i] = self.post("/parse", {"text": texts[i]})
+
+        threads = [threading.Thread(target=parse, args=(i,))
+                   for i in range(len(texts))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        batch_results = self.post("/parse_batch", {"texts": texts})
+
+        # Then
+        expected_results = [self.engine.parse(text) for text in texts]
+        self.assertListEqual(expected_results, results)
+        self.assertListEqual(expected_results, batch_results)
+
+    def test_should_reject_invalid_requests(self):
+        # When / Then
+        with self.assertRaises(HTTPError) as cm:
+            self.post("/parse", {"texts": ["make me a tea"]})
+        self.assertEqual(400, cm.exception.code)
+        for intents in (42, ["MakeTea", 42], {"MakeTea": True}):
+            with self.assertRaises(HTTPError) as cm:
+                self.post("/parse",
+                          {"text": "make me a tea", "intents": intents})
+            self.assertEqual(400, cm.exception.code)
+
+    def test_should_time_out_when_batch_is_not_parsed(self):
+        # Given
+        parsing_unblocked = threading.Event()
+        self.server.batcher.request_timeout = 0.1
+        self.engine.parse_batch = MagicMock(
+            side_effect=lambda texts, intents: parsing_unblocked.wait()
+            and [None] * len(texts))
+
+        # When
+        try:
+            with self.assertRaises(HTTPError) as cm:
+                self.post("/parse", {"text": "make me a tea"})
+        finally:
+            parsing_unblocked.set()
+
+        # Then
+        self.assertEqual(504, cm.exception.code)
+        self.assertEqual(1, self.server.counters["timeouts"])
+
+    def test_should_expose_metrics(self):
+        # Given
+        self.post("/parse", {"text": "make me two cups of tea"})
+
+        # When
+        metrics = json.loads(
+            urlopen(self.url + "/metrics").read().decode("utf8"))
+
+        # Then
+        self.assertEqual(1, metrics["requests"]["parse"])
+        self.assertEqual(1, metrics["stages"][PARSING]["count"])
+        self.assertIn("builtin_entity_parser", metrics["caches"])
+        self.assertIn("custom_entity_parser", metrics["caches"])
+
+
+class TestParsingBatcher(SnipsTest):
+    def test_should_shed_requests_when_queue_is_full(self):
+        # Given
+        batcher = ParsingBatcher(MagicMock(), max_queue_size=1)
+        batcher.submit(["foo"])
+
+        # When / Then
+        with self.assertRaises(Full):
+            batcher.submit(["bar"])
+
+    def test_should_parse_requests_in_batches(self):
+        # Given
+        engine = MagicMock()
+        engine.parse_batch.side_effect = lambda texts, intents: [
+            {"input": text} for text in texts]
+        batcher = ParsingBatcher(engine, batch_window=0.05)
+        requests = [batcher.submit(["foo"]), batcher.submit(["bar", "foo"])]
+
+        # When
+        batcher.start()
+        for request in requests:
+            request.wait()
+
+        # Then
+        engine.parse_batch.assert_called_once_with(["foo", "bar", "foo"],
+                                                   None)
+        self.assertListEqual([{"input": "foo"}], requests[0].results)
+        self.assertListEqual([{"input": "bar"}, {"input": "foo"}],
+                             requests[1].results)
@@ -1,13 +1,17 @@
 # coding=utf-8
 from __future__ import unicode_literals
 
+from mock import patch
+
 from snips_nlu.constants import (LANGUAGE_EN, LANGUAGE_FR, RES_MATCH_RANGE,
                                  SNIPS_NUMBER, START)
 from snips_nlu.entity_parser import BuiltinEntityParser
 from snips_nlu.string_variations import (
-    alphabetic_value, and_variations, get_string_variations,
-    numbers_variations, punctuation_variations)
+    _get_string_variations, alphabetic_value, and_variations,
+    get_string_variations, numbers_variations, punctuation_variations,
+    warm_string_variations)
 from snips_nlu.tests.utils import SnipsTest
+from snips_nlu.utils import LimitedSizeDict
 
 
 class TestStringVariations(SnipsTest):
@@ -164,3 +168,43 @@ class TestStringVariations(SnipsTest):
             "7.62 mm caliber two and 6",
         }
         self.assertSetEqual(variations, expected_variations)
+
+    @patch("snips_nlu.string_variations.PARALLEL_VARIATIONS_THRESHOLD", 0)
+    def test_should_compute_variations_in_parallel(self):
+        # Given
+        language = LANGUAGE_EN
+        parser = BuiltinEntityParser.build(language=language)
+        strings = ["a and b 2", "Küche", "france 24"]
+        expected_variations = {
+            string: _get_string_variations(string, language, parser)
+            for string in strings
+        }
+        cache = LimitedSizeDict(size_limit=10)
+
+        # When
+        with patch("snips_nlu.string_variations._VARIATIONS_CACHE", cache):
+            variations = warm_string_variations(
+                strings, language, parser, n_jobs=2)
+
+        # Then
+        self.assertEqual(3, len(cache))
+        self.assertDictEqual(expected_variations, variations)
+
+    def test_should_return_all_warmed_variations_when_cache_is_full(self):
+        # Given
+        language = LANGUAGE_EN
+        parser = BuiltinEntityParser.build(language=language)
+        strings = ["a and b 2", "Küche", "france 24"]
+        expected_variations = {
+            string: _get_string_variations(string, language, parser)
+            for string in strings
+        }
+        cache = LimitedSizeDict(size_limit=1)
+
+        # When
+        with patch("snips_nlu.string_variations._VARIATIONS_CACHE", cache):
+            variations = warm_string_variations(strings, language, parser)
+
+        # Then
+        self.assertEqual(1, len(cache))
+        self.assertDictEqual(expected_variations, variations)
@@ -0,0 +1,101 @@
+from __future__ import unicode_literals
+
+from mock import MagicMock, patch
+
+from snips_nlu.tests.utils import FixtureTest
+from snips_nlu.training_cache import TrainingCache
+from snips_nlu.utils import check_random_state
+
+
+class TestTrainingCache(FixtureTest):
+    def test_should_reuse_cached_artifact(self):
+        # Given
+        cache = TrainingCache(self.tmp_file_path)
+        random_state = check_random_state(42)
+
+        def compute():
+            return random_state.randint(1000, size=5).tolist()
+
+        mocked_compute = MagicMock(side_effect=compute)
+        expected_value = cache.get_or_compute(
+            "test_artifact", {"foo": "bar"}, mocked_compute, random_seed=42,
+            random_state=random_state)
+        expected_next_value = random_state.randint(1000)
+
+        # When
+        random_state = check_random_state(42)
+        value = cache.get_or_compute(
+            "test_artifact", {"foo": "bar"}, mocked_compute, random_seed=42,
+            random_state=random_state)
+        next_value = random_state.randint(1000)
+
+        # Then
+        mocked_compute.assert_called_once()
+        self.assertListEqual(expected_value, value)
+        self.assertEqual(expected_next_value, next_value)
+
+    def test_should_not_reuse_artifact_when_content_changes(self):
+        # Given
+        cache = TrainingCache(self.tmp_file_path)
+        mocked_compute = MagicMock(return_value="artifact")
+        cache.get_or_compute("test_artifact", {"foo": "bar"}, mocked_compute)
+
+        # When
+        cache.get_or_compute("test_artifact", {"foo": "baz"}, mocked_compute)
+        cache.get_or_compute("test_artifact", {"foo": "bar"}, mocked_compute,
+                             random_seed=42,
+                             random_state=check_random_state(42))
+        cache.get_or_compute("test_artifact", {"foo": "bar"}, mocked_compute,
+                             random_seed=42, step=1,
+                             random_state=check_random_state(42))
+
+        # Then
+        self.assertEqual(4, mocked_compute.call_count)
+
+    def test_should_not_cache_artifact_when_random_seed_is_not_set(self):
+        # Given
+        cache = TrainingCache(self.tmp_file_path)
+        mocked_compute = MagicMock(return_value="artifact")
+
+        # When
+        for _ in range(2):
+            cache.get_or_compute("test_artifact", {"foo": "bar"},
+                                 mocked_compute,
+                                 random_state=check_random_state(None))
+
+        # Then
+        self.assertEqual(2, mocked_compute.call_count)
+        self.assertFalse(self.tmp_file_path.exists())
+
+    @patch("snips_nlu.training_cache.get_resources_fingerprint")
+    def test_should_not_reuse_artifact_when_resources_change(
+            self, mocked_get_resources_fingerprint):
+        # Given
+        cache = TrainingCache(self.tmp_file_path)
+        mocked_compute = MagicMock(return_value="artifact")
+        mocked_get_resources_fingerprint.return_value = "resources_v1"
+        cache.get_or_compute("test_artifact", {"foo": "bar"}, mocked_compute,
+                             language="en")
+
+        # When
+        mocked_get_resources_fingerprint.return_value = "resources_v2"
+        cache.get_or_compute("test_artifact", {"foo": "bar"}, mocked_compute,
+                             language="en")
+
+        # Then
+        self.assertEqual(2, mocked_compute.call_count)
+
+    def test_should_serialize_and_deserialize_artifacts(self):
+        # Given
+        cache = TrainingCache(self.tmp_file_path)
+        cache.get_or_compute(
+            "test_artifact", "content", lambda: {"a", "b"},
+            serialize=sorted)
+
+        # When
+        value = cache.get_or_compute(
+            "test_artifact", "content", lambda: set(),
+            serialize=sorted, deserialize=set)
+
+        # Then
+        self.assertSetEqual({"a", "b"}, value)
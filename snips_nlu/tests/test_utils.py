@@ -4,11 +4,12 @@ import logging
 
 from future.builtins import object, str
 from future.utils import iteritems
-from mock import MagicMock
+from mock import MagicMock, patch
 
 from snips_nlu.tests.utils import SnipsTest
 from snips_nlu.utils import (
-    DifferedLoggingMessage, LimitedSizeDict, ranges_overlap)
+    DifferedLoggingMessage, LimitedSizeDict, log_elapsed_time, log_result,
+    ranges_overlap)
 
 
 class TestLimitedSizeDict(SnipsTest):
@@ -106,3 +107,39 @@ class TestUtils(SnipsTest):
                 logger.log(l, "Level: %s -> %s", str(l),
                            DifferedLoggingMessage(mocked_fn, a_, b_, c=c_))
         self.assertEqual(2, mocked_fn.call_count)
+
+    @patch("snips_nlu.utils.json_debug_string")
+    def test_should_not_format_logs_when_level_is_disabled(
+            self, mocked_json_debug_string):
+        # Given
+        logger = logging.Logger("my_dummy_logger", logging.INFO)
+        logger.log = MagicMock()
+
+        @log_result(logger, logging.DEBUG)
+        @log_elapsed_time(logger, logging.DEBUG)
+        def fn():
+            return {"foo": "bar"}
+
+        # When
+        result = fn()
+
+        # Then
+        self.assertDictEqual({"foo": "bar"}, result)
+        mocked_json_debug_string.assert_not_called()
+        logger.log.assert_not_called()
+
+    def test_should_log_result_when_level_is_enabled(self):
+        # Given
+        logger = logging.Logger("my_dummy_logger", logging.DEBUG)
+        logger.log = MagicMock()
+
+        @log_result(logger, logging.DEBUG, "Result: {result}")
+        def fn():
+            return {"foo": "bar"}
+
+        # When
+        fn()
+
+        # Then
+        expected_msg = "Result: {\n  \"foo\": \"bar\"\n}"
+        logger.log.assert_called_once_with(logging.DEBUG, expected_msg)
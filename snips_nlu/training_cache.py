@@ -0,0 +1,156 @@
+from __future__ import unicode_literals
+
+import logging
+import os
+import pickle
+import tempfile
+from builtins import object
+from pathlib import Path
+
+from snips_nlu.__about__ import __version__
+from snips_nlu.dataset import get_content_hash
+from snips_nlu.resources import MissingResource, get_resources_fingerprint
+from snips_nlu.utils import mkdir_p
+
+logger = logging.getLogger(__name__)
+
+_TRAINING_CACHE = None
+
+
+class TrainingCache(object):
+    """Content-addressed on-disk cache of intermediate training artifacts
+
+    Artifacts are stored in *directory*, under a key which is a hash of the
+    namespace of the artifact, of the provided json-serializable content
+    (typically a slice of the dataset and a unit config), of the random seed
+    and index of the training step, of the fingerprint of the language
+    resources and of the library version.
+
+    Steps drawing from a random generator are only cached when it is seeded,
+    as their artifacts would not be reproducible otherwise. The state of the
+    seeded generator after the computation is stored along with the artifact
+    and restored on cache hits, so that the subsequent training steps are the
+    same as without cache.
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+
+    def get_key(self, namespace, content, language=None, random_seed=None,
+                step=0):
+        resources_fingerprint = None
+        if language is not None:
+            try:
+                resources_fingerprint = get_resources_fingerprint(language)
+            except MissingResource:
+                pass
+        return get_content_hash({
+            "namespace": namespace,
+            "content": content,
+            "random_seed": random_seed,
+            "step": step,
+            "resources": resources_fingerprint,
+            "version": __version__
+        })
+
+    def get_or_compute(self, namespace, content, compute, language=None,
+                       random_seed=None, step=0, random_state=None,
+                       serialize=None, deserialize=None):
+        """Returns the cached artifact when it exists, otherwise computes it
+        with the *compute* function and caches it
+
+        Args:
+            namespace (str): Name of the artifact type
+            content: Json-serializable object from which the artifact is
+                computed
+            compute (function): Function computing the artifact
+            language (str, optional): Language of the resources used by the
+                computation
+            random_seed (int, optional): Seed of the random generator used by
+                the computation
+            step (int, optional): Index of the computation among the training
+                steps drawing from the same random generator
+            random_state (:class:`numpy.random.RandomState`, optional): Random
+                generator used by the computation, which must be seeded with
+                *random_seed*. The computation is not cached when it is
+                provided without a seed.
+            serialize (function, optional): Function converting the artifact
+                to a picklable object
+            deserialize (function, optional): Inverse function of *serialize*
+        """
+        if random_state is not None and random_seed is None:
+            logger.debug("Not caching %s as no random seed is set", namespace)
+            return compute()
+
+        key = self.get_key(namespace, content, language, random_seed, step)
+        artifact_path = self.directory / namespace / ("%s.pkl" % key)
+        if artifact_path.exists():
+            try:
+                with artifact_path.open(mode="rb") as f:
+                    value, state = pickle.load(f)
+            except (OSError, IOError, EOFError, pickle.UnpicklingError):
+                logger.warning("Ignoring corrupted training cache entry: %s",
+                               artifact_path)
+            else:
+                logger.debug("Loaded %s from training cache", namespace)
+                if random_state is not None and state is not None:
+                    random_state.set_state(state)
+                if deserialize is not None:
+                    value = deserialize(value)
+                return value
+
+        artifact = compute()
+        value = serialize(artifact) if serialize is not None else artifact
+        state = random_state.get_state() if random_state is not None else None
+        self._write(artifact_path, (value, state))
+        return artifact
+
+    @staticmethod
+    def _write(artifact_path, obj):
+        mkdir_p(artifact_path.parent)
+        # Write in a temporary file first so that concurrent trainings never
+        # read partially written artifacts
+        fd, tmp_path = tempfile.mkstemp(dir=str(artifact_path.parent),
+                                        suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+            if artifact_path.exists():
+                os.remove(tmp_path)
+            else:
+                os.rename(tmp_path, str(artifact_path))
+        except (OSError, IOError):
+            logger.warning("Could not write training cache entry: %s",
+                           artifact_path)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+def enable_training_cache(directory):
+    """Caches the intermediate training artifacts in *directory*"""
+    global _TRAINING_CACHE  # pylint:disable=global-statement
+    _TRAINING_CACHE = TrainingCache(directory)
+
+
+def disable_training_cache():
+    global _TRAINING_CACHE  # pylint:disable=global-statement
+    _TRAINING_CACHE = None
+
+
+def get_training_cache():
+    return _TRAINING_CACHE
+
+
+def cached_training_step(namespace, content, compute, language=None,
+                         random_seed=None, step=0, random_state=None,
+                         serialize=None, deserialize=None):
+    """Runs a training step through the training cache, when it is enabled
+
+    See :meth:`TrainingCache.get_or_compute` for a description of the
+    arguments.
+    """
+    if _TRAINING_CACHE is None:
+        return compute()
+    return _TRAINING_CACHE.get_or_compute(
+        namespace, content, compute, language, random_seed, step,
+        random_state, serialize, deserialize)
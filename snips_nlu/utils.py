@@ -16,7 +16,6 @@ from tempfile import mkdtemp
 from zipfile import ZIP_DEFLATED, ZipFile
 
 import numpy as np
-import pkg_resources
 
 from snips_nlu.constants import (DATA, END, ENTITY, INTENTS, SLOT_NAME, START,
                                  UTTERANCES)
@@ -273,6 +272,10 @@ def log_elapsed_time(logger, level, output_msg=None):
     def get_wrapper(fn):
         @wraps(fn)
         def wrapped(*args, **kwargs):
+            # The level is checked at each call as it can be changed after
+            # the decoration
+            if not logger.isEnabledFor(level):
+                return fn(*args, **kwargs)
             start = datetime.now()
             msg_fmt = dict()
             res = fn(*args, **kwargs)
@@ -293,6 +296,8 @@ def log_result(logger, level, output_msg=None):
     def get_wrapper(fn):
         @wraps(fn)
         def wrapped(*args, **kwargs):
+            if not logger.isEnabledFor(level):
+                return fn(*args, **kwargs)
             msg_fmt = dict()
             res = fn(*args, **kwargs)
             if "result" in output_msg:
@@ -339,6 +344,8 @@ def is_package(name):
         bool: True if an installed packaged corresponds to this name, False
             otherwise.
     """
+    import pkg_resources
+
     name = name.lower().replace("-", "_")
     packages = pkg_resources.working_set.by_key.keys()
     for package in packages: